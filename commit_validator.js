@@ -0,0 +1,256 @@
+/*
+ * Commit validator untuk browser dan Node.js
+ *
+ * Logika sama persis dengan commit_validator.py (hasil validasi dan
+ * ekstraksi memakai field yang sama dengan dataclasses.asdict). Semua pattern,
+ * tipe yang diperbolehkan, dan index typo dibaca dari rule spec
+ * (commit_validator_rules.json) yang dibangkitkan dari rule set Python oleh
+ * commit_validator_rules.py. Pattern di-compile sekali per spec lalu di-cache
+ * berdasarkan hash spec.
+ *
+ * Contoh:
+ *     const engine = CommitValidator.load(spec);
+ *     engine.validateTitle('feat: menambahkan login (Taiga #DATB-1)');
+ */
+(function (root, factory) {
+    const api = factory();
+    if (typeof module === 'object' && module.exports) {
+        module.exports = api;
+    } else {
+        root.CommitValidator = api;
+    }
+}(typeof self !== 'undefined' ? self : this, function () {
+    'use strict';
+
+    const FORMAT_HINT = 'Format yang benar: <tipe>: <ringkasan singkat> (Taiga #<NamaProject>-<NomorTicket>)';
+
+    const engines = new Map();
+
+    function compile(spec) {
+        const ALLOWED_TYPES = spec.allowed_types;
+        const TYPO_MAP = spec.typo_map;
+
+        // Pattern untuk search/match dan untuk re.sub (flag 'g' = ganti semua)
+        const patterns = {};
+        const substitutions = {};
+        for (const [name, pattern] of Object.entries(spec.patterns)) {
+            patterns[name] = new RegExp(pattern.js, 'u');
+            substitutions[name] = new RegExp(pattern.js, 'gu');
+        }
+        const stripPattern = new RegExp(`^${spec.whitespace}+|${spec.whitespace}+$`, 'gu');
+
+        // str.strip() Python
+        function strip(text) {
+            return text.replace(stripPattern, '');
+        }
+
+        // len() Python menghitung code point, bukan UTF-16 code unit
+        function length(text) {
+            return Array.from(text).length;
+        }
+
+        function isUpper(text) {
+            return text === text.toUpperCase() && text !== text.toLowerCase();
+        }
+
+        function result(isValid, errors, suggestions, parsedData = null) {
+            return { is_valid: isValid, errors, suggestions, parsed_data: parsedData };
+        }
+
+        function validateTitle(title) {
+            if (!title || !strip(title)) {
+                return result(false, ['Title tidak boleh kosong'], [FORMAT_HINT]);
+            }
+
+            title = strip(title);
+
+            const match = patterns.title.exec(title);
+            if (!match) {
+                return result(false, analyzeFormatErrors(title), generateSuggestions(title));
+            }
+
+            const [, type, summary, project, ticketNumber] = match;
+            const errors = [];
+            const suggestions = [];
+
+            if (!ALLOWED_TYPES.includes(type)) {
+                errors.push(`Tipe '${type}' tidak valid`);
+                const closest = findClosestType(type);
+                if (closest) {
+                    suggestions.push(`Mungkin maksud Anda: '${closest}'?`);
+                }
+                suggestions.push(`Tipe yang diperbolehkan: ${ALLOWED_TYPES.join(', ')}`);
+            }
+
+            if (length(strip(summary)) < 5) {
+                errors.push('Ringkasan terlalu pendek (minimal 5 karakter)');
+                suggestions.push('Berikan deskripsi yang lebih jelas tentang perubahan yang dilakukan');
+            }
+
+            if (!isUpper(project)) {
+                errors.push(`Nama project harus huruf besar (uppercase): '${project}' tidak valid`);
+                suggestions.push(`Gunakan: (Taiga #${project.toUpperCase()}-${ticketNumber})`);
+            }
+
+            if (errors.length > 0) {
+                return result(false, errors, suggestions);
+            }
+
+            return result(true, [], [], {
+                type,
+                summary: strip(summary),
+                project,
+                ticket_number: ticketNumber,
+            });
+        }
+
+        function analyzeFormatErrors(title) {
+            const errors = [];
+
+            const colon = title.indexOf(':');
+            if (colon < 0) {
+                errors.push("Format salah: Tidak ditemukan tanda ':' setelah tipe");
+                errors.push(FORMAT_HINT);
+                return errors;
+            }
+
+            const head = strip(title.slice(0, colon));
+            const rest = title.slice(colon + 1);
+            const potentialType = head.toLowerCase();
+
+            if (!potentialType) {
+                errors.push("Tipe commit tidak ditemukan sebelum tanda ':'");
+            } else if (!ALLOWED_TYPES.includes(potentialType)) {
+                errors.push(`Tipe '${potentialType}' tidak valid`);
+                errors.push(`Tipe yang diperbolehkan: ${ALLOWED_TYPES.join(', ')}`);
+            } else if (potentialType !== head) {
+                errors.push('Tipe harus menggunakan huruf kecil');
+            }
+
+            if (!title.includes('Taiga') && !title.toLowerCase().includes('taiga')) {
+                errors.push('Referensi Taiga tidak ditemukan');
+                errors.push('Tambahkan: (Taiga #<NamaProject>-<NomorTicket>)');
+            } else if (!patterns.taiga_reference.test(title)) {
+                if (!title.includes('(') || !title.includes(')')) {
+                    errors.push('Format referensi Taiga salah: kurung buka/tutup tidak lengkap');
+                } else if (!title.includes('#')) {
+                    errors.push("Format referensi Taiga salah: simbol '#' tidak ditemukan");
+                } else if (!patterns.ticket.test(title)) {
+                    errors.push('Format referensi Taiga salah: format harus #<NamaProject>-<NomorTicket>');
+                    errors.push('Contoh: (Taiga #DATB-10353)');
+                } else {
+                    errors.push('Format referensi Taiga tidak sesuai standar');
+                }
+            }
+
+            if (rest && rest[0] !== ' ') {
+                errors.push("Harus ada spasi setelah tanda ':'");
+            }
+
+            return errors;
+        }
+
+        function generateSuggestions(title) {
+            const suggestions = [];
+
+            const typeMatch = patterns.type_prefix.exec(title.toLowerCase());
+            const taigaMatch = patterns.loose_ticket.exec(title);
+
+            if (typeMatch && taigaMatch) {
+                let type = typeMatch[1];
+                if (!ALLOWED_TYPES.includes(type)) {
+                    type = findClosestType(type) || 'feat';
+                }
+
+                const [, project, ticket] = taigaMatch;
+
+                let summary = title.replace(substitutions.leading_type, '');
+                summary = strip(summary.replace(substitutions.trailing_parens, ''));
+                summary = strip(summary.replace(substitutions.loose_ticket, ''));
+
+                if (!summary) {
+                    summary = 'tambahkan deskripsi perubahan';
+                }
+
+                suggestions.push(`Saran perbaikan: ${type}: ${summary} (Taiga #${project}-${ticket})`);
+            } else {
+                suggestions.push('Contoh format yang benar:');
+                suggestions.push('feat: menambahkan fitur login user (Taiga #DATB-10353)');
+                suggestions.push('fix: memperbaiki bug pada dashboard (Taiga #PROJ-123)');
+            }
+
+            return suggestions;
+        }
+
+        function findClosestType(type) {
+            type = type.toLowerCase();
+
+            if (ALLOWED_TYPES.includes(type)) {
+                return type;
+            }
+
+            for (const allowed of ALLOWED_TYPES) {
+                if (allowed.startsWith(type) || type.startsWith(allowed)) {
+                    return allowed;
+                }
+            }
+
+            return Object.prototype.hasOwnProperty.call(TYPO_MAP, type) ? TYPO_MAP[type] : null;
+        }
+
+        function extractReferences(description) {
+            if (!description) {
+                return { ticket_link: null, documentation_link: null, testing_link: null };
+            }
+
+            return {
+                ticket_link: extractTicketLink(description),
+                documentation_link: extractDocumentationLink(description),
+                testing_link: extractTestingLink(description),
+            };
+        }
+
+        function extractTicketLink(text) {
+            const match = patterns.ticket_link.exec(text);
+            if (!match) {
+                return null;
+            }
+            return {
+                project: match[1],
+                ticket_number: match[2],
+                url: match[3],
+                display: `Taiga #${match[1]}-${match[2]}`,
+            };
+        }
+
+        function extractDocumentationLink(text) {
+            const match = patterns.documentation_link.exec(text);
+            if (!match) {
+                return null;
+            }
+            return { name: match[1], url: match[2] };
+        }
+
+        function extractTestingLink(text) {
+            const match = patterns.testing_link.exec(text);
+            if (!match) {
+                return null;
+            }
+            return { name: match[1], url: match[2] ? match[2] : match[1] };
+        }
+
+        return { spec, validateTitle, extractReferences, findClosestType };
+    }
+
+    // Compile spec sekali, pemanggilan berikutnya memakai engine dari cache
+    function load(spec) {
+        let engine = engines.get(spec.hash);
+        if (!engine) {
+            engine = compile(spec);
+            engines.set(spec.hash, engine);
+        }
+        return engine;
+    }
+
+    return { load };
+}));
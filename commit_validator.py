@@ -1,5 +1,5 @@
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -12,6 +12,67 @@ class ValidationResult:
     parsed_data: Optional[Dict[str, str]] = None
 
 
+class _FrozenDict(dict):
+    """dict read-only untuk parsed_data pada FrozenValidationResult"""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("parsed_data pada FrozenValidationResult tidak bisa diubah")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __hash__(self):
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self):
+        return (_FrozenDict, (dict(self),))
+
+
+@dataclass(frozen=True)
+class FrozenValidationResult:
+    """Hasil validasi title yang immutable, aman dipakai bersama oleh banyak title"""
+    is_valid: bool
+    errors: Tuple[str, ...]
+    suggestions: Tuple[str, ...]
+    parsed_data: Optional[Mapping[str, str]] = None
+
+    @classmethod
+    def from_result(cls, result: ValidationResult) -> 'FrozenValidationResult':
+        """Bekukan ValidationResult"""
+        parsed_data = _FrozenDict(result.parsed_data) if result.parsed_data is not None else None
+        return cls(result.is_valid, tuple(result.errors), tuple(result.suggestions), parsed_data)
+
+    def to_result(self) -> ValidationResult:
+        """Salinan ValidationResult yang boleh diubah"""
+        parsed_data = dict(self.parsed_data) if self.parsed_data is not None else None
+        return ValidationResult(self.is_valid, list(self.errors), list(self.suggestions), parsed_data)
+
+
+@dataclass
+class BatchValidationResult:
+    """Hasil validasi batch dengan deduplikasi title"""
+    results: List[FrozenValidationResult]
+    total: int
+    unique: int
+    
+    @property
+    def duplicates(self) -> int:
+        """Jumlah title yang merupakan pengulangan"""
+        return self.total - self.unique
+    
+    @property
+    def duplication_ratio(self) -> float:
+        """Proporsi title duplikat (0.0 - 1.0)"""
+        return self.duplicates / self.total if self.total else 0.0
+
+
+# Nama field ReferenceData, sesuai urutan link di body commit
+REFERENCE_FIELDS = ('ticket_link', 'documentation_link', 'testing_link')
+
+# Semua pattern referensi mengandung "Link:", teks tanpa kata ini bisa dilewati
+LINK_HINT_RE = re.compile(r'Link:', re.IGNORECASE)
+
+
 @dataclass
 class ReferenceData:
     """Data referensi yang diekstrak"""
@@ -21,7 +82,13 @@ class ReferenceData:
 
 
 class CommitTitleValidator:
-    """Validator untuk commit title sesuai standar perusahaan"""
+    """
+    Validator untuk commit title sesuai standar perusahaan
+
+    Thread-safe: instance tidak menyimpan state yang berubah, pattern sudah
+    di-compile di level class dan hanya dibaca, sehingga satu instance bisa
+    dipakai bersama oleh banyak thread tanpa lock (lihat get_shared_validator).
+    """
     
     ALLOWED_TYPES = [
         'feat', 'fix', 'refactor', 'docs', 'style', 
@@ -31,6 +98,26 @@ class CommitTitleValidator:
     # Pattern: <tipe>: <ringkasan singkat> (Taiga #<NamaProject>-<Nomor Ticket>)
     TITLE_PATTERN = r'^([a-z]+):\s+(.+?)\s+\(Taiga\s+#([A-Z]+)-(\d+)\)$'
     
+    # Typo umum untuk tipe commit
+    TYPO_MAP = {
+        'feature': 'feat',
+        'bugfix': 'fix',
+        'bug': 'fix',
+        'document': 'docs',
+        'testing': 'test',
+        'tests': 'test',
+        'performance': 'perf',
+    }
+    
+    # Pattern yang sudah di-compile (read-only, aman dipakai bersama antar thread)
+    _TITLE_RE = re.compile(TITLE_PATTERN)
+    _TAIGA_REFERENCE_RE = re.compile(r'\(Taiga\s+#[A-Z]+-\d+\)')
+    _TICKET_RE = re.compile(r'#[A-Z]+-\d+')
+    _TYPE_PREFIX_RE = re.compile(r'^([a-z]+)')
+    _LOOSE_TICKET_RE = re.compile(r'#?([A-Z]+)-?(\d+)')
+    _LEADING_TYPE_RE = re.compile(r'^[a-z]+:?\s*', re.IGNORECASE)
+    _TRAILING_PARENS_RE = re.compile(r'\(.*?\)$')
+    
     def validate_title(self, title: str) -> ValidationResult:
         """
         Validasi commit/merge request title
@@ -53,15 +140,15 @@ class CommitTitleValidator:
         title = title.strip()
         
         # Cek format dasar dengan regex
-        match = re.match(self.TITLE_PATTERN, title)
+        groups = self._match_title(title)
         
-        if not match:
+        if groups is None:
             errors.extend(self._analyze_format_errors(title))
             suggestions.extend(self._generate_suggestions(title))
             return ValidationResult(False, errors, suggestions)
         
         # Ekstrak komponen
-        tipe, ringkasan, project_name, ticket_number = match.groups()
+        tipe, ringkasan, project_name, ticket_number = groups
         
         # Validasi tipe
         if tipe not in self.ALLOWED_TYPES:
@@ -95,6 +182,11 @@ class CommitTitleValidator:
         
         return ValidationResult(True, [], [], parsed_data)
     
+    def _match_title(self, title: str) -> Optional[Tuple[str, str, str, str]]:
+        """Cocokkan title dengan TITLE_PATTERN, return (tipe, ringkasan, project, nomor) atau None"""
+        match = self._TITLE_RE.match(title)
+        return match.groups() if match else None
+    
     def _analyze_format_errors(self, title: str) -> List[str]:
         """Analisa kesalahan format pada title"""
         errors = []
@@ -121,12 +213,12 @@ class CommitTitleValidator:
         if 'Taiga' not in title and 'taiga' not in title.lower():
             errors.append("Referensi Taiga tidak ditemukan")
             errors.append("Tambahkan: (Taiga #<NamaProject>-<NomorTicket>)")
-        elif not re.search(r'\(Taiga\s+#[A-Z]+-\d+\)', title):
+        elif not self._TAIGA_REFERENCE_RE.search(title):
             if '(' not in title or ')' not in title:
                 errors.append("Format referensi Taiga salah: kurung buka/tutup tidak lengkap")
             elif '#' not in title:
                 errors.append("Format referensi Taiga salah: simbol '#' tidak ditemukan")
-            elif not re.search(r'#[A-Z]+-\d+', title):
+            elif not self._TICKET_RE.search(title):
                 errors.append("Format referensi Taiga salah: format harus #<NamaProject>-<NomorTicket>")
                 errors.append("Contoh: (Taiga #DATB-10353)")
             else:
@@ -144,8 +236,8 @@ class CommitTitleValidator:
         
         # Coba perbaiki format
         # Ekstrak komponen yang mungkin ada
-        type_match = re.match(r'^([a-z]+)', title.lower())
-        taiga_match = re.search(r'#?([A-Z]+)-?(\d+)', title)
+        type_match = self._TYPE_PREFIX_RE.match(title.lower())
+        taiga_match = self._LOOSE_TICKET_RE.search(title)
         
         if type_match and taiga_match:
             tipe = type_match.group(1)
@@ -156,9 +248,9 @@ class CommitTitleValidator:
             ticket = taiga_match.group(2)
             
             # Ekstrak ringkasan (ambil bagian tengah)
-            summary = re.sub(r'^[a-z]+:?\s*', '', title, flags=re.IGNORECASE)
-            summary = re.sub(r'\(.*?\)$', '', summary).strip()
-            summary = re.sub(r'#?[A-Z]+-?\d+', '', summary).strip()
+            summary = self._LEADING_TYPE_RE.sub('', title)
+            summary = self._TRAILING_PARENS_RE.sub('', summary).strip()
+            summary = self._LOOSE_TICKET_RE.sub('', summary).strip()
             
             if not summary:
                 summary = "tambahkan deskripsi perubahan"
@@ -186,21 +278,27 @@ class CommitTitleValidator:
                 return allowed
         
         # Simple similarity (common typos)
-        typo_map = {
-            'feature': 'feat',
-            'bugfix': 'fix',
-            'bug': 'fix',
-            'document': 'docs',
-            'testing': 'test',
-            'tests': 'test',
-            'performance': 'perf',
-        }
-        
-        return typo_map.get(tipe)
+        return self.TYPO_MAP.get(tipe)
 
 
 class ReferenceExtractor:
-    """Ekstraksi data referensi dari deskripsi"""
+    """
+    Ekstraksi data referensi dari deskripsi
+
+    Thread-safe dengan alasan yang sama seperti CommitTitleValidator
+    (lihat get_shared_extractor).
+    """
+    
+    # Pattern: Ticket Link: [(Taiga #<Project>-<Number>)] (https://...)
+    TICKET_LINK_PATTERN = r'Ticket\s+Link:\s*\[\(Taiga\s+#([A-Z]+)-(\d+)\)\]\s*\((https?://[^\)]+)\)'
+    # Pattern: Documentation Link: [<name>] (https://...)
+    DOCUMENTATION_LINK_PATTERN = r'Documentation\s+Link:\s*\[([^\]]+)\]\s*\(([^\)]+)\)'
+    # Pattern: Testing Link: [<name>] (https://...) atau [...link]
+    TESTING_LINK_PATTERN = r'Testing\s+Link:\s*\[([^\]]+)\](?:\s*\(([^\)]+)\))?'
+    
+    _TICKET_LINK_RE = re.compile(TICKET_LINK_PATTERN, re.IGNORECASE)
+    _DOCUMENTATION_LINK_RE = re.compile(DOCUMENTATION_LINK_PATTERN, re.IGNORECASE)
+    _TESTING_LINK_RE = re.compile(TESTING_LINK_PATTERN, re.IGNORECASE)
     
     def extract_references(self, description: str) -> ReferenceData:
         """
@@ -227,56 +325,135 @@ class ReferenceExtractor:
     
     def _extract_ticket_link(self, text: str) -> Optional[Dict[str, str]]:
         """Ekstrak Ticket Link"""
-        # Pattern: Ticket Link: [(Taiga #<Project>-<Number>)] (https://...)
-        pattern = r'Ticket\s+Link:\s*\[\(Taiga\s+#([A-Z]+)-(\d+)\)\]\s*\((https?://[^\)]+)\)'
-        match = re.search(pattern, text, re.IGNORECASE)
-        
-        if match:
-            return {
-                'project': match.group(1),
-                'ticket_number': match.group(2),
-                'url': match.group(3),
-                'display': f"Taiga #{match.group(1)}-{match.group(2)}"
-            }
-        return None
+        match = self._TICKET_LINK_RE.search(text)
+        return self._ticket_link_data(match) if match else None
     
     def _extract_documentation_link(self, text: str) -> Optional[Dict[str, str]]:
         """Ekstrak Documentation Link"""
-        # Pattern: Documentation Link: [<name>] (https://...)
-        pattern = r'Documentation\s+Link:\s*\[([^\]]+)\]\s*\(([^\)]+)\)'
-        match = re.search(pattern, text, re.IGNORECASE)
-        
-        if match:
-            return {
-                'name': match.group(1),
-                'url': match.group(2)
-            }
-        return None
+        match = self._DOCUMENTATION_LINK_RE.search(text)
+        return self._documentation_link_data(match) if match else None
     
     def _extract_testing_link(self, text: str) -> Optional[Dict[str, str]]:
         """Ekstrak Testing Link"""
-        # Pattern: Testing Link: [<name>] (https://...) atau [...link]
-        pattern = r'Testing\s+Link:\s*\[([^\]]+)\](?:\s*\(([^\)]+)\))?'
-        match = re.search(pattern, text, re.IGNORECASE)
-        
-        if match:
-            name = match.group(1)
-            url = match.group(2) if match.group(2) else name
-            return {
-                'name': name,
-                'url': url
-            }
-        return None
+        match = self._TESTING_LINK_RE.search(text)
+        return self._testing_link_data(match) if match else None
+    
+    @staticmethod
+    def _ticket_link_data(match: 're.Match') -> Dict[str, str]:
+        return {
+            'project': match.group(1),
+            'ticket_number': match.group(2),
+            'url': match.group(3),
+            'display': f"Taiga #{match.group(1)}-{match.group(2)}"
+        }
+    
+    @staticmethod
+    def _documentation_link_data(match: 're.Match') -> Dict[str, str]:
+        return {
+            'name': match.group(1),
+            'url': match.group(2)
+        }
+    
+    @staticmethod
+    def _testing_link_data(match: 're.Match') -> Dict[str, str]:
+        name = match.group(1)
+        url = match.group(2) if match.group(2) else name
+        return {
+            'name': name,
+            'url': url
+        }
+
+
+# Validator dan extractor milik engine aktif, di-resolve sekali saat pertama dipakai
+# lalu di-cache. Dikosongkan oleh commit_validator_engine saat engine default berubah.
+_shared_validator: Optional[CommitTitleValidator] = None
+_shared_extractor: Optional[ReferenceExtractor] = None
+
+
+def _resolve_shared():
+    """Resolve engine aktif (set_default_engine, env var COMMIT_VALIDATOR_ENGINE, atau 'reference')"""
+    global _shared_validator, _shared_extractor
+    # Import saat dipakai: commit_validator_engine mengimpor modul ini
+    from commit_validator_engine import get_engine
+    engine = get_engine()
+    _shared_validator, _shared_extractor = engine.validator, engine.extractor
+    return engine
+
+
+def _reset_shared() -> None:
+    """Lupakan instance yang di-cache, di-resolve ulang pada pemakaian berikutnya"""
+    global _shared_validator, _shared_extractor
+    _shared_validator = _shared_extractor = None
+
+
+def get_shared_validator() -> CommitTitleValidator:
+    """
+    Instance CommitTitleValidator yang dipakai bersama, milik engine aktif
+
+    Aman dipanggil dari banyak thread (termasuk build free-threaded Python 3.13),
+    jalur baca tidak memakai lock. Engine dipilih lewat
+    commit_validator_engine.set_default_engine() atau env var
+    COMMIT_VALIDATOR_ENGINE (dibaca sekali, lihat reset_engine_cache), semua
+    engine memberi hasil yang identik.
+    """
+    return _shared_validator or _resolve_shared().validator
+
+
+def get_shared_extractor() -> ReferenceExtractor:
+    """Instance ReferenceExtractor yang dipakai bersama milik engine aktif, thread-safe"""
+    return _shared_extractor or _resolve_shared().extractor
 
 
 # Convenience functions
 def validate_commit_title(title: str) -> ValidationResult:
     """Function wrapper untuk validasi title"""
-    validator = CommitTitleValidator()
-    return validator.validate_title(title)
+    return (_shared_validator or _resolve_shared().validator).validate_title(title)
 
 
 def extract_reference_data(description: str) -> ReferenceData:
     """Function wrapper untuk ekstraksi referensi"""
-    extractor = ReferenceExtractor()
-    return extractor.extract_references(description)
\ No newline at end of file
+    return (_shared_extractor or _resolve_shared().extractor).extract_references(description)
+
+
+def validate_commit_titles_batch(titles: Iterable[str]) -> List[ValidationResult]:
+    """Function wrapper untuk validasi banyak title sekaligus"""
+    validate = get_shared_validator().validate_title
+    return [validate(title) for title in titles]
+
+
+def validate_commit_titles_deduplicated(titles: Iterable[str]) -> BatchValidationResult:
+    """
+    Validasi batch dengan deduplikasi title
+    
+    Title dinormalisasi (strip whitespace) lalu di-intern lewat dictionary,
+    setiap title unik hanya divalidasi sekali dan object FrozenValidationResult
+    yang sama dipakai untuk semua kemunculannya. Cocok untuk history dengan
+    banyak merge commit, revert, atau title bot yang berulang.
+    
+    Args:
+        titles: Daftar title yang akan divalidasi
+        
+    Returns:
+        BatchValidationResult dengan hasil per title (urutan sama dengan input)
+        dan statistik duplikasi. Hasil bersifat immutable, pakai to_result()
+        untuk mendapatkan salinan yang boleh diubah.
+    """
+    validate = get_shared_validator().validate_title
+    interned: Dict[str, FrozenValidationResult] = {}
+    results = []
+    
+    for title in titles:
+        # validate_title melakukan strip, jadi hasil untuk key dan title asli identik
+        key = title.strip() if title else ''
+        result = interned.get(key)
+        if result is None:
+            result = interned[key] = FrozenValidationResult.from_result(validate(key))
+        results.append(result)
+    
+    return BatchValidationResult(results, total=len(results), unique=len(interned))
+
+
+def extract_reference_data_batch(descriptions: Iterable[str]) -> List[ReferenceData]:
+    """Function wrapper untuk ekstraksi referensi dari banyak deskripsi"""
+    extract = get_shared_extractor().extract_references
+    return [extract(description) for description in descriptions]
@@ -0,0 +1,415 @@
+"""
+Audit terdistribusi untuk banyak repository (shard dan merge)
+
+Audit dibagi menjadi tiga langkah yang bisa dijalankan di host berbeda:
+
+1. plan: jalur first-parent tiap repository dipotong menjadi chunk, setiap
+   chunk menjadi shard dengan rentang revisi tetap (sha include/exclude),
+   lalu disimpan sebagai manifest JSON yang portabel
+2. run: worker memproses shard dari manifest (bisa dibagi ke banyak host
+   dengan --host-index/--host-count dan ke banyak proses dengan --workers),
+   setiap shard menghasilkan satu file hasil
+3. merge: file hasil digabung secara deterministik, urutan input tidak
+   berpengaruh. File hasil merge memakai format yang sama sehingga bisa
+   di-merge lagi (merge bertingkat)
+
+Shard k dari sebuah ref berisi commit yang reachable dari b_k tetapi tidak
+dari b_(k-1) maupun tip ref sebelumnya, sehingga setiap commit (termasuk
+commit dari branch yang di-merge) diaudit tepat satu kali.
+
+Contoh:
+    python commit_validator_audit.py plan repo-a repo-b --chunk-size 2000 -o manifest.json
+    python commit_validator_audit.py run manifest.json -d hasil/ --host-index 0 --host-count 3 --workers 8
+    python commit_validator_audit.py merge hasil/*.json -o audit.json --manifest manifest.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from commit_validator import REFERENCE_FIELDS
+from commit_validator_engine import ValidationEngine, get_engine
+from commit_validator_git import LOG_FORMAT, RECORD_SEPARATOR, GitError, parse_log_record, run_git
+from commit_validator_serialization import record_to_dict
+
+
+FORMAT_VERSION = 1
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_READ_SIZE = 1 << 16
+
+
+class AuditError(ValueError):
+    """Manifest atau file hasil audit tidak valid"""
+
+
+@dataclass
+class ShardSpec:
+    """Satu unit kerja audit: rentang revisi dari satu repository"""
+    id: str
+    repo_name: str
+    repo: str
+    index: int
+    include: List[str]
+    exclude: List[str] = field(default_factory=list)
+    commits: int = 0
+
+
+def _repo_name(repo: str, used: Dict[str, int]) -> str:
+    """Nama repository unik dari path (tanpa akhiran .git)"""
+    name = os.path.basename(os.path.normpath(repo))
+    if name.endswith('.git'):
+        name = name[:-4]
+    name = name or 'repo'
+    count = used.get(name, 0)
+    used[name] = count + 1
+    return name if count == 0 else f"{name}-{count + 1}"
+
+
+def plan_shards(repos: Sequence[str], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                refs: Sequence[str] = ('HEAD',)) -> List[ShardSpec]:
+    """
+    Bagi history repository menjadi shard
+
+    Args:
+        repos: Path repository
+        chunk_size: Jumlah commit first-parent per shard
+        refs: Ref yang diaudit per repository (ref yang tidak ada dilewati)
+
+    Returns:
+        Daftar ShardSpec, rentang revisi memakai sha sehingga tetap valid
+        walaupun ref bergerak setelah plan dibuat
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size minimal 1")
+
+    shards = []
+    used_names: Dict[str, int] = {}
+    for repo in repos:
+        name = _repo_name(repo, used_names)
+        covered: List[str] = []
+        index = 0
+        for ref in refs:
+            try:
+                tip = run_git(repo, 'rev-parse', '--verify', '-q', f'{ref}^{{commit}}').strip()
+            except GitError:
+                continue
+            if tip in covered:
+                continue
+
+            revisions = '\n'.join([tip] + ['^' + sha for sha in covered]) + '\n'
+            chain = run_git(repo, 'rev-list', '--first-parent', '--reverse', '--stdin',
+                            input_text=revisions).split()
+            previous: Optional[str] = None
+            for start in range(0, len(chain), chunk_size):
+                chunk = chain[start:start + chunk_size]
+                exclude = ([previous] if previous else []) + covered
+                shards.append(ShardSpec(f"{name}-{index:05d}", name, repo, index,
+                                        [chunk[-1]], exclude, len(chunk)))
+                previous = chunk[-1]
+                index += 1
+            covered.append(tip)
+    return shards
+
+
+def save_manifest(shards: Sequence[ShardSpec], path: str) -> None:
+    """Simpan manifest shard sebagai JSON"""
+    _write_json({'version': FORMAT_VERSION, 'shards': [asdict(shard) for shard in shards]}, path)
+
+
+def load_manifest(path: str) -> List[ShardSpec]:
+    """Baca manifest shard"""
+    with open(path, encoding='utf-8') as handle:
+        data = json.load(handle)
+    if data.get('version') != FORMAT_VERSION:
+        raise AuditError(f"Versi manifest tidak didukung: {data.get('version')}")
+    return [ShardSpec(**shard) for shard in data['shards']]
+
+
+def select_shards(shards: Sequence[ShardSpec], host_index: int = 0, host_count: int = 1) -> List[ShardSpec]:
+    """Bagian shard untuk satu host (round-robin berdasarkan urutan manifest)"""
+    if not 0 <= host_index < host_count:
+        raise ValueError(f"host_index harus di antara 0 dan {host_count - 1}")
+    return list(shards[host_index::host_count])
+
+
+def iter_commits(repo: str, include: Sequence[str], exclude: Sequence[str]) -> Iterator[Tuple[str, str]]:
+    """Stream (sha, message) untuk rentang revisi, tanpa memuat seluruh output git log"""
+    revisions = '\n'.join(list(include) + ['^' + sha for sha in exclude]) + '\n'
+    process = subprocess.Popen(
+        ['git', '-C', repo, 'log', '--stdin', '--reverse', LOG_FORMAT],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        text=True, encoding='utf-8', errors='replace',
+    )
+    process.stdin.write(revisions)
+    process.stdin.close()
+
+    pending = ''
+    completed = False
+    try:
+        while True:
+            chunk = process.stdout.read(_READ_SIZE)
+            if not chunk:
+                break
+            records = (pending + chunk).split(RECORD_SEPARATOR)
+            pending = records.pop()
+            for record in records:
+                if record:
+                    yield parse_log_record(record)
+        if pending:
+            yield parse_log_record(pending)
+        completed = True
+    finally:
+        process.stdout.close()
+        stderr = process.stderr.read()
+        process.stderr.close()
+        # Konsumen berhenti lebih awal: git bisa keluar karena SIGPIPE, bukan error
+        if process.wait() != 0 and completed:
+            raise GitError(f"git log gagal: {stderr.strip()}")
+
+
+def _new_stats() -> Dict:
+    return {'commits': 0, 'valid': 0, 'invalid': 0, 'errors': {}, 'types': {},
+            'references': {name: 0 for name in REFERENCE_FIELDS}}
+
+
+def _add_stats(total: Dict, stats: Dict) -> None:
+    """Tambahkan stats ke total (in-place)"""
+    for key in ('commits', 'valid', 'invalid'):
+        total[key] += stats[key]
+    for key in ('errors', 'types', 'references'):
+        for name, count in stats[key].items():
+            total[key][name] = total[key].get(name, 0) + count
+
+
+def run_shard(shard: ShardSpec, engine: Optional[ValidationEngine] = None,
+              repo: Optional[str] = None) -> Dict:
+    """
+    Audit satu shard
+
+    Args:
+        shard: Shard dari manifest
+        engine: Engine validasi (default: get_engine())
+        repo: Path repository di host ini (default: shard.repo)
+
+    Returns:
+        Hasil audit dalam format yang sama dengan hasil merge
+    """
+    engine = engine or get_engine()
+    stats = _new_stats()
+    tickets: Dict[str, List[str]] = {}
+    results = []
+
+    for sha, message in iter_commits(repo or shard.repo, shard.include, shard.exclude):
+        title, _, description = message.partition('\n')
+        title_result = engine.validate_title(title)
+        references = engine.extract_references(description)
+
+        stats['commits'] += 1
+        if title_result.is_valid:
+            stats['valid'] += 1
+            tipe = title_result.parsed_data['type']
+            stats['types'][tipe] = stats['types'].get(tipe, 0) + 1
+            ticket = f"{title_result.parsed_data['project']}-{title_result.parsed_data['ticket_number']}"
+            tickets.setdefault(ticket, []).append(sha)
+        else:
+            stats['invalid'] += 1
+            for error in title_result.errors:
+                stats['errors'][error] = stats['errors'].get(error, 0) + 1
+        for name in REFERENCE_FIELDS:
+            if getattr(references, name) is not None:
+                stats['references'][name] += 1
+        if references.ticket_link:
+            ticket = f"{references.ticket_link['project']}-{references.ticket_link['ticket_number']}"
+            shas = tickets.setdefault(ticket, [])
+            if not shas or shas[-1] != sha:
+                shas.append(sha)
+
+        results.append({
+            'shard': shard.id,
+            'repo': shard.repo_name,
+            'sha': sha,
+            'title': title,
+            'title_result': record_to_dict(title_result),
+            'references': record_to_dict(references),
+        })
+
+    return {
+        'version': FORMAT_VERSION,
+        'shards': [shard.id],
+        'stats': stats,
+        'repos': {shard.repo_name: stats},
+        'tickets': {ticket: {shard.repo_name: shas} for ticket, shas in tickets.items()},
+        'results': results,
+    }
+
+
+def merge_results(parts: Iterable[Dict], expected_shards: Optional[Iterable[str]] = None) -> Dict:
+    """
+    Gabungkan hasil audit secara deterministik
+
+    Args:
+        parts: Hasil run_shard atau hasil merge sebelumnya
+        expected_shards: Jika diisi, semua shard ini wajib ada
+
+    Returns:
+        Hasil gabungan (urutan input tidak berpengaruh)
+
+    Raises:
+        AuditError: Shard muncul lebih dari sekali atau ada shard yang hilang
+    """
+    shards: List[str] = []
+    stats = _new_stats()
+    repos: Dict[str, Dict] = {}
+    tickets: Dict[str, Dict[str, List[str]]] = {}
+    results = []
+
+    for part in parts:
+        if part.get('version') != FORMAT_VERSION:
+            raise AuditError(f"Versi hasil audit tidak didukung: {part.get('version')}")
+        shards.extend(part['shards'])
+        _add_stats(stats, part['stats'])
+        for name, repo_stats in part['repos'].items():
+            _add_stats(repos.setdefault(name, _new_stats()), repo_stats)
+        for ticket, by_repo in part['tickets'].items():
+            for name, shas in by_repo.items():
+                tickets.setdefault(ticket, {}).setdefault(name, []).extend(shas)
+        results.extend(part['results'])
+
+    duplicates = sorted(shard for shard, count in Counter(shards).items() if count > 1)
+    if duplicates:
+        raise AuditError(f"Shard muncul lebih dari sekali: {', '.join(duplicates)}")
+    if expected_shards is not None:
+        missing = sorted(set(expected_shards) - set(shards))
+        if missing:
+            raise AuditError(f"Hasil shard belum lengkap, hilang: {', '.join(missing)}")
+
+    # Sort stabil: commit dalam satu shard tetap berurutan sesuai history
+    results.sort(key=lambda entry: entry['shard'])
+    return {
+        'version': FORMAT_VERSION,
+        'shards': sorted(shards),
+        'stats': stats,
+        'repos': repos,
+        'tickets': {ticket: {name: sorted(set(shas)) for name, shas in by_repo.items()}
+                    for ticket, by_repo in tickets.items()},
+        'results': results,
+    }
+
+
+def _write_json(data: Dict, path: str) -> None:
+    """Tulis JSON secara atomik dengan key terurut (output deterministik)"""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as handle:
+        json.dump(data, handle, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    os.replace(temp_path, path)
+
+
+def load_result(path: str) -> Dict:
+    """Baca file hasil audit"""
+    with open(path, encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def result_path(output_dir: str, shard: ShardSpec) -> str:
+    """Lokasi file hasil untuk sebuah shard"""
+    return os.path.join(output_dir, f"{shard.id}.json")
+
+
+def _run_job(job: Tuple[Dict, str, Optional[str], Optional[str]]) -> str:
+    """Entry point proses worker: audit satu shard lalu tulis file hasil"""
+    shard_data, output_dir, engine_name, repo_root = job
+    shard = ShardSpec(**shard_data)
+    repo = os.path.join(repo_root, shard.repo_name) if repo_root else shard.repo
+    path = result_path(output_dir, shard)
+    _write_json(run_shard(shard, get_engine(engine_name), repo), path)
+    return path
+
+
+def run_shards(shards: Sequence[ShardSpec], output_dir: str, workers: int = 1,
+               engine_name: Optional[str] = None, repo_root: Optional[str] = None,
+               force: bool = False) -> List[str]:
+    """
+    Audit banyak shard, shard yang sudah punya file hasil dilewati (resume)
+
+    Args:
+        shards: Shard yang dikerjakan host ini
+        output_dir: Direktori file hasil
+        workers: Jumlah proses worker
+        engine_name: Nama engine validasi (default: get_engine())
+        repo_root: Jika diisi, repository dicari di <repo_root>/<repo_name>
+        force: Kerjakan ulang shard yang sudah punya file hasil
+
+    Returns:
+        Path file hasil yang baru ditulis
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = [(asdict(shard), output_dir, engine_name, repo_root) for shard in shards
+            if force or not os.path.exists(result_path(output_dir, shard))]
+    if workers <= 1 or len(jobs) <= 1:
+        return [_run_job(job) for job in jobs]
+    with multiprocessing.Pool(min(workers, len(jobs))) as pool:
+        return sorted(pool.imap_unordered(_run_job, jobs))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point CLI audit terdistribusi"""
+    parser = argparse.ArgumentParser(description='Audit commit terdistribusi (shard dan merge)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    plan = commands.add_parser('plan', help='Buat manifest shard dari repository')
+    plan.add_argument('repos', nargs='+', help='Path repository')
+    plan.add_argument('-o', '--output', required=True, help='File manifest')
+    plan.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                      help=f'Commit first-parent per shard (default: {DEFAULT_CHUNK_SIZE})')
+    plan.add_argument('--ref', action='append', dest='refs', help='Ref yang diaudit (default: HEAD, bisa berulang)')
+
+    run = commands.add_parser('run', help='Audit shard dari manifest')
+    run.add_argument('manifest', help='File manifest')
+    run.add_argument('-d', '--output-dir', required=True, help='Direktori file hasil per shard')
+    run.add_argument('--host-index', type=int, default=0, help='Index host ini (default: 0)')
+    run.add_argument('--host-count', type=int, default=1, help='Jumlah host (default: 1)')
+    run.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Jumlah proses worker')
+    run.add_argument('--engine', help='Engine validasi (default: COMMIT_VALIDATOR_ENGINE atau reference)')
+    run.add_argument('--repo-root', help='Cari repository di <repo-root>/<nama repo> pada host ini')
+    run.add_argument('--force', action='store_true', help='Kerjakan ulang shard yang sudah selesai')
+
+    merge = commands.add_parser('merge', help='Gabungkan file hasil shard')
+    merge.add_argument('results', nargs='+', help='File hasil shard atau hasil merge sebelumnya')
+    merge.add_argument('-o', '--output', required=True, help='File hasil gabungan')
+    merge.add_argument('--manifest', help='Pastikan semua shard dari manifest ini ada')
+
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'plan':
+            shards = plan_shards(args.repos, args.chunk_size, args.refs or ('HEAD',))
+            save_manifest(shards, args.output)
+            print(f"📦 {len(shards)} shard, {sum(shard.commits for shard in shards)} commit first-parent")
+            return 0
+
+        if args.command == 'run':
+            shards = select_shards(load_manifest(args.manifest), args.host_index, args.host_count)
+            written = run_shards(shards, args.output_dir, args.workers, args.engine, args.repo_root, args.force)
+            print(f"✅ {len(written)} shard selesai ({len(shards) - len(written)} sudah ada sebelumnya)")
+            return 0
+
+        expected = [shard.id for shard in load_manifest(args.manifest)] if args.manifest else None
+        merged = merge_results((load_result(path) for path in args.results), expected)
+        _write_json(merged, args.output)
+        stats = merged['stats']
+        print(f"📊 {stats['commits']} commit: {stats['valid']} valid, {stats['invalid']} invalid")
+        return 1 if stats['invalid'] else 0
+    except (AuditError, GitError, ValueError) as error:
+        print(f"❌ {error}", file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,163 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from commit_validator_audit import (
+    AuditError,
+    load_manifest,
+    load_result,
+    main,
+    merge_results,
+    plan_shards,
+    run_shard,
+    run_shards,
+    select_shards,
+)
+from commit_validator_test_helpers import commit, git
+
+
+def make_repo(path, count, prefix):
+    """Repository dengan history linear, branch fitur yang di-merge, dan branch lain"""
+    os.makedirs(path)
+    git(path, 'init', '-q', '-b', 'main')
+    for number in range(1, count + 1):
+        title = f"feat: menambahkan fitur {prefix} {number} (Taiga #{prefix}-{number})"
+        if number % 4 == 0:
+            title = f"add {prefix} feature {number}"
+        commit(path, title + f"\n\nTicket Link: [(Taiga #{prefix}-{number})](https://taiga.example.com/{number})")
+
+    git(path, 'checkout', '-q', '-b', 'fitur')
+    commit(path, f"fix: memperbaiki bug di branch fitur (Taiga #{prefix}-100)")
+    commit(path, "wip")
+    git(path, 'checkout', '-q', 'main')
+    commit(path, f"docs: update dokumentasi utama (Taiga #{prefix}-101)")
+    git(path, 'merge', '-q', '--no-ff', '-m', f"chore: merge branch fitur (Taiga #{prefix}-102)", 'fitur')
+
+    git(path, 'checkout', '-q', '-b', 'lain')
+    commit(path, f"test: menambahkan test branch lain (Taiga #{prefix}-103)")
+    git(path, 'checkout', '-q', 'main')
+
+
+class TestAudit(unittest.TestCase):
+    """Test plan, run, dan merge audit terhadap repository sementara"""
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.repo_a = os.path.join(self.tempdir.name, 'alpha')
+        self.repo_b = os.path.join(self.tempdir.name, 'beta.git')
+        make_repo(self.repo_a, 9, 'ALPHA')
+        make_repo(self.repo_b, 4, 'BETA')
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def all_commits(self, repo, *refs):
+        return set(git(repo, 'rev-list', *refs).split())
+
+    def test_shards_cover_history_exactly_once(self):
+        """Test setiap commit (termasuk dari branch yang di-merge) ada di tepat satu shard"""
+        shards = plan_shards([self.repo_a], chunk_size=3, refs=['main', 'lain', 'tidak-ada'])
+        seen = []
+        for shard in shards:
+            seen.extend(run_shard(shard)['results'])
+
+        shas = [entry['sha'] for entry in seen]
+        self.assertEqual(len(shas), len(set(shas)))
+        self.assertEqual(set(shas), self.all_commits(self.repo_a, 'main', 'lain'))
+        self.assertEqual([shard.id for shard in shards][:2], ['alpha-00000', 'alpha-00001'])
+        self.assertTrue(all(shard.commits <= 3 for shard in shards))
+
+    def test_repo_names(self):
+        """Test nama repository dari path (tanpa .git)"""
+        shards = plan_shards([self.repo_a, self.repo_b, self.repo_b], chunk_size=100)
+        self.assertEqual([shard.repo_name for shard in shards], ['alpha', 'beta', 'beta-2'])
+
+    def test_shard_result(self):
+        """Test stats dan ticket index hasil satu shard"""
+        shard = plan_shards([self.repo_b], chunk_size=100)[0]
+        result = run_shard(shard)
+        stats = result['stats']
+
+        self.assertEqual(stats['commits'], 8)
+        self.assertEqual(stats['valid'] + stats['invalid'], 8)
+        self.assertEqual(stats['references']['ticket_link'], 4)
+        self.assertEqual(result['tickets']['BETA-1']['beta'], [result['results'][0]['sha']])
+        self.assertIn('BETA-4', result['tickets'])
+        self.assertEqual(result['repos'], {'beta': stats})
+
+    def test_merge_is_deterministic(self):
+        """Test hasil merge tidak bergantung urutan input dan sama dengan satu shard besar"""
+        small = [run_shard(shard) for shard in plan_shards([self.repo_a, self.repo_b], chunk_size=2)]
+        forward = merge_results(small)
+        backward = merge_results(reversed(small))
+        nested = merge_results([merge_results(small[:3]), merge_results(small[3:])])
+
+        self.assertEqual(json.dumps(forward, sort_keys=True), json.dumps(backward, sort_keys=True))
+        self.assertEqual(json.dumps(forward, sort_keys=True), json.dumps(nested, sort_keys=True))
+
+        big = merge_results(run_shard(shard) for shard in plan_shards([self.repo_a, self.repo_b], chunk_size=1000))
+        self.assertEqual(forward['stats'], big['stats'])
+        self.assertEqual(forward['tickets'], big['tickets'])
+        self.assertEqual(sorted(entry['sha'] for entry in forward['results']),
+                         sorted(entry['sha'] for entry in big['results']))
+
+    def test_merge_rejects_duplicates_and_missing(self):
+        """Test shard ganda dan shard yang hilang terdeteksi"""
+        shards = plan_shards([self.repo_b], chunk_size=2)
+        results = [run_shard(shard) for shard in shards]
+
+        with self.assertRaises(AuditError):
+            merge_results(results + results[:1])
+        with self.assertRaises(AuditError):
+            merge_results(results[1:], expected_shards=[shard.id for shard in shards])
+
+    def test_select_shards(self):
+        """Test pembagian shard antar host tanpa overlap"""
+        shards = plan_shards([self.repo_a, self.repo_b], chunk_size=2)
+        parts = [select_shards(shards, index, 3) for index in range(3)]
+
+        self.assertEqual(sorted(shard.id for part in parts for shard in part), sorted(shard.id for shard in shards))
+        with self.assertRaises(ValueError):
+            select_shards(shards, 3, 3)
+
+    def test_worker_processes(self):
+        """Test beberapa proses worker menghasilkan file yang sama dengan satu proses"""
+        shards = plan_shards([self.repo_a, self.repo_b], chunk_size=2)
+        serial_dir = os.path.join(self.tempdir.name, 'serial')
+        parallel_dir = os.path.join(self.tempdir.name, 'parallel')
+
+        run_shards(shards, serial_dir, workers=1)
+        written = run_shards(shards, parallel_dir, workers=3)
+
+        self.assertEqual(len(written), len(shards))
+        for name in sorted(os.listdir(serial_dir)):
+            self.assertEqual(load_result(os.path.join(serial_dir, name)),
+                             load_result(os.path.join(parallel_dir, name)))
+        # Shard yang sudah selesai dilewati (resume)
+        self.assertEqual(run_shards(shards, parallel_dir, workers=3), [])
+
+    def test_cli_end_to_end(self):
+        """Test plan, run di dua host, lalu merge lewat CLI"""
+        manifest = os.path.join(self.tempdir.name, 'manifest.json')
+        output_dir = os.path.join(self.tempdir.name, 'hasil')
+        merged = os.path.join(self.tempdir.name, 'audit.json')
+
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(['plan', self.repo_a, self.repo_b, '--chunk-size', '4', '-o', manifest]), 0)
+            for index in range(2):
+                self.assertEqual(main(['run', manifest, '-d', output_dir, '--host-index', str(index),
+                                       '--host-count', '2', '--workers', '2']), 0)
+            files = [os.path.join(output_dir, name) for name in os.listdir(output_dir)]
+            self.assertEqual(main(['merge', *files, '-o', merged, '--manifest', manifest]), 1)
+
+        result = load_result(merged)
+        self.assertEqual(result['shards'], sorted(shard.id for shard in load_manifest(manifest)))
+        self.assertEqual(result['stats']['commits'],
+                         len(self.all_commits(self.repo_a, 'main')) + len(self.all_commits(self.repo_b, 'main')))
+        self.assertEqual(set(result['repos']), {'alpha', 'beta'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,592 @@
+"""
+Benchmark suite untuk commit validator
+
+Menghasilkan corpus sintetis (title valid/invalid dan deskripsi besar) secara
+deterministik dari sebuah seed, lalu mengukur throughput, persentil latency,
+dan peak memory dari validate_title, extract_references, dan jalur batch.
+Hasil bisa disimpan sebagai baseline JSON dan dibandingkan dengan run berikutnya.
+Opsi --threads mengukur scaling throughput validator bersama di banyak thread
+(GIL maupun build free-threaded), opsi --serialization membandingkan writer
+JSONL/binary dengan jalur naif dataclasses.asdict + json.dumps.
+
+Contoh:
+    python commit_validator_bench.py --seed 42 --size 5000
+    python commit_validator_bench.py --save bench_baselines/baseline.json
+    python commit_validator_bench.py --compare bench_baselines/baseline.json
+    python commit_validator_bench.py --threads 1,2,4,8
+    python commit_validator_bench.py --serialization
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from commit_validator import (
+    CommitTitleValidator,
+    ReferenceExtractor,
+    extract_reference_data_batch,
+    get_shared_validator,
+    validate_commit_titles_batch,
+    validate_commit_titles_deduplicated,
+)
+from commit_validator_engine import FAST_ENGINE, get_engine
+from commit_validator_serialization import read_binary, read_jsonl, write_binary, write_jsonl
+
+
+WORDS = [
+    'menambahkan', 'memperbaiki', 'fitur', 'login', 'user', 'dashboard',
+    'analytics', 'endpoint', 'validasi', 'token', 'refresh', 'halaman',
+    'laporan', 'notifikasi', 'email', 'cache', 'query', 'database', 'modul',
+    'autentikasi', 'profil', 'pengaturan', 'export', 'import', 'integrasi',
+    'pembayaran', 'pencarian', 'filter', 'pagination', 'logging',
+]
+
+PROJECTS = ['DATB', 'PROJ', 'AUTH', 'API', 'DOC', 'PERF', 'CI', 'TEST']
+
+# Kasus invalid sesuai contoh di README, plus kasus adversarial
+INVALID_KINDS = [
+    'no_type',            # add login feature (Taiga #DATB-10353)
+    'wrong_type',         # feature: add login (Taiga #DATB-10353)
+    'typo_type',          # bug: fix issue (Taiga #PROJ-123)
+    'no_space',           # feat:add login (Taiga #DATB-10353)
+    'short_summary',      # feat: add (Taiga #DATB-10353)
+    'lowercase_project',  # feat: add login (Taiga #datb-10353)
+    'no_taiga',           # feat: menambahkan login
+    'no_hash',            # feat: add login (Taiga DATB-10353)
+    'unclosed',           # feat: add login (Taiga #DATB-10353
+    'uppercase_type',     # Feat: add login (Taiga #DATB-10353)
+    'empty',              # '' atau hanya whitespace
+    'whitespace_run',     # spasi panjang sebelum referensi (backtracking regex)
+    'long_summary',       # ringkasan sangat panjang tanpa referensi valid
+    'many_parens',        # banyak "(Taiga" palsu di ringkasan
+]
+
+# Title yang sering berulang di history nyata (merge, revert, bot)
+REPEATED_TITLES = [
+    "Merge branch 'main' into develop",
+    "Merge branch 'develop' into main",
+    "Merge remote-tracking branch 'origin/main'",
+    'Revert "feat: menambahkan fitur login user (Taiga #DATB-10353)"',
+    "chore(deps): bump lodash from 4.17.20 to 4.17.21",
+    "chore: update dependencies (Taiga #CHR-1)",
+    "Update README.md",
+    "WIP",
+]
+
+
+@dataclass
+class BenchmarkCorpus:
+    """Corpus sintetis untuk benchmark"""
+    seed: int
+    titles: List[str]
+    descriptions: List[str]
+    invalid_ratio: float
+    duplicate_ratio: float = 0.0
+
+
+@dataclass
+class BenchmarkStats:
+    """Hasil pengukuran satu benchmark"""
+    name: str
+    items: int
+    total_seconds: float
+    items_per_second: float
+    p50_us: float
+    # None jika sampel terlalu sedikit untuk persentil tersebut (misalnya jalur batch)
+    p95_us: Optional[float]
+    p99_us: Optional[float]
+    max_us: float
+    peak_memory_kb: float
+
+
+@dataclass
+class ThreadScalingStats:
+    """Throughput validator bersama untuk sejumlah thread"""
+    threads: int
+    items: int
+    total_seconds: float
+    items_per_second: float
+    speedup: float
+
+
+class CorpusGenerator:
+    """Generator corpus sintetis yang deterministik berdasarkan seed"""
+
+    def __init__(self, seed: int = 42):
+        self.seed = seed
+        self.random = random.Random(seed)
+
+    def summary(self, min_words: int = 2, max_words: int = 8) -> str:
+        """Buat ringkasan acak dari kosakata"""
+        count = self.random.randint(min_words, max_words)
+        return ' '.join(self.random.choice(WORDS) for _ in range(count))
+
+    def reference(self) -> str:
+        """Buat referensi Taiga yang valid"""
+        return f"(Taiga #{self.random.choice(PROJECTS)}-{self.random.randint(1, 99999)})"
+
+    def valid_title(self) -> str:
+        """Buat title yang valid"""
+        tipe = self.random.choice(CommitTitleValidator.ALLOWED_TYPES)
+        return f"{tipe}: {self.summary()} {self.reference()}"
+
+    def invalid_title(self, kind: Optional[str] = None) -> str:
+        """Buat title invalid untuk jenis kesalahan tertentu (acak jika None)"""
+        kind = kind or self.random.choice(INVALID_KINDS)
+        summary = self.summary()
+        reference = self.reference()
+        project = self.random.choice(PROJECTS)
+        number = self.random.randint(1, 99999)
+
+        if kind == 'no_type':
+            return f"{summary} {reference}"
+        if kind == 'wrong_type':
+            return f"{self.random.choice(['feature', 'update', 'hotfix'])}: {summary} {reference}"
+        if kind == 'typo_type':
+            return f"{self.random.choice(['bug', 'bugfix', 'tests', 'document'])}: {summary} {reference}"
+        if kind == 'no_space':
+            return f"feat:{summary} {reference}"
+        if kind == 'short_summary':
+            return f"feat: {self.random.choice(['add', 'fix', 'x', 'upd'])} {reference}"
+        if kind == 'lowercase_project':
+            return f"feat: {summary} (Taiga #{project.lower()}-{number})"
+        if kind == 'no_taiga':
+            return f"feat: {summary}"
+        if kind == 'no_hash':
+            return f"feat: {summary} (Taiga {project}-{number})"
+        if kind == 'unclosed':
+            return f"feat: {summary} (Taiga #{project}-{number}"
+        if kind == 'uppercase_type':
+            return f"Feat: {summary} {reference}"
+        if kind == 'empty':
+            return self.random.choice(['', ' ', '\t  '])
+        if kind == 'whitespace_run':
+            return f"feat: {summary}{' ' * self.random.randint(200, 2000)}(Taiga #{project}-x{number})"
+        if kind == 'long_summary':
+            return f"feat: {self.summary(200, 600)} (Taiga {project}-{number})"
+        if kind == 'many_parens':
+            fake = ' '.join(f"(Taiga #{project}-{n}" for n in range(self.random.randint(20, 100)))
+            return f"feat: {summary} {fake}"
+        raise ValueError(f"Jenis title invalid tidak dikenal: {kind}")
+
+    def titles(self, size: int, invalid_ratio: float = 0.3, duplicate_ratio: float = 0.0) -> List[str]:
+        """Buat campuran title valid/invalid, dengan proporsi title berulang duplicate_ratio"""
+        titles = []
+        for _ in range(size):
+            if duplicate_ratio and titles and self.random.random() < duplicate_ratio:
+                # Setengah dari pool merge/revert/bot, setengah dari title sebelumnya
+                if self.random.random() < 0.5:
+                    titles.append(self.random.choice(REPEATED_TITLES))
+                else:
+                    titles.append(self.random.choice(titles))
+            elif self.random.random() < invalid_ratio:
+                titles.append(self.invalid_title())
+            else:
+                titles.append(self.valid_title())
+        return titles
+
+    def description(self, body_lines: int = 40) -> str:
+        """Buat deskripsi besar dengan referensi di akhir (jika ada)"""
+        lines = [self.summary(4, 16) for _ in range(self.random.randint(body_lines // 2, body_lines))]
+        project = self.random.choice(PROJECTS)
+        number = self.random.randint(1, 99999)
+
+        if self.random.random() < 0.8:
+            lines.append(f"Ticket Link: [(Taiga #{project}-{number})] "
+                         f"(https://projects.digitaltelkom.id/project/{project}/us/{number})")
+        if self.random.random() < 0.6:
+            lines.append(f"Documentation Link: [Figma] (https://www.figma.com/design/{number})")
+        if self.random.random() < 0.6:
+            lines.append(f"Testing Link: [Test Cases] (https://docs.google.com/spreadsheets/{number})")
+        return '\n'.join(lines)
+
+    def descriptions(self, size: int, body_lines: int = 40) -> List[str]:
+        """Buat banyak deskripsi"""
+        return [self.description(body_lines) for _ in range(size)]
+
+
+def generate_corpus(seed: int = 42, size: int = 5000, invalid_ratio: float = 0.3,
+                    description_size: Optional[int] = None, body_lines: int = 40,
+                    duplicate_ratio: float = 0.0) -> BenchmarkCorpus:
+    """
+    Buat corpus benchmark yang reproducible
+
+    Args:
+        seed: Seed random, seed yang sama menghasilkan corpus yang sama
+        size: Jumlah title
+        invalid_ratio: Proporsi title invalid (0.0 - 1.0)
+        description_size: Jumlah deskripsi (default: size // 10)
+        body_lines: Jumlah baris maksimum per deskripsi
+        duplicate_ratio: Proporsi title yang berulang (merge, revert, bot)
+
+    Returns:
+        BenchmarkCorpus berisi titles dan descriptions
+    """
+    generator = CorpusGenerator(seed)
+    titles = generator.titles(size, invalid_ratio, duplicate_ratio)
+    if description_size is None:
+        description_size = max(1, size // 10)
+    descriptions = generator.descriptions(description_size, body_lines)
+    return BenchmarkCorpus(seed, titles, descriptions, invalid_ratio, duplicate_ratio)
+
+
+def _percentile(sorted_values: Sequence[float], percent: float) -> float:
+    """Persentil dengan metode nearest-rank"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(percent / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def _tail_percentile_us(sorted_values: Sequence[float], percent: float) -> Optional[float]:
+    """Persentil ekor (us), None jika sampel kurang dari 100 / (100 - percent)"""
+    if len(sorted_values) * (100 - percent) < 100:
+        return None
+    return _percentile(sorted_values, percent) / 1000
+
+
+def _peak_memory_kb(run: Callable[[], object]) -> float:
+    """Ukur peak memory (KB) dari satu kali eksekusi"""
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def measure_per_item(name: str, func: Callable[[str], object], inputs: Sequence[str],
+                     repeat: int = 3) -> BenchmarkStats:
+    """Ukur latency per item dan throughput dari func(input)"""
+    clock = time.perf_counter_ns
+    latencies = []
+    start = clock()
+    for _ in range(repeat):
+        for item in inputs:
+            t0 = clock()
+            func(item)
+            latencies.append(clock() - t0)
+    total = (clock() - start) / 1e9
+
+    latencies.sort()
+    items = len(inputs) * repeat
+    peak = _peak_memory_kb(lambda: [func(item) for item in inputs])
+    return BenchmarkStats(
+        name=name,
+        items=items,
+        total_seconds=total,
+        items_per_second=items / total if total else 0.0,
+        p50_us=_percentile(latencies, 50) / 1000,
+        p95_us=_tail_percentile_us(latencies, 95),
+        p99_us=_tail_percentile_us(latencies, 99),
+        max_us=latencies[-1] / 1000 if latencies else 0.0,
+        peak_memory_kb=peak,
+    )
+
+
+def measure_batch(name: str, func: Callable[[Sequence[str]], object], inputs: Sequence[str],
+                  repeat: int = 3) -> BenchmarkStats:
+    """
+    Ukur jalur batch, latency yang dilaporkan adalah rata-rata per item tiap run
+
+    Sampel hanya satu per run, sehingga p95/p99 baru dilaporkan jika repeat
+    cukup besar (minimal 20 untuk p95 dan 100 untuk p99).
+    """
+    clock = time.perf_counter_ns
+    per_item = []
+    start = clock()
+    for _ in range(repeat):
+        t0 = clock()
+        func(inputs)
+        per_item.append((clock() - t0) / max(1, len(inputs)))
+    total = (clock() - start) / 1e9
+
+    per_item.sort()
+    items = len(inputs) * repeat
+    peak = _peak_memory_kb(lambda: func(inputs))
+    return BenchmarkStats(
+        name=name,
+        items=items,
+        total_seconds=total,
+        items_per_second=items / total if total else 0.0,
+        p50_us=_percentile(per_item, 50) / 1000,
+        p95_us=_tail_percentile_us(per_item, 95),
+        p99_us=_tail_percentile_us(per_item, 99),
+        max_us=per_item[-1] / 1000 if per_item else 0.0,
+        peak_memory_kb=peak,
+    )
+
+
+def run_benchmarks(corpus: BenchmarkCorpus, repeat: int = 3) -> List[BenchmarkStats]:
+    """Jalankan semua benchmark terhadap corpus"""
+    validator = CommitTitleValidator()
+    extractor = ReferenceExtractor()
+    fast = get_engine(FAST_ENGINE)
+
+    return [
+        measure_per_item('validate_title', validator.validate_title, corpus.titles, repeat),
+        measure_per_item('extract_references', extractor.extract_references, corpus.descriptions, repeat),
+        measure_per_item('validate_title[fast]', fast.validate_title, corpus.titles, repeat),
+        measure_per_item('extract_references[fast]', fast.extract_references, corpus.descriptions, repeat),
+        measure_batch('validate_commit_titles_batch', validate_commit_titles_batch, corpus.titles, repeat),
+        measure_batch('validate_commit_titles_deduplicated', validate_commit_titles_deduplicated,
+                      corpus.titles, repeat),
+        measure_batch('extract_reference_data_batch', extract_reference_data_batch, corpus.descriptions, repeat),
+    ]
+
+
+def run_serialization_benchmarks(corpus: BenchmarkCorpus,
+                                 repeat: int = 3) -> Tuple[List[BenchmarkStats], Dict[str, int]]:
+    """
+    Bandingkan serialisasi hasil validasi: asdict + json.dumps vs JSONL vs binary
+
+    Returns:
+        (stats, ukuran output dalam byte per format)
+    """
+    records = validate_commit_titles_batch(corpus.titles) + extract_reference_data_batch(corpus.descriptions)
+
+    def naive(items: Sequence) -> str:
+        return ''.join(json.dumps(asdict(item)) + '\n' for item in items)
+
+    def jsonl(items: Sequence) -> str:
+        stream = io.StringIO()
+        write_jsonl(items, stream)
+        return stream.getvalue()
+
+    def binary(items: Sequence) -> bytes:
+        stream = io.BytesIO()
+        write_binary(items, stream)
+        return stream.getvalue()
+
+    jsonl_data = jsonl(records)
+    binary_data = binary(records)
+    sizes = {
+        'asdict_json': len(naive(records).encode('utf-8')),
+        'jsonl': len(jsonl_data.encode('utf-8')),
+        'binary': len(binary_data),
+    }
+
+    stats = [
+        measure_batch('serialize_asdict_json', naive, records, repeat),
+        measure_batch('serialize_jsonl', jsonl, records, repeat),
+        measure_batch('serialize_binary', binary, records, repeat),
+        measure_batch('deserialize_jsonl', lambda _: list(read_jsonl(io.StringIO(jsonl_data))), records, repeat),
+        measure_batch('deserialize_binary', lambda _: list(read_binary(io.BytesIO(binary_data))), records, repeat),
+    ]
+    return stats, sizes
+
+
+def gil_enabled() -> bool:
+    """True jika GIL aktif (selalu True sebelum Python 3.13)"""
+    check = getattr(sys, '_is_gil_enabled', None)
+    return True if check is None else check()
+
+
+def measure_thread_scaling(titles: Sequence[str], thread_counts: Sequence[int] = (1, 2, 4, 8),
+                           repeat: int = 1) -> List[ThreadScalingStats]:
+    """
+    Ukur throughput validate_title dari satu instance bersama di banyak thread
+
+    Total pekerjaan tetap (titles x repeat) dan dibagi rata ke setiap thread,
+    sehingga speedup ideal sama dengan jumlah thread.
+    """
+    validate = get_shared_validator().validate_title
+    work = list(titles) * repeat
+    results = []
+    baseline_rate = None
+
+    for count in thread_counts:
+        chunk = -(-len(work) // count)
+        chunks = [work[i:i + chunk] for i in range(0, len(work), chunk)]
+        barrier = threading.Barrier(len(chunks) + 1)
+
+        def worker(items: List[str]) -> None:
+            barrier.wait()
+            for item in items:
+                validate(item)
+
+        threads = [threading.Thread(target=worker, args=(items,)) for items in chunks]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        total = time.perf_counter() - start
+
+        rate = len(work) / total if total else 0.0
+        if baseline_rate is None:
+            baseline_rate = rate
+        results.append(ThreadScalingStats(
+            threads=count,
+            items=len(work),
+            total_seconds=total,
+            items_per_second=rate,
+            speedup=rate / baseline_rate if baseline_rate else 0.0,
+        ))
+    return results
+
+
+def build_report(corpus: BenchmarkCorpus, stats: List[BenchmarkStats],
+                 thread_stats: Optional[List[ThreadScalingStats]] = None,
+                 serialized_bytes: Optional[Dict[str, int]] = None) -> Dict:
+    """Susun report JSON berisi metadata environment dan hasil"""
+    report = {
+        'meta': {
+            'seed': corpus.seed,
+            'titles': len(corpus.titles),
+            'descriptions': len(corpus.descriptions),
+            'invalid_ratio': corpus.invalid_ratio,
+            'duplicate_ratio': corpus.duplicate_ratio,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'gil_enabled': gil_enabled(),
+        },
+        'results': {item.name: asdict(item) for item in stats},
+    }
+    if thread_stats:
+        report['threads'] = [asdict(item) for item in thread_stats]
+    if serialized_bytes:
+        report['serialized_bytes'] = serialized_bytes
+    return report
+
+
+def save_report(report: Dict, path: str) -> None:
+    """Simpan report sebagai baseline JSON"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as handle:
+        json.dump(report, handle, indent=2, sort_keys=True)
+        handle.write('\n')
+
+
+def load_report(path: str) -> Dict:
+    """Baca baseline JSON"""
+    with open(path, encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def compare_reports(baseline: Dict, current: Dict, threshold: float = 0.10) -> List[str]:
+    """
+    Bandingkan report dengan baseline
+
+    Args:
+        baseline: Report baseline
+        current: Report run sekarang
+        threshold: Batas regresi relatif (0.10 = 10% lebih lambat/boros)
+
+    Returns:
+        Daftar pesan regresi (kosong jika tidak ada regresi)
+    """
+    regressions = []
+    for name, current_stats in current['results'].items():
+        base_stats = baseline['results'].get(name)
+        if not base_stats:
+            continue
+
+        base_rate = base_stats['items_per_second']
+        if base_rate and current_stats['items_per_second'] < base_rate * (1 - threshold):
+            change = (current_stats['items_per_second'] / base_rate - 1) * 100
+            regressions.append(f"{name}: throughput turun {change:.1f}%")
+
+        for metric in ('p95_us', 'peak_memory_kb'):
+            base_value = base_stats.get(metric)
+            if base_value and current_stats.get(metric) and current_stats[metric] > base_value * (1 + threshold):
+                change = (current_stats[metric] / base_value - 1) * 100
+                regressions.append(f"{name}: {metric} naik {change:.1f}%")
+    return regressions
+
+
+def _format_us(value: Optional[float], width: int) -> str:
+    return f"{value:{width}.2f}" if value is not None else f"{'-':>{width}s}"
+
+
+def format_stats(stats: List[BenchmarkStats]) -> str:
+    """Format hasil benchmark sebagai tabel teks"""
+    header = f"{'benchmark':36s} {'items/s':>12s} {'p50 us':>9s} {'p95 us':>9s} {'p99 us':>9s} {'max us':>10s} {'peak KB':>10s}"
+    lines = [header, '-' * len(header)]
+    for item in stats:
+        lines.append(
+            f"{item.name:36s} {item.items_per_second:12.0f} {item.p50_us:9.2f} {_format_us(item.p95_us, 9)} "
+            f"{_format_us(item.p99_us, 9)} {item.max_us:10.2f} {item.peak_memory_kb:10.1f}"
+        )
+    return '\n'.join(lines)
+
+
+def format_thread_stats(stats: List[ThreadScalingStats]) -> str:
+    """Format hasil scaling thread sebagai tabel teks"""
+    header = f"{'threads':>8s} {'items/s':>12s} {'speedup':>8s}"
+    lines = [f"GIL aktif: {'ya' if gil_enabled() else 'tidak'}", header, '-' * len(header)]
+    for item in stats:
+        lines.append(f"{item.threads:8d} {item.items_per_second:12.0f} {item.speedup:8.2f}")
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point CLI benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark commit validator')
+    parser.add_argument('--seed', type=int, default=42, help='Seed corpus (default: 42)')
+    parser.add_argument('--size', type=int, default=5000, help='Jumlah title (default: 5000)')
+    parser.add_argument('--invalid-ratio', type=float, default=0.3, help='Proporsi title invalid (default: 0.3)')
+    parser.add_argument('--duplicate-ratio', type=float, default=0.0,
+                        help='Proporsi title berulang seperti merge/revert/bot (default: 0.0)')
+    parser.add_argument('--body-lines', type=int, default=40, help='Maksimum baris per deskripsi (default: 40)')
+    parser.add_argument('--repeat', type=int, default=3, help='Jumlah pengulangan (default: 3)')
+    parser.add_argument('--save', metavar='PATH', help='Simpan hasil sebagai baseline JSON')
+    parser.add_argument('--compare', metavar='PATH', help='Bandingkan dengan baseline JSON')
+    parser.add_argument('--threshold', type=float, default=0.10, help='Batas regresi relatif (default: 0.10)')
+    parser.add_argument('--serialization', action='store_true',
+                        help='Ukur juga serialisasi JSONL/binary vs asdict + json.dumps')
+    parser.add_argument('--threads', metavar='N,N,...',
+                        help='Ukur scaling validator bersama untuk jumlah thread ini (contoh: 1,2,4,8)')
+    args = parser.parse_args(argv)
+
+    corpus = generate_corpus(args.seed, args.size, args.invalid_ratio, body_lines=args.body_lines,
+                             duplicate_ratio=args.duplicate_ratio)
+    stats = run_benchmarks(corpus, args.repeat)
+    serialized_bytes = None
+    if args.serialization:
+        serialization_stats, serialized_bytes = run_serialization_benchmarks(corpus, args.repeat)
+        stats.extend(serialization_stats)
+    thread_stats = None
+    if args.threads:
+        thread_counts = [int(count) for count in args.threads.split(',')]
+        thread_stats = measure_thread_scaling(corpus.titles, thread_counts, args.repeat)
+    report = build_report(corpus, stats, thread_stats, serialized_bytes)
+    print(format_stats(stats))
+    if serialized_bytes:
+        print()
+        for name, size in serialized_bytes.items():
+            print(f"{name:16s} {size:12d} byte")
+    if thread_stats:
+        print()
+        print(format_thread_stats(thread_stats))
+
+    if args.save:
+        save_report(report, args.save)
+        print(f"\nBaseline disimpan ke {args.save}")
+
+    if args.compare:
+        regressions = compare_reports(load_report(args.compare), report, args.threshold)
+        if regressions:
+            print("\nRegresi terdeteksi:")
+            for message in regressions:
+                print(f"  - {message}")
+            return 1
+        print("\nTidak ada regresi dibanding baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,147 @@
+import copy
+import os
+import tempfile
+import unittest
+from commit_validator import validate_commit_title, validate_commit_titles_batch
+from commit_validator_bench import (
+    INVALID_KINDS,
+    CorpusGenerator,
+    build_report,
+    compare_reports,
+    format_stats,
+    generate_corpus,
+    load_report,
+    measure_batch,
+    measure_thread_scaling,
+    run_benchmarks,
+    run_serialization_benchmarks,
+    save_report,
+)
+
+
+class TestCorpusGenerator(unittest.TestCase):
+    """Test untuk generator corpus sintetis"""
+    
+    def test_same_seed_same_corpus(self):
+        """Test seed yang sama menghasilkan corpus identik"""
+        first = generate_corpus(seed=7, size=200)
+        second = generate_corpus(seed=7, size=200)
+        
+        self.assertEqual(first.titles, second.titles)
+        self.assertEqual(first.descriptions, second.descriptions)
+    
+    def test_different_seed_different_corpus(self):
+        """Test seed berbeda menghasilkan corpus berbeda"""
+        self.assertNotEqual(generate_corpus(seed=1, size=50).titles,
+                            generate_corpus(seed=2, size=50).titles)
+    
+    def test_valid_titles_are_valid(self):
+        """Test title valid dari generator lolos validasi"""
+        generator = CorpusGenerator(3)
+        for _ in range(100):
+            title = generator.valid_title()
+            self.assertTrue(validate_commit_title(title).is_valid, title)
+    
+    def test_invalid_kinds_are_invalid(self):
+        """Test semua jenis title invalid (termasuk adversarial) gagal validasi"""
+        generator = CorpusGenerator(3)
+        for kind in INVALID_KINDS:
+            title = generator.invalid_title(kind)
+            self.assertFalse(validate_commit_title(title).is_valid, f"{kind}: {title!r}")
+    
+    def test_invalid_ratio(self):
+        """Test proporsi title invalid mendekati invalid_ratio"""
+        corpus = generate_corpus(seed=11, size=2000, invalid_ratio=0.25)
+        invalid = sum(not validate_commit_title(title).is_valid for title in corpus.titles)
+        
+        self.assertAlmostEqual(invalid / len(corpus.titles), 0.25, delta=0.05)
+    
+    def test_duplicate_ratio(self):
+        """Test corpus dengan title berulang"""
+        corpus = generate_corpus(seed=11, size=2000, duplicate_ratio=0.6)
+        distinct = len(set(corpus.titles))
+        
+        self.assertAlmostEqual(1 - distinct / len(corpus.titles), 0.6, delta=0.05)
+    
+    def test_zero_duplicate_ratio_keeps_corpus(self):
+        """Test duplicate_ratio=0 tidak mengubah corpus untuk seed yang sama"""
+        self.assertEqual(generate_corpus(seed=7, size=100).titles,
+                         generate_corpus(seed=7, size=100, duplicate_ratio=0.0).titles)
+
+
+class TestBenchmarkReport(unittest.TestCase):
+    """Test untuk pengukuran dan baseline JSON"""
+    
+    def setUp(self):
+        self.corpus = generate_corpus(seed=5, size=50, body_lines=10)
+        self.report = build_report(self.corpus, run_benchmarks(self.corpus, repeat=1))
+    
+    def test_report_contains_all_benchmarks(self):
+        """Test report berisi semua jalur yang diukur"""
+        self.assertEqual(set(self.report['results']), {
+            'validate_title', 'extract_references', 'validate_title[fast]', 'extract_references[fast]',
+            'validate_commit_titles_batch', 'validate_commit_titles_deduplicated',
+            'extract_reference_data_batch',
+        })
+        for stats in self.report['results'].values():
+            self.assertGreater(stats['items_per_second'], 0)
+            self.assertGreater(stats['peak_memory_kb'], 0)
+        # 50 sampel per item: cukup untuk p95, belum cukup untuk p99
+        per_item = self.report['results']['validate_title']
+        self.assertLessEqual(per_item['p50_us'], per_item['p95_us'])
+        self.assertLessEqual(per_item['p95_us'], per_item['max_us'])
+        self.assertIsNone(per_item['p99_us'])
+    
+    def test_batch_percentiles_need_enough_samples(self):
+        """Test p95/p99 jalur batch tidak dilaporkan dari sampel yang terlalu sedikit"""
+        titles = self.corpus.titles
+        few = measure_batch('batch', validate_commit_titles_batch, titles, repeat=3)
+        some = measure_batch('batch', validate_commit_titles_batch, titles, repeat=20)
+        
+        self.assertIsNone(few.p95_us)
+        self.assertIsNone(few.p99_us)
+        self.assertIsNotNone(some.p95_us)
+        self.assertIsNone(some.p99_us)
+        self.assertIn(' - ', format_stats([few]))
+    
+    def test_save_and_compare_baseline(self):
+        """Test baseline disimpan dan tidak ada regresi terhadap dirinya sendiri"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baselines', 'baseline.json')
+            save_report(self.report, path)
+            baseline = load_report(path)
+        
+        self.assertEqual(baseline['meta']['seed'], 5)
+        self.assertEqual(compare_reports(baseline, self.report), [])
+    
+    def test_compare_detects_regression(self):
+        """Test regresi throughput terdeteksi"""
+        slower = copy.deepcopy(self.report)
+        slower['results']['validate_title']['items_per_second'] /= 2
+        
+        regressions = compare_reports(self.report, slower)
+        self.assertTrue(any('validate_title' in message for message in regressions))
+    
+    def test_thread_scaling(self):
+        """Test pengukuran scaling thread dan penyimpanannya di report"""
+        thread_stats = measure_thread_scaling(self.corpus.titles, (1, 3))
+        report = build_report(self.corpus, [], thread_stats)
+        
+        self.assertEqual([item['threads'] for item in report['threads']], [1, 3])
+        self.assertEqual(report['threads'][0]['speedup'], 1.0)
+        self.assertTrue(all(item['items'] == 50 for item in report['threads']))
+        self.assertIn('gil_enabled', report['meta'])
+    
+    def test_serialization_benchmarks(self):
+        """Test benchmark serialisasi dan ukuran output per format"""
+        stats, sizes = run_serialization_benchmarks(self.corpus, repeat=1)
+        report = build_report(self.corpus, stats, serialized_bytes=sizes)
+        
+        self.assertIn('serialize_binary', report['results'])
+        self.assertIn('deserialize_jsonl', report['results'])
+        self.assertLess(sizes['binary'], sizes['jsonl'])
+        self.assertLessEqual(sizes['jsonl'], sizes['asdict_json'])
+
+
+if __name__ == '__main__':
+    unittest.main()
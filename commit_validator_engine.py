@@ -0,0 +1,213 @@
+"""
+Engine validasi yang bisa dipilih saat runtime
+
+- 'reference': CommitTitleValidator dan ReferenceExtractor apa adanya,
+  menjadi acuan kebenaran
+- 'fast': hasil identik dengan reference, tetapi title dicocokkan dengan
+  parser manual dari belakang (tanpa backtracking regex yang kuadratik pada
+  spasi panjang) dan pencarian referensi dimulai dari "Link:" pertama
+
+Kesetaraan kedua engine diuji dengan differential fuzzing di
+commit_validator_fuzz.py. Engine default bisa diatur lewat environment
+variable COMMIT_VALIDATOR_ENGINE atau set_default_engine().
+
+Contoh:
+    from commit_validator_engine import get_engine
+
+    engine = get_engine('fast')
+    result = engine.validate_title("feat: menambahkan login (Taiga #DATB-1)")
+"""
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+from commit_validator import (
+    CommitTitleValidator,
+    LINK_HINT_RE,
+    ReferenceData,
+    ReferenceExtractor,
+    ValidationResult,
+    _reset_shared,
+)
+
+
+ENGINE_ENV_VAR = 'COMMIT_VALIDATOR_ENGINE'
+
+REFERENCE_ENGINE = 'reference'
+FAST_ENGINE = 'fast'
+
+
+class FastTitleValidator(CommitTitleValidator):
+    """
+    CommitTitleValidator dengan pencocokan TITLE_PATTERN tanpa regex
+
+    Suffix "(Taiga #<PROJECT>-<NOMOR>)" di-parse dari belakang karena posisinya
+    unik (anchored di akhir), lalu bagian tengah harus berbentuk
+    whitespace + ringkasan + whitespace. Kasus langka yang semantiknya rumit
+    (bagian tengah hanya whitespace) diserahkan ke regex reference.
+    """
+
+    def _match_title(self, title: str) -> Optional[Tuple[str, str, str, str]]:
+        if not title.endswith(')'):
+            return None
+
+        # ^([a-z]+):
+        colon = title.find(':')
+        if colon <= 0:
+            return None
+        tipe = title[:colon]
+        if not (tipe.isascii() and tipe.isalpha() and tipe.islower()):
+            return None
+
+        # (\d+)\)$
+        end = len(title) - 1
+        start = end
+        while start > colon and title[start - 1].isdecimal():
+            start -= 1
+        if start == end or title[start - 1] != '-':
+            return None
+        ticket_number = title[start:end]
+
+        # #([A-Z]+)-
+        dash = start - 1
+        start = dash
+        while start > colon and 'A' <= title[start - 1] <= 'Z':
+            start -= 1
+        if start == dash or title[start - 1] != '#':
+            return None
+        project_name = title[start:dash]
+
+        # \(Taiga\s+#
+        hash_index = start - 1
+        start = hash_index
+        while start > colon and title[start - 1].isspace():
+            start -= 1
+        paren = start - len('(Taiga')
+        if start == hash_index or paren <= colon or not title.startswith('(Taiga', paren):
+            return None
+
+        # \s+(.+?)\s+ di antara ':' dan '(Taiga'
+        middle = title[colon + 1:paren]
+        summary = middle.strip()
+        if not summary:
+            return super()._match_title(title)
+        if not middle[0].isspace() or not middle[-1].isspace() or '\n' in summary:
+            return None
+        return tipe, summary, project_name, ticket_number
+
+
+class FastReferenceExtractor(ReferenceExtractor):
+    """
+    ReferenceExtractor yang melewati teks sebelum "Link:" pertama
+
+    Setiap pattern referensi berbentuk "<Jenis>\\s+Link:", sehingga match
+    paling awal tidak mungkin dimulai sebelum "<Jenis>" + whitespace yang
+    mendahului "Link:" pertama. Pencarian pattern lengkap dimulai dari posisi
+    tersebut, dan deskripsi tanpa "Link:" langsung dilewati.
+    """
+
+    # Panjang kata jenis terpanjang ('Documentation')
+    _MAX_KIND_LENGTH = len('Documentation')
+
+    def extract_references(self, description: str) -> ReferenceData:
+        if not description:
+            return ReferenceData()
+
+        hint = LINK_HINT_RE.search(description)
+        if hint is None:
+            return ReferenceData()
+
+        # \s sama dengan str.isspace(), sama seperti yang dipakai rstrip()
+        start = max(0, len(description[:hint.start()].rstrip()) - self._MAX_KIND_LENGTH)
+        return ReferenceData(
+            ticket_link=self._search(self._TICKET_LINK_RE, self._ticket_link_data, description, start),
+            documentation_link=self._search(self._DOCUMENTATION_LINK_RE, self._documentation_link_data,
+                                            description, start),
+            testing_link=self._search(self._TESTING_LINK_RE, self._testing_link_data, description, start),
+        )
+
+    @staticmethod
+    def _search(pattern, build, description: str, start: int) -> Optional[Dict[str, str]]:
+        match = pattern.search(description, start)
+        return build(match) if match else None
+
+
+class ValidationEngine:
+    """Pasangan validator title dan extractor referensi dengan nama"""
+
+    def __init__(self, name: str, validator: CommitTitleValidator, extractor: ReferenceExtractor):
+        self.name = name
+        self.validator = validator
+        self.extractor = extractor
+
+    def validate_title(self, title: str) -> ValidationResult:
+        """Validasi commit/merge request title"""
+        return self.validator.validate_title(title)
+
+    def extract_references(self, description: str) -> ReferenceData:
+        """Ekstrak referensi link dari deskripsi"""
+        return self.extractor.extract_references(description)
+
+    def __repr__(self) -> str:
+        return f"ValidationEngine({self.name!r})"
+
+
+_factories: Dict[str, Callable[[], ValidationEngine]] = {
+    REFERENCE_ENGINE: lambda: ValidationEngine(REFERENCE_ENGINE, CommitTitleValidator(), ReferenceExtractor()),
+    FAST_ENGINE: lambda: ValidationEngine(FAST_ENGINE, FastTitleValidator(), FastReferenceExtractor()),
+}
+_instances: Dict[str, ValidationEngine] = {}
+_default_name: Optional[str] = None
+
+
+def register_engine(name: str, factory: Callable[[], ValidationEngine]) -> None:
+    """Daftarkan engine baru (factory dipanggil sekali, instance dipakai bersama)"""
+    _factories[name] = factory
+    _instances.pop(name, None)
+    reset_engine_cache()
+
+
+def available_engines() -> List[str]:
+    """Nama semua engine yang terdaftar"""
+    return sorted(_factories)
+
+
+def set_default_engine(name: Optional[str]) -> None:
+    """Atur engine default, None berarti kembali ke env var / reference"""
+    global _default_name
+    if name is not None and name not in _factories:
+        raise ValueError(f"Engine '{name}' tidak dikenal, pilihan: {', '.join(available_engines())}")
+    _default_name = name
+    reset_engine_cache()
+
+
+def reset_engine_cache() -> None:
+    """
+    Resolve ulang engine yang dipakai helper bersama di commit_validator
+
+    get_shared_validator(), validate_commit_title(), dan entry point lain
+    menyimpan engine default setelah pemakaian pertama. set_default_engine()
+    dan register_engine() memanggil fungsi ini otomatis, panggil manual
+    setelah mengubah env var COMMIT_VALIDATOR_ENGINE di proses yang berjalan.
+    """
+    _reset_shared()
+
+
+def get_engine(name: Optional[str] = None) -> ValidationEngine:
+    """
+    Ambil engine berdasarkan nama
+
+    Args:
+        name: Nama engine, jika None dipakai default dari set_default_engine(),
+            lalu env var COMMIT_VALIDATOR_ENGINE, lalu 'reference'
+
+    Returns:
+        ValidationEngine (instance bersama, thread-safe)
+    """
+    name = name or _default_name or os.environ.get(ENGINE_ENV_VAR) or REFERENCE_ENGINE
+    engine = _instances.get(name)
+    if engine is None:
+        factory = _factories.get(name)
+        if factory is None:
+            raise ValueError(f"Engine '{name}' tidak dikenal, pilihan: {', '.join(available_engines())}")
+        engine = _instances.setdefault(name, factory())
+    return engine
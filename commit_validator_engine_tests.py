@@ -0,0 +1,226 @@
+import os
+import tempfile
+import unittest
+from dataclasses import asdict
+from unittest import mock
+import commit_validator_engine
+from commit_validator import (
+    CommitTitleValidator,
+    ReferenceExtractor,
+    get_shared_extractor,
+    get_shared_validator,
+    validate_commit_title,
+)
+from commit_validator_bench import generate_corpus
+from commit_validator_engine import (
+    ENGINE_ENV_VAR,
+    FastReferenceExtractor,
+    FastTitleValidator,
+    ValidationEngine,
+    available_engines,
+    get_engine,
+    register_engine,
+    reset_engine_cache,
+    set_default_engine,
+)
+from commit_validator_fuzz import DifferentialFuzzer, InputGenerator, shrink
+from commit_validator_incremental import IncrementalMessageValidator
+from commit_validator_message import MessageValidator
+from commit_validator_rewrite import TitleFixer
+from commit_validator_test_helpers import git
+from commit_validator_watch import RepositoryWatcher
+
+
+# Kasus tepi yang membedakan regex dengan parser manual
+EDGE_TITLES = [
+    "feat: menambahkan fitur login (Taiga #DATB-10353)",
+    "feat: menambahkan login　(Taiga\x1c#DATB-1)",
+    "feat: baris\nbaru (Taiga #DATB-1)",
+    "feat:\n menambahkan login \n(Taiga #DATB-1)",
+    "feat: \n (Taiga #DATB-1)",
+    "feat:   (Taiga #DATB-1)",
+    "feat: x  (Taiga #DATB-1)",
+    "feat: login (Taiga #DATB-٣٤)",
+    "feat: login (Taiga #DATB-1２)",
+    "feat: login (Taiga #DıTB-1)",
+    "feat: login (Taiga #KEY-1)",
+    "feat: (Taiga #A-1) login (Taiga #DATB-1)",
+    "feat: login (Taiga#DATB-1)",
+    "feat: login(Taiga #DATB-1)",
+    "feat:login (Taiga #DATB-1)",
+    "fıx: login user (Taiga #DATB-1)",
+    "Feat: login user (Taiga #DATB-1)",
+    ":  login user (Taiga #DATB-1)",
+    "feat: login user (Taiga #DATB-1) ",
+    "feat: login user (Taiga #DATB-)",
+    "feat: login user (Taiga #-1)",
+    "feat: login user (Taiga #DATB-1))",
+    "feat: login user ((Taiga #DATB-1)",
+]
+
+EDGE_DESCRIPTIONS = [
+    "",
+    "tanpa link",
+    "Ticket Link: [(Taiga #DATB-1)](https://taiga.example.com/1)",
+    "Ticket   \n Link:[(Taiga #datb-1)](http://x)",
+    "Documentation                     Link: [Spec](https://docs)",
+    "Tıcket Link: [(Taiga #A-1)](https://x)\nTeſting Link: [Sheet]",
+    "Testing Link: [a]\nTesting Link: [b](https://b)",
+    "Link: tanpa jenis\nDocumentation Link: [Spec](https://docs)",
+    "Documentation Link: [Spec]\nDocumentation Link: [Spec](https://docs)",
+    "xTesting Link: [Sheet](https://test)",
+]
+
+
+class TestFastEngine(unittest.TestCase):
+    """Test engine fast identik dengan reference"""
+
+    def setUp(self):
+        self.reference = get_engine('reference')
+        self.fast = get_engine('fast')
+
+    def test_edge_titles(self):
+        """Test kasus tepi title"""
+        for title in EDGE_TITLES:
+            with self.subTest(title=title):
+                self.assertEqual(asdict(self.fast.validate_title(title)),
+                                 asdict(self.reference.validate_title(title)))
+
+    def test_edge_descriptions(self):
+        """Test kasus tepi deskripsi"""
+        for description in EDGE_DESCRIPTIONS:
+            with self.subTest(description=description):
+                self.assertEqual(asdict(self.fast.extract_references(description)),
+                                 asdict(self.reference.extract_references(description)))
+
+    def test_benchmark_corpus(self):
+        """Test corpus benchmark (termasuk kasus adversarial)"""
+        corpus = generate_corpus(seed=11, size=500, body_lines=10)
+        for title in corpus.titles:
+            self.assertEqual(asdict(self.fast.validate_title(title)),
+                             asdict(self.reference.validate_title(title)))
+        for description in corpus.descriptions:
+            self.assertEqual(asdict(self.fast.extract_references(description)),
+                             asdict(self.reference.extract_references(description)))
+
+    def test_engine_classes(self):
+        """Test engine fast memakai subclass validator/extractor"""
+        self.assertIsInstance(self.fast.validator, FastTitleValidator)
+        self.assertIsInstance(self.fast.extractor, FastReferenceExtractor)
+        self.assertIs(type(self.reference.validator), CommitTitleValidator)
+
+
+class TestEngineRegistry(unittest.TestCase):
+    """Test registry dan pemilihan engine"""
+
+    def tearDown(self):
+        set_default_engine(None)
+
+    def test_cached_instance(self):
+        """Test instance engine dipakai bersama"""
+        self.assertIs(get_engine('fast'), get_engine('fast'))
+        self.assertIn('reference', available_engines())
+        self.assertIn('fast', available_engines())
+
+    def test_default_from_env(self):
+        """Test engine default dari environment variable"""
+        with mock.patch.dict(os.environ, {ENGINE_ENV_VAR: 'fast'}):
+            self.assertEqual(get_engine().name, 'fast')
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(get_engine().name, 'reference')
+
+    def test_env_selects_engine_for_entry_points(self):
+        """Test env var menentukan engine helper bersama, hook, watch, LSP, dan rewrite"""
+        title = "feat: menambahkan fitur login (Taiga #DATB-10353)"
+        with tempfile.TemporaryDirectory() as repo:
+            git(repo, 'init', '-q')
+            with mock.patch.dict(os.environ, {ENGINE_ENV_VAR: 'fast'}):
+                reset_engine_cache()
+                self.assertIsInstance(get_shared_validator(), FastTitleValidator)
+                self.assertIsInstance(get_shared_extractor(), FastReferenceExtractor)
+                self.assertIsInstance(MessageValidator().validator, FastTitleValidator)
+                self.assertIsInstance(IncrementalMessageValidator().extractor, FastReferenceExtractor)
+                self.assertIsInstance(TitleFixer().validator, FastTitleValidator)
+                self.assertIsInstance(RepositoryWatcher(repo).validator, FastTitleValidator)
+                fast_result = validate_commit_title(title)
+            with mock.patch.dict(os.environ, {}, clear=True):
+                self.assertIsInstance(get_shared_validator(), FastTitleValidator)
+                reset_engine_cache()
+                self.assertNotIsInstance(get_shared_validator(), FastTitleValidator)
+                self.assertIs(get_shared_validator(), get_shared_validator())
+                self.assertNotIsInstance(RepositoryWatcher(repo).extractor, FastReferenceExtractor)
+                self.assertEqual(validate_commit_title(title), fast_result)
+
+    def test_set_default_engine(self):
+        """Test set_default_engine mengalahkan environment variable"""
+        set_default_engine('fast')
+        with mock.patch.dict(os.environ, {ENGINE_ENV_VAR: 'reference'}):
+            self.assertEqual(get_engine().name, 'fast')
+
+    def test_unknown_engine(self):
+        """Test nama engine tidak dikenal"""
+        with self.assertRaises(ValueError):
+            get_engine('tidak-ada')
+        with self.assertRaises(ValueError):
+            set_default_engine('tidak-ada')
+
+    def test_register_engine(self):
+        """Test registrasi engine custom"""
+        with mock.patch.dict(commit_validator_engine._factories), mock.patch.dict(commit_validator_engine._instances):
+            register_engine('custom', lambda: ValidationEngine('custom', FastTitleValidator(), ReferenceExtractor()))
+            self.assertEqual(get_engine('custom').name, 'custom')
+            self.assertIn('custom', available_engines())
+        self.assertNotIn('custom', available_engines())
+
+
+class TestDifferentialFuzzer(unittest.TestCase):
+    """Test harness differential fuzzing"""
+
+    def test_fast_engine_matches_reference(self):
+        """Test fuzzing singkat tanpa mismatch"""
+        self.assertEqual(DifferentialFuzzer(seed=1).run(3000), [])
+
+    def test_detects_broken_engine(self):
+        """Test mismatch ditemukan dan diperkecil"""
+        class BrokenValidator(FastTitleValidator):
+            # Bug sengaja: newline di ringkasan dianggap spasi
+            def _match_title(self, title):
+                return super()._match_title(title.replace('\n', ' '))
+
+        engine = ValidationEngine('broken', BrokenValidator(), FastReferenceExtractor())
+        failures = DifferentialFuzzer(seed=3, engines=[engine]).run(20000, max_failures=1)
+
+        self.assertEqual(len(failures), 1)
+        self.assertEqual(failures[0].kind, 'title')
+        self.assertIn('\n', failures[0].value)
+        self.assertNotEqual(failures[0].expected, failures[0].actual)
+
+    def test_engine_exception_recorded(self):
+        """Test exception dari engine dicatat sebagai mismatch, bukan menghentikan fuzzing"""
+        class CrashingExtractor(FastReferenceExtractor):
+            # Bug sengaja: crash jika ada tab
+            def extract_references(self, description):
+                if description and '\t' in description:
+                    raise IndexError('tab')
+                return super().extract_references(description)
+
+        engine = ValidationEngine('crash', FastTitleValidator(), CrashingExtractor())
+        failures = DifferentialFuzzer(seed=3, engines=[engine]).check_description("Ticket Link:\tx")
+
+        self.assertEqual(len(failures), 1)
+        self.assertEqual(failures[0].value, '\t')
+        self.assertEqual(failures[0].actual, {'exception': "IndexError('tab')"})
+        self.assertEqual(failures[0].expected, asdict(ReferenceExtractor().extract_references('\t')))
+
+    def test_generator_deterministic(self):
+        """Test input yang sama untuk seed yang sama"""
+        first, second = InputGenerator(5), InputGenerator(5)
+        self.assertEqual([first.title() for _ in range(50)], [second.title() for _ in range(50)])
+
+    def test_shrink(self):
+        """Test shrink menghasilkan input minimal"""
+        self.assertEqual(shrink('abcXdefXghi', lambda value: value.count('X') == 2), 'XX')
+
+
+if __name__ == '__main__':
+    unittest.main()
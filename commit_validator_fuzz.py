@@ -0,0 +1,280 @@
+"""
+Differential fuzzing antar engine validasi
+
+Membandingkan hasil engine (default: 'fast') dengan engine 'reference' untuk
+input yang dibangkitkan secara deterministik dari seed:
+- Title dan deskripsi dibangun dari potongan grammar format commit (tipe,
+  ringkasan, referensi Taiga, baris link) plus sampel CorpusGenerator
+- Lalu dimutasi dengan karakter rawan: whitespace Unicode (\\x1c, U+00A0,
+  U+3000), newline, digit non-ASCII, huruf yang cocok case-insensitive
+  dengan ASCII (Kelvin sign, 'ſ', 'ı'), dan tanda baca format
+
+Yang dibandingkan adalah verdict, error, saran, parsed_data, dan semua link
+hasil ekstraksi (lewat dataclasses.asdict). Input yang berbeda diperkecil
+(shrink) sampai minimal sebelum dilaporkan.
+
+Contoh:
+    python commit_validator_fuzz.py --iterations 1000000 --seed 7
+    python commit_validator_fuzz.py --engines fast,custom --iterations 10000
+"""
+import argparse
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+
+from commit_validator import CommitTitleValidator
+from commit_validator_bench import PROJECTS, WORDS, CorpusGenerator
+from commit_validator_engine import FAST_ENGINE, REFERENCE_ENGINE, ValidationEngine, get_engine
+
+
+# Karakter yang sering membedakan regex dengan parser manual
+TRICKY_CHARS = [
+    ' ', '\t', '\n', '\r', '\x0b', '\x0c', '\x1c', '\x1f', '\x85', '\xa0', ' ', '　',
+    '(', ')', '[', ']', '#', '-', ':', '.', '/',
+    '0', '7', '٣', '৩', '１', '²',
+    'A', 'Z', 'a', 'z', 'K', 'ſ', 'ı', 'İ', 'é', '\U0001f600',
+]
+
+TRICKY_FRAGMENTS = [
+    '(Taiga', 'Taiga', '(Taiga #', ' (Taiga #DATB-1)', '#DATB-', '-123)', ': ', '::',
+    'Ticket Link:', 'Documentation Link:', 'Testing Link:', 'Link:', '](', '[(Taiga #A-1)]',
+    'https://', 'http://', 'taiga', 'TICKET', 'ticket link:', 'Teſting Link:',
+    'Ticket\nLink:', 'KEY-1', 'feat', 'fix', 'Feat',
+]
+
+LINK_TEMPLATES = [
+    'Ticket Link: [(Taiga #{project}-{number})](https://taiga.example.com/{number})',
+    'Ticket Link: [(Taiga #{project}-{number})]',
+    'Documentation Link: [{words}](https://docs.example.com/{number})',
+    'Documentation Link: [{words}]',
+    'Testing Link: [{words}](https://test.example.com/{number})',
+    'Testing Link: [{words}]',
+    'Testing Link: []',
+]
+
+
+@dataclass
+class FuzzMismatch:
+    """Input yang menghasilkan output berbeda antar engine"""
+    kind: str
+    engine: str
+    value: str
+    expected: Dict
+    actual: Dict
+
+
+class InputGenerator:
+    """Generator input fuzzing yang deterministik berdasarkan seed"""
+
+    def __init__(self, seed: int = 0):
+        self.random = random.Random(seed)
+        self.corpus = CorpusGenerator(seed)
+
+    def _word(self) -> str:
+        return self.random.choice(WORDS)
+
+    def _whitespace(self) -> str:
+        choices = [' ', ' ', ' ', '  ', '\t', '\xa0', '\x1c', '　', '\n', ' \n ']
+        return ''.join(self.random.choice(choices) for _ in range(self.random.randint(0, 2))) or ' '
+
+    def _project(self) -> str:
+        choice = self.random.random()
+        if choice < 0.7:
+            return self.random.choice(PROJECTS)
+        if choice < 0.85:
+            return self.random.choice(PROJECTS).lower()
+        return self.random.choice(['', 'DıTB', 'KEY', 'A1', 'AB CD', 'ÉT'])
+
+    def _number(self) -> str:
+        choice = self.random.random()
+        if choice < 0.85:
+            return str(self.random.randint(0, 99999))
+        return self.random.choice(['', '٣٤', '1２', '²', '12a', '-1'])
+
+    def _type(self) -> str:
+        choice = self.random.random()
+        if choice < 0.6:
+            return self.random.choice(CommitTitleValidator.ALLOWED_TYPES)
+        if choice < 0.75:
+            return self.random.choice(['feature', 'bug', 'tests', 'document', 'bugfix', 'fea', 'f'])
+        return self.random.choice(['Feat', 'FIX', '', 'fe at', 'fıx', 'ſtyle', 'feat1', 'ét'])
+
+    def grammar_title(self) -> str:
+        """Title dari potongan grammar dengan variasi per komponen"""
+        summary = ' '.join(self._word() for _ in range(self.random.randint(0, 4)))
+        reference = f"(Taiga{self._whitespace()}#{self._project()}-{self._number()})"
+        if self.random.random() < 0.1:
+            reference = self.random.choice(['', '(Taiga)', 'Taiga #DATB-1', '(Taiga #DATB-1', reference * 2])
+        separator = self.random.choice([':', ':', ': ', '::', ' :', ''])
+        return f"{self._type()}{separator}{self._whitespace()}{summary}{self._whitespace()}{reference}"
+
+    def title(self) -> str:
+        """Title acak: grammar atau sampel corpus, lalu dimutasi"""
+        choice = self.random.random()
+        if choice < 0.5:
+            title = self.grammar_title()
+        elif choice < 0.75:
+            title = self.corpus.valid_title()
+        else:
+            title = self.corpus.invalid_title(self.random.choice(
+                ['no_type', 'wrong_type', 'typo_type', 'no_space', 'short_summary', 'lowercase_project',
+                 'no_taiga', 'no_hash', 'unclosed', 'uppercase_type', 'empty']))
+        if self.random.random() < 0.1:
+            title = self._whitespace() + title + self._whitespace()
+        return self.mutate(title)
+
+    def description(self) -> str:
+        """Deskripsi acak berisi baris teks dan link, lalu dimutasi"""
+        lines = []
+        for _ in range(self.random.randint(0, 6)):
+            if self.random.random() < 0.5:
+                lines.append(self.random.choice(LINK_TEMPLATES).format(
+                    project=self._project(), number=self._number(),
+                    words=' '.join(self._word() for _ in range(self.random.randint(0, 3))),
+                ))
+            else:
+                lines.append(' '.join(self._word() for _ in range(self.random.randint(0, 6))))
+        separator = self.random.choice(['\n', '\n', '\n\n', ' ', '\r\n'])
+        return self.mutate(separator.join(lines))
+
+    def mutate(self, value: str) -> str:
+        """Terapkan 0-4 mutasi acak (sisip, hapus, ganti, duplikasi)"""
+        for _ in range(self.random.choice([0, 0, 1, 1, 2, 3, 4])):
+            position = self.random.randint(0, len(value))
+            operation = self.random.random()
+            if operation < 0.35:
+                insert = (self.random.choice(TRICKY_FRAGMENTS) if self.random.random() < 0.3
+                          else self.random.choice(TRICKY_CHARS))
+                value = value[:position] + insert + value[position:]
+            elif operation < 0.6 and value:
+                position = min(position, len(value) - 1)
+                value = value[:position] + value[position + 1:]
+            elif operation < 0.9 and value:
+                position = min(position, len(value) - 1)
+                value = value[:position] + self.random.choice(TRICKY_CHARS) + value[position + 1:]
+            elif value:
+                end = min(len(value), position + self.random.randint(1, 8))
+                value = value[:end] + value[position:end] + value[end:]
+        return value
+
+
+def shrink(value: str, failing: Callable[[str], bool]) -> str:
+    """Perkecil input selama failing(input) masih True (delta debugging sederhana)"""
+    chunk = max(1, len(value) // 2)
+    while chunk >= 1:
+        index = 0
+        changed = False
+        while index < len(value):
+            candidate = value[:index] + value[index + chunk:]
+            if candidate != value and failing(candidate):
+                value = candidate
+                changed = True
+            else:
+                index += chunk
+        if not changed:
+            chunk //= 2
+    return value
+
+
+class DifferentialFuzzer:
+    """Bandingkan engine kandidat dengan engine reference pada input acak"""
+
+    def __init__(self, seed: int = 0, engines: Optional[List[ValidationEngine]] = None,
+                 reference: Optional[ValidationEngine] = None):
+        self.seed = seed
+        self.generator = InputGenerator(seed)
+        self.reference = reference or get_engine(REFERENCE_ENGINE)
+        self.engines = engines if engines is not None else [get_engine(FAST_ENGINE)]
+
+    def _title_output(self, engine: ValidationEngine, title: str) -> Dict:
+        return asdict(engine.validate_title(title))
+
+    def _references_output(self, engine: ValidationEngine, description: str) -> Dict:
+        return asdict(engine.extract_references(description))
+
+    def check_title(self, title: str) -> List[FuzzMismatch]:
+        """Bandingkan hasil validasi title di semua engine"""
+        return self._check('title', title, self._title_output)
+
+    def check_description(self, description: str) -> List[FuzzMismatch]:
+        """Bandingkan hasil ekstraksi referensi di semua engine"""
+        return self._check('references', description, self._references_output)
+
+    def _check(self, kind: str, value: str,
+               output: Callable[[ValidationEngine, str], Dict]) -> List[FuzzMismatch]:
+        def safe_output(engine: ValidationEngine, candidate: str) -> Dict:
+            # Exception dicatat sebagai output supaya input penyebabnya tidak hilang
+            try:
+                return output(engine, candidate)
+            except Exception as error:
+                return {'exception': repr(error)}
+
+        expected = safe_output(self.reference, value)
+        mismatches = []
+        for engine in self.engines:
+            if safe_output(engine, value) == expected:
+                continue
+            minimal = shrink(value, lambda candidate: safe_output(engine, candidate)
+                             != safe_output(self.reference, candidate))
+            mismatches.append(FuzzMismatch(kind, engine.name, minimal,
+                                           safe_output(self.reference, minimal), safe_output(engine, minimal)))
+        return mismatches
+
+    def run(self, iterations: int, max_failures: int = 10,
+            progress: Optional[Callable[[int], None]] = None) -> List[FuzzMismatch]:
+        """
+        Jalankan fuzzing
+
+        Args:
+            iterations: Jumlah pasangan (title, deskripsi) yang diuji
+            max_failures: Berhenti setelah sejumlah mismatch ditemukan
+            progress: Callback opsional, dipanggil setiap 10.000 iterasi
+
+        Returns:
+            Daftar mismatch (kosong jika semua engine identik)
+        """
+        failures: List[FuzzMismatch] = []
+        for iteration in range(1, iterations + 1):
+            failures.extend(self.check_title(self.generator.title()))
+            failures.extend(self.check_description(self.generator.description()))
+            if len(failures) >= max_failures:
+                break
+            if progress is not None and iteration % 10000 == 0:
+                progress(iteration)
+        return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point CLI differential fuzzing"""
+    parser = argparse.ArgumentParser(description='Differential fuzzing engine validasi terhadap reference')
+    parser.add_argument('--iterations', type=int, default=1000000, help='Jumlah iterasi (default: 1000000)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed generator input (default: 0)')
+    parser.add_argument('--engines', default=FAST_ENGINE,
+                        help=f'Engine yang diuji, dipisah koma (default: {FAST_ENGINE})')
+    parser.add_argument('--max-failures', type=int, default=10, help='Berhenti setelah N mismatch (default: 10)')
+    args = parser.parse_args(argv)
+
+    engines = [get_engine(name) for name in args.engines.split(',')]
+    fuzzer = DifferentialFuzzer(args.seed, engines)
+    start = time.perf_counter()
+
+    def progress(iteration: int) -> None:
+        print(f"... {iteration} iterasi ({time.perf_counter() - start:.1f}s)", file=sys.stderr)
+
+    failures = fuzzer.run(args.iterations, args.max_failures, progress)
+    if not failures:
+        print(f"✅ {args.iterations} iterasi, semua engine identik dengan reference "
+              f"({time.perf_counter() - start:.1f}s)")
+        return 0
+
+    for failure in failures:
+        print(f"❌ [{failure.engine}] {failure.kind}: {failure.value!r}")
+        print(f"   reference: {failure.expected}")
+        print(f"   {failure.engine}: {failure.actual}")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
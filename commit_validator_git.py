@@ -0,0 +1,37 @@
+"""
+Helper git plumbing bersama untuk watch mode, audit, dan rewrite
+
+Berisi exception GitError, pemanggil perintah git, dan format record
+`git log` yang dipakai untuk membaca sha beserta commit message lengkap.
+"""
+import subprocess
+from typing import Optional, Tuple
+
+
+# Separator record/field untuk output git log
+RECORD_SEPARATOR = '\x1e'
+FIELD_SEPARATOR = '\x1f'
+
+# Argumen format git log: satu record per commit berisi sha dan message lengkap
+LOG_FORMAT = f'--format={RECORD_SEPARATOR}%H{FIELD_SEPARATOR}%B'
+
+
+class GitError(RuntimeError):
+    """Perintah git gagal"""
+
+
+def run_git(repo: str, *args: str, input_text: Optional[str] = None) -> str:
+    """Jalankan perintah git di repository, GitError jika exit code bukan 0"""
+    process = subprocess.run(
+        ['git', '-C', repo, *args],
+        input=input_text, capture_output=True, text=True, encoding='utf-8', errors='replace',
+    )
+    if process.returncode != 0:
+        raise GitError(f"git {' '.join(args)} gagal: {process.stderr.strip()}")
+    return process.stdout
+
+
+def parse_log_record(record: str) -> Tuple[str, str]:
+    """Pisahkan satu record LOG_FORMAT (tanpa RECORD_SEPARATOR) menjadi (sha, message)"""
+    sha, _, message = record.partition(FIELD_SEPARATOR)
+    return sha, message.rstrip('\n')
@@ -0,0 +1,156 @@
+"""
+Validator inkremental untuk commit message
+
+Dipakai oleh editor/IDE yang memvalidasi di setiap ketikan. State parsing
+disimpan per baris sehingga setiap perubahan hanya memproses baris yang
+tersentuh:
+- Title (baris pertama) hanya divalidasi ulang jika baris pertama berubah
+- Referensi di body diekstrak per baris dan di-cache, posisi link pertama
+  untuk tiap jenis referensi dilacak sehingga tidak perlu scan ulang body
+
+Catatan: referensi dicari per baris, sesuai format standar dimana setiap
+link berada di barisnya sendiri. Referensi yang terpotong ke beberapa baris
+tidak dikenali oleh validator ini.
+"""
+import re
+from typing import List, Optional
+
+from commit_validator import (
+    CommitTitleValidator,
+    LINK_HINT_RE,
+    REFERENCE_FIELDS,
+    ReferenceData,
+    ReferenceExtractor,
+    ValidationResult,
+    get_shared_extractor,
+    get_shared_validator,
+)
+
+
+_EMPTY_REFERENCES = ReferenceData()
+
+# Akhir baris yang dikenal LSP: \r\n, \r, dan \n
+_NEWLINE_RE = re.compile(r'\r\n|\r|\n')
+
+
+class IncrementalMessageValidator:
+    """Validator commit message yang menyimpan state parsing antar perubahan"""
+
+    def __init__(self, text: str = '',
+                 validator: Optional[CommitTitleValidator] = None,
+                 extractor: Optional[ReferenceExtractor] = None):
+        self.validator = validator or get_shared_validator()
+        self.extractor = extractor or get_shared_extractor()
+        self._title: Optional[str] = None
+        self._title_result: Optional[ValidationResult] = None
+        self.set_text(text)
+
+    @property
+    def text(self) -> str:
+        """Teks lengkap commit message"""
+        return '\n'.join(self._lines)
+
+    @property
+    def lines(self) -> List[str]:
+        """Salinan daftar baris commit message"""
+        return list(self._lines)
+
+    def line(self, index: int) -> str:
+        """Isi satu baris"""
+        return self._lines[index]
+
+    @property
+    def title_result(self) -> ValidationResult:
+        """Hasil validasi title (baris pertama)"""
+        return self._title_result
+
+    @property
+    def references(self) -> ReferenceData:
+        """Referensi pertama untuk tiap jenis link di body"""
+        values = {}
+        for name in REFERENCE_FIELDS:
+            index = self._first[name]
+            values[name] = getattr(self._line_refs[index], name) if index is not None else None
+        return ReferenceData(**values)
+
+    def set_text(self, text: str) -> None:
+        """Ganti seluruh isi (full sync), state dibangun ulang"""
+        self._lines = _NEWLINE_RE.split(text)
+        self._line_refs = [_EMPTY_REFERENCES] + [self._extract_line(line) for line in self._lines[1:]]
+        self._first = {name: self._scan_first(name, 1) for name in REFERENCE_FIELDS}
+        self._revalidate_title()
+
+    def append(self, text: str) -> None:
+        """Tambahkan teks di akhir commit message"""
+        last = len(self._lines) - 1
+        self.apply_change(last, len(self._lines[last]), last, len(self._lines[last]), text)
+
+    def apply_change(self, start_line: int, start_character: int,
+                     end_line: int, end_character: int, text: str) -> None:
+        """
+        Ganti teks pada range [start, end) dengan text
+
+        Args:
+            start_line, start_character: Posisi awal (0-based, dalam code point)
+            end_line, end_character: Posisi akhir (eksklusif)
+            text: Teks pengganti (boleh mengandung \n, \r\n, atau \r)
+        """
+        if not (0 <= start_line <= end_line < len(self._lines)):
+            raise ValueError(f"Range baris tidak valid: {start_line}-{end_line} (jumlah baris {len(self._lines)})")
+
+        prefix = self._lines[start_line][:start_character]
+        suffix = self._lines[end_line][end_character:]
+        new_lines = _NEWLINE_RE.split(prefix + text + suffix)
+
+        new_refs = [self._extract_line(line) for line in new_lines]
+        if start_line == 0:
+            new_refs[0] = _EMPTY_REFERENCES
+
+        self._lines[start_line:end_line + 1] = new_lines
+        self._line_refs[start_line:end_line + 1] = new_refs
+
+        new_end = start_line + len(new_lines)
+        delta = len(new_lines) - (end_line - start_line + 1)
+        for name in REFERENCE_FIELDS:
+            self._first[name] = self._update_first(name, self._first[name], start_line,
+                                                   end_line, new_end, delta)
+
+        if start_line == 0:
+            self._revalidate_title()
+
+    def _update_first(self, name: str, first: Optional[int], start_line: int,
+                      end_line: int, new_end: int, delta: int) -> Optional[int]:
+        """Perbarui posisi link pertama setelah baris [start_line, end_line] diganti"""
+        if first is not None and first < start_line:
+            return first
+
+        for index in range(start_line, new_end):
+            if getattr(self._line_refs[index], name) is not None:
+                return index
+
+        if first is None:
+            return None
+        if first > end_line:
+            return first + delta
+        # Baris yang berisi link pertama sudah diubah dan tidak lagi berisi link
+        return self._scan_first(name, new_end)
+
+    def _scan_first(self, name: str, start: int) -> Optional[int]:
+        """Cari baris pertama mulai dari start yang berisi link jenis name"""
+        for index in range(max(start, 1), len(self._line_refs)):
+            if getattr(self._line_refs[index], name) is not None:
+                return index
+        return None
+
+    def _extract_line(self, line: str) -> ReferenceData:
+        """Ekstrak referensi dari satu baris"""
+        if not LINK_HINT_RE.search(line):
+            return _EMPTY_REFERENCES
+        return self.extractor.extract_references(line)
+
+    def _revalidate_title(self) -> None:
+        """Validasi ulang title hanya jika baris pertama berubah"""
+        title = self._lines[0]
+        if title != self._title or self._title_result is None:
+            self._title = title
+            self._title_result = self.validator.validate_title(title)
@@ -0,0 +1,229 @@
+import io
+import json
+import random
+import unittest
+from unittest import mock
+from commit_validator import (
+    CommitTitleValidator,
+    ReferenceData,
+    ReferenceExtractor,
+    validate_commit_title,
+)
+from commit_validator_incremental import IncrementalMessageValidator
+from commit_validator_lsp import CommitMessageLanguageServer, utf16_to_index
+
+
+MESSAGE = """feat: implementasi JWT authentication (Taiga #AUTH-555)
+
+Menambahkan sistem autentikasi menggunakan JWT token
+
+Ticket Link: [(Taiga #AUTH-555)] (https://projects.digitaltelkom.id/project/AUTH/us/555)
+Documentation Link: [API Specs] (https://swagger.io/docs/auth)
+Testing Link: [Test Cases] (https://docs.google.com/spreadsheets/auth-tests)"""
+
+
+def full_references(text):
+    """Referensi hasil ekstraksi penuh per baris body sebagai pembanding"""
+    extractor = ReferenceExtractor()
+    result = ReferenceData()
+    for line in text.split('\n')[1:]:
+        found = extractor.extract_references(line)
+        for name in ('ticket_link', 'documentation_link', 'testing_link'):
+            if getattr(result, name) is None:
+                setattr(result, name, getattr(found, name))
+    return result
+
+
+class TestIncrementalMessageValidator(unittest.TestCase):
+    """Test untuk validator inkremental"""
+    
+    def test_initial_state(self):
+        """Test state awal sama dengan validasi penuh"""
+        document = IncrementalMessageValidator(MESSAGE)
+        
+        self.assertTrue(document.title_result.is_valid)
+        self.assertEqual(document.references, ReferenceExtractor().extract_references(MESSAGE))
+    
+    def test_typing_title_char_by_char(self):
+        """Test mengetik title karakter per karakter"""
+        title = "feat: menambahkan fitur login user (Taiga #DATB-10353)"
+        document = IncrementalMessageValidator()
+        for char in title:
+            document.append(char)
+            self.assertEqual(document.title_result, validate_commit_title(document.text))
+        
+        self.assertTrue(document.title_result.is_valid)
+    
+    def test_body_edit_does_not_revalidate_title(self):
+        """Test perubahan di body tidak memvalidasi ulang title"""
+        document = IncrementalMessageValidator(MESSAGE)
+        with mock.patch.object(CommitTitleValidator, 'validate_title') as validate:
+            document.append("\nbaris tambahan")
+            document.apply_change(2, 0, 2, 0, "Edit: ")
+            validate.assert_not_called()
+    
+    def test_remove_and_restore_first_link(self):
+        """Test link pertama dihapus lalu muncul kembali"""
+        document = IncrementalMessageValidator(MESSAGE + "\nTicket Link: [(Taiga #LATE-1)] (https://late.com)")
+        ticket_line = document.lines.index(
+            "Ticket Link: [(Taiga #AUTH-555)] (https://projects.digitaltelkom.id/project/AUTH/us/555)")
+        
+        document.apply_change(ticket_line, 0, ticket_line, 6, "Tiket")
+        self.assertEqual(document.references.ticket_link['project'], 'LATE')
+        
+        document.apply_change(ticket_line, 0, ticket_line, 5, "Ticket")
+        self.assertEqual(document.references.ticket_link['project'], 'AUTH')
+    
+    def test_random_edits_match_full_validation(self):
+        """Test rangkaian edit acak selalu sama dengan validasi penuh"""
+        rng = random.Random(1234)
+        snippets = ['a', ' ', '\n', 'Ticket Link: [(Taiga #RND-1)] (https://x.com)', 'Testing Link: [t]',
+                    'feat: ', '(Taiga #ABC-12)', '\nDocumentation Link: [D] (https://d.com)\n', '']
+        document = IncrementalMessageValidator(MESSAGE)
+        
+        for _ in range(500):
+            lines = document.lines
+            start_line = rng.randrange(len(lines))
+            end_line = rng.randrange(start_line, min(len(lines), start_line + 3))
+            start_char = rng.randint(0, len(lines[start_line]))
+            end_char = rng.randint(0 if end_line > start_line else start_char, len(lines[end_line]))
+            document.apply_change(start_line, start_char, end_line, end_char, rng.choice(snippets))
+            
+            text = document.text
+            self.assertEqual(document.title_result, validate_commit_title(text.split('\n')[0]))
+            self.assertEqual(document.references, full_references(text))
+    
+    def test_invalid_range(self):
+        """Test range di luar dokumen ditolak"""
+        document = IncrementalMessageValidator("feat: a")
+        with self.assertRaises(ValueError):
+            document.apply_change(3, 0, 3, 0, "x")
+    
+    def test_crlf_line_endings(self):
+        """Test \r\n dan \r dianggap akhir baris, tidak tersisa di title"""
+        title = "feat: menambahkan fitur login (Taiga #DATB-1)"
+        document = IncrementalMessageValidator(title + "\r\n\r\nbody\rTicket Link: [(Taiga #DATB-1)](https://x/1)")
+        
+        self.assertEqual(document.lines, [title, '', 'body', 'Ticket Link: [(Taiga #DATB-1)](https://x/1)'])
+        self.assertTrue(document.title_result.is_valid)
+        self.assertIsNotNone(document.references.ticket_link)
+        
+        document.apply_change(0, len(title), 0, len(title), "\r\nbaris baru")
+        self.assertEqual(document.lines[:2], [title, 'baris baru'])
+
+
+def frame(payload):
+    """Bungkus payload JSON-RPC dengan header Content-Length"""
+    body = json.dumps(payload).encode('utf-8')
+    return f"Content-Length: {len(body)}\r\n\r\n".encode('ascii') + body
+
+
+def read_frames(data):
+    """Pisahkan output server menjadi daftar pesan"""
+    messages = []
+    stream = io.BytesIO(data)
+    server = CommitMessageLanguageServer(stream, io.BytesIO())
+    while True:
+        message = server.read_message()
+        if message is None:
+            return messages
+        messages.append(message)
+
+
+class TestLanguageServer(unittest.TestCase):
+    """Test untuk server LSP lewat stream di memori"""
+    
+    def run_session(self, messages, log=None):
+        reader = io.BytesIO(b''.join(message if isinstance(message, bytes) else frame(message)
+                                     for message in messages))
+        writer = io.BytesIO()
+        exit_code = CommitMessageLanguageServer(reader, writer, log or io.StringIO()).serve()
+        return exit_code, read_frames(writer.getvalue())
+    
+    def test_session_publishes_diagnostics(self):
+        """Test open, change inkremental, dan shutdown"""
+        uri = 'file:///tmp/COMMIT_EDITMSG'
+        exit_code, output = self.run_session([
+            {'jsonrpc': '2.0', 'id': 1, 'method': 'initialize', 'params': {'capabilities': {}}},
+            {'jsonrpc': '2.0', 'method': 'initialized', 'params': {}},
+            {'jsonrpc': '2.0', 'method': 'textDocument/didOpen', 'params': {'textDocument': {
+                'uri': uri, 'languageId': 'git-commit', 'version': 1, 'text': 'feat: add login'}}},
+            {'jsonrpc': '2.0', 'method': 'textDocument/didChange', 'params': {
+                'textDocument': {'uri': uri, 'version': 2},
+                'contentChanges': [{'range': {'start': {'line': 0, 'character': 15},
+                                              'end': {'line': 0, 'character': 15}},
+                                    'text': ' feature (Taiga #DATB-1)'}]}},
+            {'jsonrpc': '2.0', 'id': 2, 'method': 'shutdown'},
+            {'jsonrpc': '2.0', 'method': 'exit'},
+        ])
+        
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(output[0]['result']['capabilities']['textDocumentSync']['change'], 2)
+        
+        diagnostics = [m['params']['diagnostics'] for m in output
+                       if m.get('method') == 'textDocument/publishDiagnostics']
+        self.assertEqual(len(diagnostics), 2)
+        self.assertTrue(any(d['severity'] == 1 and 'Taiga' in d['message'] for d in diagnostics[0]))
+        self.assertEqual(diagnostics[1], [])
+    
+    def test_unknown_request(self):
+        """Test request yang tidak dikenal dibalas error"""
+        exit_code, output = self.run_session([
+            {'jsonrpc': '2.0', 'id': 7, 'method': 'textDocument/hover', 'params': {}},
+        ])
+        
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(output[0]['error']['code'], -32601)
+    
+    def test_out_of_range_edit_keeps_server_running(self):
+        """Test edit di luar dokumen tidak menghentikan server"""
+        uri = 'file:///tmp/COMMIT_EDITMSG'
+        log = io.StringIO()
+        exit_code, output = self.run_session([
+            {'jsonrpc': '2.0', 'method': 'textDocument/didOpen', 'params': {'textDocument': {
+                'uri': uri, 'languageId': 'git-commit', 'version': 1, 'text': 'feat: add login'}}},
+            {'jsonrpc': '2.0', 'method': 'textDocument/didChange', 'params': {
+                'textDocument': {'uri': uri, 'version': 2},
+                'contentChanges': [{'range': {'start': {'line': 9, 'character': 0},
+                                              'end': {'line': 9, 'character': 0}},
+                                    'text': 'x'}]}},
+            {'jsonrpc': '2.0', 'id': 3, 'method': 'initialize', 'params': {'capabilities': {'general': 'utf-8'}}},
+            {'jsonrpc': '2.0', 'method': 'textDocument/didChange', 'params': {
+                'textDocument': {'uri': uri, 'version': 3},
+                'contentChanges': [{'text': 'feat: menambahkan login (Taiga #DATB-1)'}]}},
+            {'jsonrpc': '2.0', 'id': 4, 'method': 'shutdown'},
+            {'jsonrpc': '2.0', 'method': 'exit'},
+        ], log)
+        
+        self.assertEqual(exit_code, 0)
+        self.assertIn('didChange', log.getvalue())
+        self.assertEqual([m['error']['code'] for m in output if 'error' in m], [-32602])
+        diagnostics = [m['params']['diagnostics'] for m in output
+                       if m.get('method') == 'textDocument/publishDiagnostics']
+        self.assertEqual(diagnostics[-1], [])
+    
+    def test_malformed_frames_keep_server_running(self):
+        """Test frame rusak dibalas error tanpa id, frame berikutnya tetap diproses"""
+        exit_code, output = self.run_session([
+            b'Content-Length: 20\r\n\r\n{"jsonrpc": "2.0", "',
+            b'Content-Length: abc\r\n\r\n',
+            [{'jsonrpc': '2.0', 'id': 1, 'method': 'shutdown'}],
+            {'jsonrpc': '2.0', 'id': 2, 'method': 5},
+            {'jsonrpc': '2.0', 'id': 3, 'method': 'shutdown'},
+            {'jsonrpc': '2.0', 'method': 'exit'},
+        ])
+        
+        self.assertEqual(exit_code, 0)
+        self.assertEqual([(m['id'], m['error']['code']) for m in output if 'error' in m],
+                         [(None, -32700), (None, -32700), (None, -32600), (None, -32600)])
+        self.assertEqual(output[-1], {'jsonrpc': '2.0', 'id': 3, 'result': None})
+    
+    def test_utf16_offsets(self):
+        """Test konversi offset UTF-16 untuk karakter di luar BMP"""
+        line = "feat: 😀 emoji"
+        self.assertEqual(utf16_to_index(line, 8), 7)
+        self.assertEqual(utf16_to_index(line, 100), len(line))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,269 @@
+"""
+Language Server Protocol server untuk commit validator
+
+Server berjalan lewat stdio, menerima perubahan dokumen secara inkremental
+(textDocument/didChange dengan range) dan mempublikasikan error validasi
+title sebagai diagnostics. Setiap dokumen disimpan sebagai
+IncrementalMessageValidator sehingga biaya per ketikan tetap kecil walaupun
+body commit message sangat panjang.
+
+Contoh konfigurasi editor:
+    command: python commit_validator_lsp.py
+"""
+import json
+import sys
+from typing import BinaryIO, Dict, List, Optional, TextIO
+
+from commit_validator import ValidationResult
+from commit_validator_incremental import IncrementalMessageValidator
+
+
+SOURCE = 'commit-validator'
+
+SEVERITY_ERROR = 1
+SEVERITY_HINT = 4
+
+# Kode error JSON-RPC
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class MessageError(ValueError):
+    """Frame atau payload JSON-RPC tidak valid, dibalas dengan error tanpa id"""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+def utf16_to_index(line: str, character: int) -> int:
+    """Konversi offset UTF-16 (default LSP) ke index code point Python"""
+    units = 0
+    for index, char in enumerate(line):
+        if units >= character:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(line)
+
+
+def index_to_utf16(line: str, index: int) -> int:
+    """Konversi index code point Python ke offset UTF-16"""
+    return sum(2 if ord(char) > 0xFFFF else 1 for char in line[:index])
+
+
+class CommitMessageLanguageServer:
+    """Server LSP minimal: sinkronisasi dokumen dan publish diagnostics"""
+
+    def __init__(self, reader: BinaryIO, writer: BinaryIO, log: Optional[TextIO] = None):
+        self.reader = reader
+        self.writer = writer
+        self.log = log
+        self.documents: Dict[str, IncrementalMessageValidator] = {}
+        self._published: Dict[str, ValidationResult] = {}
+        self.utf16 = True
+        self.shutdown_requested = False
+
+    def serve(self) -> int:
+        """Loop utama, return exit code sesuai spesifikasi LSP"""
+        while True:
+            try:
+                message = self.read_message()
+            except MessageError as error:
+                self.send({'jsonrpc': '2.0', 'id': None, 'error': {'code': error.code, 'message': str(error)}})
+                continue
+            if message is None:
+                return 1
+            if message.get('method') == 'exit':
+                return 0 if self.shutdown_requested else 1
+            self.handle(message)
+
+    def read_message(self) -> Optional[Dict]:
+        """
+        Baca satu pesan JSON-RPC (header Content-Length + body)
+
+        Returns:
+            Pesan, atau None jika stream berakhir
+
+        Raises:
+            MessageError: Header atau body tidak valid. Header dibaca sampai
+                baris kosong, sehingga pembacaan berikutnya mulai dari frame
+                selanjutnya (body frame dengan Content-Length rusak tidak
+                bisa dilewati karena panjangnya tidak diketahui)
+        """
+        length = None
+        invalid_length = None
+        while True:
+            line = self.reader.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                break
+            name, _, value = line.decode('ascii', 'replace').partition(':')
+            if name.strip().lower() == 'content-length':
+                value = value.strip()
+                if value.isdigit():
+                    length = int(value)
+                else:
+                    invalid_length = value
+        if invalid_length is not None:
+            raise MessageError(PARSE_ERROR, f"Content-Length tidak valid: {invalid_length!r}")
+        if length is None:
+            return None
+
+        body = self.reader.read(length)
+        if len(body) < length:
+            return None
+        try:
+            message = json.loads(body.decode('utf-8'))
+        except ValueError as error:
+            raise MessageError(PARSE_ERROR, f"Body bukan JSON yang valid: {error}")
+        if not isinstance(message, dict) or not isinstance(message.get('method', ''), str):
+            raise MessageError(INVALID_REQUEST, "Pesan harus object JSON-RPC dengan method berupa string")
+        return message
+
+    def send(self, payload: Dict) -> None:
+        """Kirim satu pesan JSON-RPC"""
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.writer.write(f"Content-Length: {len(body)}\r\n\r\n".encode('ascii') + body)
+        self.writer.flush()
+
+    def handle(self, message: Dict) -> None:
+        """Dispatch pesan ke handler sesuai method"""
+        method = message.get('method')
+        params = message.get('params') or {}
+        request_id = message.get('id')
+
+        handler = getattr(self, 'on_' + (method or '').replace('/', '_').replace('$', '_'), None)
+        if handler is None:
+            if request_id is not None:
+                self.send({'jsonrpc': '2.0', 'id': request_id,
+                           'error': {'code': METHOD_NOT_FOUND, 'message': f"Method tidak didukung: {method}"}})
+            return
+
+        try:
+            result = handler(params)
+        except (AttributeError, KeyError, IndexError, TypeError, ValueError) as error:
+            self.fail(method, request_id, INVALID_PARAMS, f"Parameter tidak valid: {error!r}")
+            return
+        except Exception as error:
+            self.fail(method, request_id, INTERNAL_ERROR, f"Error internal: {error!r}")
+            return
+        if request_id is not None:
+            self.send({'jsonrpc': '2.0', 'id': request_id, 'result': result})
+
+    def fail(self, method: Optional[str], request_id, code: int, message: str) -> None:
+        """Balas request dengan error, notifikasi yang gagal hanya dicatat ke log"""
+        if request_id is not None:
+            self.send({'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}})
+            return
+        print(f"{SOURCE}: {method} diabaikan: {message}", file=self.log or sys.stderr)
+
+    def on_initialize(self, params: Dict) -> Dict:
+        """Negosiasi capability, pakai UTF-32 jika client mendukung"""
+        encodings = ((params.get('capabilities') or {}).get('general') or {}).get('positionEncodings') or []
+        self.utf16 = 'utf-32' not in encodings
+        return {
+            'capabilities': {
+                'positionEncoding': 'utf-16' if self.utf16 else 'utf-32',
+                # 2 = Incremental
+                'textDocumentSync': {'openClose': True, 'change': 2},
+            },
+            'serverInfo': {'name': SOURCE},
+        }
+
+    def on_initialized(self, params: Dict) -> None:
+        """Notifikasi setelah initialize, tidak ada yang perlu dilakukan"""
+        return None
+
+    def on_shutdown(self, params: Dict) -> None:
+        """Tandai shutdown, server berhenti saat menerima exit"""
+        self.shutdown_requested = True
+        return None
+
+    def on_textDocument_didOpen(self, params: Dict) -> None:
+        """Buat state validator untuk dokumen yang baru dibuka"""
+        document = params['textDocument']
+        self.documents[document['uri']] = IncrementalMessageValidator(document.get('text', ''))
+        self.publish(document['uri'])
+
+    def on_textDocument_didChange(self, params: Dict) -> None:
+        """Terapkan perubahan inkremental (atau full sync) lalu publish"""
+        uri = params['textDocument']['uri']
+        document = self.documents.get(uri)
+        if document is None:
+            return
+
+        try:
+            for change in params.get('contentChanges', []):
+                change_range = change.get('range')
+                if change_range is None:
+                    document.set_text(change['text'])
+                    continue
+
+                start, end = change_range['start'], change_range['end']
+                start_char, end_char = start['character'], end['character']
+                if self.utf16:
+                    start_char = utf16_to_index(document.line(start['line']), start_char)
+                    end_char = utf16_to_index(document.line(end['line']), end_char)
+                document.apply_change(start['line'], start_char, end['line'], end_char, change['text'])
+        finally:
+            # Perubahan yang sudah diterapkan sebelum error tetap dipublish
+            self.publish(uri)
+
+    def on_textDocument_didClose(self, params: Dict) -> None:
+        """Hapus state dokumen dan bersihkan diagnostics"""
+        uri = params['textDocument']['uri']
+        self.documents.pop(uri, None)
+        self._published.pop(uri, None)
+        self.send_diagnostics(uri, [])
+
+    def publish(self, uri: str) -> None:
+        """Publish diagnostics, dilewati jika hasil validasi title tidak berubah"""
+        document = self.documents[uri]
+        result = document.title_result
+        if self._published.get(uri) is result:
+            return
+        self._published[uri] = result
+        self.send_diagnostics(uri, self.build_diagnostics(document))
+
+    def build_diagnostics(self, document: IncrementalMessageValidator) -> List[Dict]:
+        """Ubah error dan saran validasi title menjadi diagnostics LSP"""
+        result = document.title_result
+        if result.is_valid:
+            return []
+
+        title = document.line(0)
+        end = index_to_utf16(title, len(title)) if self.utf16 else len(title)
+        title_range = {'start': {'line': 0, 'character': 0}, 'end': {'line': 0, 'character': end}}
+
+        diagnostics = [
+            {'range': title_range, 'severity': SEVERITY_ERROR, 'source': SOURCE, 'message': error}
+            for error in result.errors
+        ]
+        diagnostics.extend(
+            {'range': title_range, 'severity': SEVERITY_HINT, 'source': SOURCE, 'message': suggestion}
+            for suggestion in result.suggestions
+        )
+        return diagnostics
+
+    def send_diagnostics(self, uri: str, diagnostics: List[Dict]) -> None:
+        """Kirim notifikasi textDocument/publishDiagnostics"""
+        self.send({
+            'jsonrpc': '2.0',
+            'method': 'textDocument/publishDiagnostics',
+            'params': {'uri': uri, 'diagnostics': diagnostics},
+        })
+
+
+def main() -> int:
+    """Jalankan server di stdio"""
+    server = CommitMessageLanguageServer(sys.stdin.buffer, sys.stdout.buffer)
+    return server.serve()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
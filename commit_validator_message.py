@@ -0,0 +1,363 @@
+"""
+Validasi commit message lengkap (title + body) dalam satu kali baca
+
+Title divalidasi dengan CommitTitleValidator, lalu body dibaca baris per
+baris tanpa memuat seluruh message:
+- Panjang setiap baris (baris yang berisi URL dikecualikan)
+- Baris kedua harus kosong sebagai pemisah title dan body
+- Ticket/Documentation/Testing Link wajib ada (bisa diatur)
+- Ticket Link harus menunjuk ticket yang sama dengan referensi Taiga di title
+
+Ukuran message dan jumlah baris dibatasi oleh MessageLimits. Begitu batas
+terlampaui (atau error terlalu banyak), pembacaan dihentikan, sehingga body
+raksasa yang tidak sengaja di-paste tetap diproses dengan waktu dan memori
+terbatas.
+
+Catatan: referensi dicari per baris (sama seperti validator inkremental),
+link yang terpotong ke beberapa baris tidak dikenali.
+
+Contoh (sebagai hook commit-msg):
+    python commit_validator_message.py "$1"
+"""
+import argparse
+import codecs
+import sys
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from commit_validator import (
+    CommitTitleValidator,
+    LINK_HINT_RE,
+    REFERENCE_FIELDS,
+    ReferenceData,
+    ReferenceExtractor,
+    ValidationResult,
+    get_shared_extractor,
+    get_shared_validator,
+)
+
+
+REFERENCE_LABELS = {
+    'ticket_link': 'Ticket Link',
+    'documentation_link': 'Documentation Link',
+    'testing_link': 'Testing Link',
+}
+
+# Potongan maksimal yang dibaca sekaligus, juga batas isi baris yang diperiksa
+# (baris yang lebih panjang tetap dihitung panjangnya, sisanya dilewati)
+_PIECE_SIZE = 8192
+
+# Baris scissors dari `git commit --verbose`, isi di bawahnya bukan bagian message
+_SCISSORS = ' ------------------------ >8 ------------------------'
+
+
+@dataclass
+class MessageLimits:
+    """Batas ukuran dan aturan body commit message"""
+    max_message_bytes: int = 1024 * 1024
+    max_body_lines: int = 10000
+    max_line_length: Optional[int] = 100
+    max_title_length: Optional[int] = None
+    require_blank_line: bool = True
+    required_references: Tuple[str, ...] = REFERENCE_FIELDS
+    require_matching_ticket: bool = True
+    max_errors: int = 50
+    fail_fast: bool = False
+    # Karakter komentar git (misalnya '#'), baris komentar dilewati
+    comment_char: Optional[str] = None
+
+
+@dataclass
+class MessageValidationResult:
+    """Hasil validasi commit message lengkap"""
+    is_valid: bool
+    errors: List[str]
+    suggestions: List[str]
+    title_result: ValidationResult
+    references: ReferenceData
+    lines: int = 0
+    bytes_read: int = 0
+    complete: bool = True
+
+
+class _MessageScan:
+    """State satu kali validasi, diisi baris demi baris"""
+
+    def __init__(self, limits: MessageLimits, validator: CommitTitleValidator, extractor: ReferenceExtractor):
+        self.limits = limits
+        self.validator = validator
+        self.extractor = extractor
+        self.errors: List[str] = []
+        self.title_result: Optional[ValidationResult] = None
+        self.links: Dict[str, Dict[str, str]] = {}
+        self.lines = 0
+        self.bytes_read = 0
+        self.complete = True
+        self.stopped = False
+
+    def error(self, message: str) -> None:
+        """Catat error, hentikan validasi jika fail_fast atau error terlalu banyak"""
+        self.errors.append(message)
+        if self.limits.fail_fast:
+            self.stop()
+        elif len(self.errors) >= self.limits.max_errors:
+            self.errors.append("Terlalu banyak error, validasi dihentikan")
+            self.stop()
+
+    def stop(self) -> None:
+        self.stopped = True
+        self.complete = False
+
+    def feed(self, line: str, length: int) -> None:
+        """Proses satu baris (line bisa terpotong, length adalah panjang aslinya)"""
+        limits = self.limits
+        if limits.comment_char and line.startswith(limits.comment_char):
+            if line == limits.comment_char + _SCISSORS:
+                self.stopped = True
+            return
+
+        number = self.lines
+        self.lines += 1
+        if line.endswith('\r'):
+            line = line[:-1]
+            length -= 1
+
+        if number == 0:
+            self.feed_title(line, length)
+            return
+
+        if number > limits.max_body_lines:
+            self.error(f"Body melebihi batas {limits.max_body_lines} baris, sisa message tidak diperiksa")
+            self.stop()
+            return
+
+        if number == 1 and limits.require_blank_line and line.strip():
+            self.error("Baris kedua harus kosong sebagai pemisah title dan body")
+            if self.stopped:
+                return
+
+        if limits.max_line_length is not None and length > limits.max_line_length and '://' not in line:
+            self.error(f"Baris {number + 1} terlalu panjang ({length} karakter, maksimal {limits.max_line_length})")
+            if self.stopped:
+                return
+
+        if len(self.links) < len(REFERENCE_FIELDS) and LINK_HINT_RE.search(line):
+            self.feed_references(line)
+
+    def feed_title(self, title: str, length: int) -> None:
+        limits = self.limits
+        if length > len(title):
+            # Title lebih panjang dari potongan baca, tidak mungkin title yang wajar
+            self.title_result = ValidationResult(False, [f"Title terlalu panjang ({length} karakter)"], [])
+            self.errors.extend(self.title_result.errors)
+            self.stop()
+            return
+
+        self.title_result = self.validator.validate_title(title)
+        for error in self.title_result.errors:
+            self.error(error)
+            if self.stopped:
+                return
+        if limits.max_title_length is not None and length > limits.max_title_length:
+            self.error(f"Title terlalu panjang ({length} karakter, maksimal {limits.max_title_length})")
+
+    def feed_references(self, line: str) -> None:
+        references = self.extractor.extract_references(line)
+        for name in REFERENCE_FIELDS:
+            link = getattr(references, name)
+            if link is None or name in self.links:
+                continue
+            self.links[name] = link
+            if name == 'ticket_link':
+                self.check_ticket(link)
+
+    def check_ticket(self, link: Dict[str, str]) -> None:
+        """Ticket Link harus sama dengan referensi Taiga di title"""
+        if not self.limits.require_matching_ticket or not self.title_result or not self.title_result.is_valid:
+            return
+        parsed = self.title_result.parsed_data
+        if (link['project'], link['ticket_number']) != (parsed['project'], parsed['ticket_number']):
+            self.error(f"Ticket Link ({link['display']}) tidak sesuai dengan referensi title "
+                       f"(Taiga #{parsed['project']}-{parsed['ticket_number']})")
+
+    def finish(self) -> MessageValidationResult:
+        if self.title_result is None:
+            self.feed_title('', 0)
+        if self.complete:
+            for name in self.limits.required_references:
+                if name not in self.links:
+                    self.error(f"{REFERENCE_LABELS[name]} tidak ditemukan di body")
+                    if self.stopped:
+                        break
+
+        return MessageValidationResult(
+            is_valid=not self.errors,
+            errors=self.errors,
+            suggestions=list(self.title_result.suggestions),
+            title_result=self.title_result,
+            references=ReferenceData(**{name: self.links.get(name) for name in REFERENCE_FIELDS}),
+            lines=self.lines,
+            bytes_read=self.bytes_read,
+            complete=self.complete,
+        )
+
+
+def _text_pieces(message: str) -> Iterator[Tuple[str, int]]:
+    """Potong string menjadi (potongan, ukuran byte), setiap potongan maksimal satu baris"""
+    position = 0
+    length = len(message)
+    while position < length:
+        end = message.find('\n', position, position + _PIECE_SIZE)
+        end = min(length, position + _PIECE_SIZE) if end < 0 else end + 1
+        piece = message[position:end]
+        yield piece, len(piece.encode('utf-8', 'surrogatepass'))
+        position = end
+
+
+def _stream_pieces(stream: BinaryIO) -> Iterator[Tuple[str, int]]:
+    """Potong stream biner menjadi (potongan, ukuran byte) tanpa membaca seluruh stream"""
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    while True:
+        data = stream.readline(_PIECE_SIZE)
+        if not data:
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                yield tail, 0
+            return
+        yield decoder.decode(data), len(data)
+
+
+class MessageValidator:
+    """Validator commit message lengkap dengan batas ukuran"""
+
+    def __init__(self, limits: Optional[MessageLimits] = None,
+                 validator: Optional[CommitTitleValidator] = None,
+                 extractor: Optional[ReferenceExtractor] = None):
+        self.limits = limits or MessageLimits()
+        self.validator = validator or get_shared_validator()
+        self.extractor = extractor or get_shared_extractor()
+
+    def validate(self, message: str) -> MessageValidationResult:
+        """Validasi commit message dari string"""
+        return self._run(_text_pieces(message or ''))
+
+    def validate_stream(self, stream: BinaryIO) -> MessageValidationResult:
+        """Validasi commit message dari stream biner (file, stdin)"""
+        return self._run(_stream_pieces(stream))
+
+    def validate_file(self, path: str) -> MessageValidationResult:
+        """Validasi commit message dari file (misalnya .git/COMMIT_EDITMSG)"""
+        with open(path, 'rb') as handle:
+            return self.validate_stream(handle)
+
+    def _run(self, pieces: Iterator[Tuple[str, int]]) -> MessageValidationResult:
+        scan = _MessageScan(self.limits, self.validator, self.extractor)
+        max_bytes = self.limits.max_message_bytes
+        parts: List[str] = []
+        kept = 0
+        length = 0
+
+        for piece, size in pieces:
+            scan.bytes_read += size
+            if scan.bytes_read > max_bytes:
+                scan.error(f"Commit message melebihi batas {max_bytes} byte, sisa message tidak diperiksa")
+                scan.stop()
+                break
+
+            ends = piece.endswith('\n')
+            content = piece[:-1] if ends else piece
+            length += len(content)
+            if kept < _PIECE_SIZE:
+                parts.append(content[:_PIECE_SIZE - kept])
+                kept += len(parts[-1])
+            if not ends:
+                continue
+
+            scan.feed(''.join(parts), length)
+            parts, kept, length = [], 0, 0
+            if scan.stopped:
+                break
+        else:
+            if parts or length:
+                scan.feed(''.join(parts), length)
+
+        return scan.finish()
+
+
+def validate_commit_message(message: str, limits: Optional[MessageLimits] = None) -> MessageValidationResult:
+    """
+    Fungsi helper untuk validasi commit message lengkap
+
+    Args:
+        message: Commit message (title, baris kosong, body)
+        limits: Batas dan aturan body (default: MessageLimits())
+
+    Returns:
+        MessageValidationResult
+    """
+    return MessageValidator(limits).validate(message)
+
+
+def print_result(result: MessageValidationResult) -> None:
+    """Tampilkan hasil validasi commit message"""
+    if result.is_valid:
+        print("✅ Commit message valid")
+        return
+    print("❌ Commit message tidak valid:")
+    for error in result.errors:
+        print(f"   - {error}")
+    if result.suggestions:
+        print("💡 Saran:")
+        for suggestion in result.suggestions:
+            print(f"   - {suggestion}")
+    if not result.complete:
+        print(f"⚠️ Validasi berhenti di baris {result.lines} ({result.bytes_read} byte)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point CLI (bisa dipakai sebagai hook commit-msg)"""
+    defaults = MessageLimits()
+    parser = argparse.ArgumentParser(description='Validasi commit message lengkap (title + body)')
+    parser.add_argument('file', nargs='?', default='-', help='File commit message, - untuk stdin (default: -)')
+    parser.add_argument('--max-bytes', type=int, default=defaults.max_message_bytes,
+                        help=f'Ukuran maksimal message (default: {defaults.max_message_bytes})')
+    parser.add_argument('--max-body-lines', type=int, default=defaults.max_body_lines,
+                        help=f'Jumlah baris body maksimal (default: {defaults.max_body_lines})')
+    parser.add_argument('--max-line-length', type=int, default=defaults.max_line_length,
+                        help=f'Panjang baris body maksimal, 0 = tanpa batas (default: {defaults.max_line_length})')
+    parser.add_argument('--max-title-length', type=int, default=0, help='Panjang title maksimal, 0 = tanpa batas')
+    parser.add_argument('--require', default=','.join(defaults.required_references),
+                        help='Link yang wajib ada, dipisah koma (kosong = tidak ada)')
+    parser.add_argument('--no-ticket-match', action='store_true',
+                        help='Jangan cek kesesuaian Ticket Link dengan title')
+    parser.add_argument('--fail-fast', action='store_true', help='Berhenti di error pertama')
+    parser.add_argument('--comment-char', default='#', help="Karakter komentar git (default: '#')")
+    args = parser.parse_args(argv)
+
+    required = tuple(name for name in args.require.split(',') if name)
+    unknown = [name for name in required if name not in REFERENCE_FIELDS]
+    if unknown:
+        parser.error(f"Link tidak dikenal: {', '.join(unknown)} (pilihan: {', '.join(REFERENCE_FIELDS)})")
+
+    limits = MessageLimits(
+        max_message_bytes=args.max_bytes,
+        max_body_lines=args.max_body_lines,
+        max_line_length=args.max_line_length or None,
+        max_title_length=args.max_title_length or None,
+        required_references=required,
+        require_matching_ticket=not args.no_ticket_match,
+        fail_fast=args.fail_fast,
+        comment_char=args.comment_char or None,
+    )
+    validator = MessageValidator(limits)
+    if args.file == '-':
+        result = validator.validate_stream(sys.stdin.buffer)
+    else:
+        result = validator.validate_file(args.file)
+
+    print_result(result)
+    return 0 if result.is_valid else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
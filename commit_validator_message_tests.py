@@ -0,0 +1,174 @@
+import io
+import os
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+from commit_validator_message import (
+    MessageLimits,
+    MessageValidator,
+    main,
+    validate_commit_message,
+)
+
+
+TITLE = "feat: menambahkan fitur login user (Taiga #DATB-10353)"
+
+BODY = (
+    "Menambahkan halaman login dan validasi password.\n"
+    "\n"
+    "Ticket Link: [(Taiga #DATB-10353)](https://taiga.example.com/project/datb/us/10353)\n"
+    "Documentation Link: [Spec Login](https://docs.example.com/login)\n"
+    "Testing Link: [Sheet QA](https://sheets.example.com/qa)\n"
+)
+
+MESSAGE = f"{TITLE}\n\n{BODY}"
+
+
+class TestMessageValidator(unittest.TestCase):
+    """Test validasi commit message lengkap"""
+
+    def test_valid_message(self):
+        """Test message lengkap dengan semua link"""
+        result = validate_commit_message(MESSAGE)
+
+        self.assertTrue(result.is_valid, result.errors)
+        self.assertTrue(result.complete)
+        self.assertEqual(result.references.ticket_link['display'], 'Taiga #DATB-10353')
+        self.assertEqual(result.references.testing_link['name'], 'Sheet QA')
+        self.assertEqual(result.lines, 7)
+        self.assertEqual(result.bytes_read, len(MESSAGE.encode('utf-8')))
+
+    def test_invalid_title_reported_with_suggestions(self):
+        """Test error dan saran title ikut dilaporkan"""
+        result = validate_commit_message(f"Add login #DATB-10353\n\n{BODY}")
+
+        self.assertFalse(result.is_valid)
+        self.assertFalse(result.title_result.is_valid)
+        self.assertEqual(result.errors, result.title_result.errors)
+        self.assertTrue(result.suggestions)
+
+    def test_ticket_mismatch(self):
+        """Test Ticket Link harus sama dengan referensi title"""
+        result = validate_commit_message(MESSAGE.replace('Taiga #DATB-10353)]', 'Taiga #PROJ-1)]'))
+
+        self.assertEqual(result.errors, [
+            "Ticket Link (Taiga #PROJ-1) tidak sesuai dengan referensi title (Taiga #DATB-10353)",
+        ])
+
+        limits = MessageLimits(require_matching_ticket=False)
+        self.assertTrue(MessageValidator(limits).validate(
+            MESSAGE.replace('Taiga #DATB-10353)]', 'Taiga #PROJ-1)]')).is_valid)
+
+    def test_missing_references_and_blank_line(self):
+        """Test link wajib dan baris pemisah"""
+        result = validate_commit_message(f"{TITLE}\nlangsung body tanpa baris kosong\n")
+
+        self.assertEqual(result.errors, [
+            "Baris kedua harus kosong sebagai pemisah title dan body",
+            "Ticket Link tidak ditemukan di body",
+            "Documentation Link tidak ditemukan di body",
+            "Testing Link tidak ditemukan di body",
+        ])
+
+        limits = MessageLimits(required_references=('ticket_link',), require_blank_line=False)
+        result = MessageValidator(limits).validate(f"{TITLE}\nTicket Link: [(Taiga #DATB-10353)](https://x)")
+        self.assertTrue(result.is_valid, result.errors)
+
+    def test_line_length(self):
+        """Test baris terlalu panjang, baris berisi URL dikecualikan"""
+        long_line = 'a' * 120
+        long_url = 'Lihat https://example.com/' + 'b' * 120
+        result = validate_commit_message(f"{MESSAGE}{long_line}\r\n{long_url}\n")
+
+        self.assertEqual(result.errors, ["Baris 8 terlalu panjang (120 karakter, maksimal 100)"])
+        self.assertTrue(MessageValidator(MessageLimits(max_line_length=None)).validate(
+            f"{MESSAGE}{long_line}").is_valid)
+
+    def test_fail_fast_and_max_errors(self):
+        """Test validasi berhenti di error pertama atau saat error terlalu banyak"""
+        message = "add login\nbody\n" + "x" * 200 + "\n"
+        result = MessageValidator(MessageLimits(fail_fast=True)).validate(message)
+
+        self.assertEqual(len(result.errors), 1)
+        self.assertFalse(result.complete)
+        self.assertEqual(result.lines, 1)
+
+        result = MessageValidator(MessageLimits(max_errors=3)).validate(
+            TITLE + "\n\n" + ("x" * 200 + "\n") * 10)
+        self.assertEqual(len(result.errors), 4)
+        self.assertEqual(result.errors[-1], "Terlalu banyak error, validasi dihentikan")
+        self.assertFalse(result.complete)
+
+    def test_missing_references_respect_error_limits(self):
+        """Test error link wajib juga tunduk pada fail_fast dan max_errors"""
+        message = f"{TITLE}\n\nbody tanpa link\n"
+        result = MessageValidator(MessageLimits(fail_fast=True)).validate(message)
+        self.assertEqual(result.errors, ["Ticket Link tidak ditemukan di body"])
+
+        result = MessageValidator(MessageLimits(max_errors=2)).validate(message)
+        self.assertEqual(result.errors, [
+            "Ticket Link tidak ditemukan di body",
+            "Documentation Link tidak ditemukan di body",
+            "Terlalu banyak error, validasi dihentikan",
+        ])
+
+    def test_size_limits_stop_reading(self):
+        """Test body raksasa dihentikan di batas ukuran dan jumlah baris"""
+        huge = f"{TITLE}\n\n" + "a" * 50_000_000
+        started = time.perf_counter()
+        result = validate_commit_message(huge)
+
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertFalse(result.complete)
+        self.assertEqual(result.errors, ["Commit message melebihi batas 1048576 byte, sisa message tidak diperiksa"])
+        self.assertLessEqual(result.bytes_read, 1024 * 1024 + 8192)
+
+        result = MessageValidator(MessageLimits(max_body_lines=5)).validate(MESSAGE + "baris\n" * 100)
+        self.assertEqual(result.errors, ["Body melebihi batas 5 baris, sisa message tidak diperiksa"])
+        self.assertEqual(result.lines, 7)
+
+    def test_stream_matches_string(self):
+        """Test validasi dari stream biner sama dengan dari string"""
+        validator = MessageValidator()
+        for message in (MESSAGE, MESSAGE + "é" * 9000 + "\n", "add login", ""):
+            expected = validator.validate(message)
+            actual = validator.validate_stream(io.BytesIO(message.encode('utf-8')))
+            self.assertEqual(actual, expected, repr(message[:40]))
+
+    def test_empty_message(self):
+        """Test message kosong"""
+        result = validate_commit_message("")
+
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.errors[0], "Title tidak boleh kosong")
+
+    def test_git_comments_and_scissors(self):
+        """Test baris komentar git dan isi di bawah scissors dilewati"""
+        message = (
+            f"# komentar template\n{TITLE}\n\n{BODY}"
+            "# Please enter the commit message for your changes.\n"
+            "# ------------------------ >8 ------------------------\n"
+            "diff --git a/x b/x\n" + "+" * 500 + "\n"
+        )
+        result = MessageValidator(MessageLimits(comment_char='#')).validate(message)
+
+        self.assertTrue(result.is_valid, result.errors)
+        self.assertTrue(result.complete)
+
+    def test_cli_hook(self):
+        """Test CLI sebagai hook commit-msg"""
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, 'COMMIT_EDITMSG')
+            with open(path, 'w', encoding='utf-8') as handle:
+                handle.write(MESSAGE)
+
+            with redirect_stdout(io.StringIO()) as output:
+                self.assertEqual(main([path]), 0)
+                self.assertEqual(main([path, '--max-line-length', '40']), 1)
+                self.assertEqual(main([path, '--max-line-length', '40', '--require', '']), 1)
+            self.assertIn('terlalu panjang', output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,452 @@
+"""
+Perbaikan title commit lama lewat stream git fast-export / fast-import
+
+Stream fast-export dibaca sekali dari awal sampai akhir. Title commit yang
+tidak valid diganti dengan "Saran perbaikan" dari CommitTitleValidator jika
+confidence saran tersebut mencapai threshold, bagian lain stream (blob,
+header commit, body message, tag) disalin apa adanya. Isi blob disalin per
+potongan tanpa dimuat utuh, sehingga memori tetap konstan berapa pun ukuran
+history.
+
+Commit yang message-nya tidak berubah (dan semua parent-nya juga tidak
+berubah) mendapat sha yang sama setelah di-import ulang. fast-export tidak
+bisa mempertahankan signature commit (header gpgsig), sehingga rewrite
+repository dibatalkan jika ada commit atau tag bertanda tangan, kecuali
+signature-nya dibuang secara eksplisit (--strip-signed-commits dan
+--strip-signed-tags).
+
+Contoh:
+    # Laporan saja, repository tidak diubah
+    python commit_validator_rewrite.py --repo /path/ke/repo --dry-run --report fixes.jsonl
+
+    # Tulis ulang seluruh history
+    python commit_validator_rewrite.py --repo /path/ke/repo --threshold 0.8
+
+    # Sebagai filter di pipeline sendiri
+    git fast-export --all --show-original-ids | python commit_validator_rewrite.py | git fast-import --force
+"""
+import argparse
+import contextlib
+import json
+import subprocess
+import sys
+import tempfile
+from dataclasses import asdict, dataclass, field
+from typing import BinaryIO, List, Optional, Sequence, TextIO
+
+from commit_validator import CommitTitleValidator, get_shared_validator
+from commit_validator_git import GitError
+
+
+DEFAULT_THRESHOLD = 0.8
+
+SUGGESTION_PREFIX = 'Saran perbaikan: '
+
+# Ringkasan pengganti di _generate_suggestions saat ringkasan tidak ditemukan
+PLACEHOLDER_SUMMARY = 'tambahkan deskripsi perubahan'
+
+# Message lebih besar dari ini disalin apa adanya (tidak dimuat ke memori)
+MAX_MESSAGE_BYTES = 1024 * 1024
+
+_COPY_SIZE = 1 << 16
+
+
+class RewriteError(ValueError):
+    """Stream fast-export tidak bisa diproses"""
+
+
+@dataclass
+class TitleFix:
+    """Saran perbaikan untuk satu title yang tidak valid"""
+    title: str
+    suggested: Optional[str]
+    confidence: float
+    reasons: List[str] = field(default_factory=list)
+
+
+@dataclass
+class RewriteStats:
+    """Ringkasan satu kali rewrite"""
+    commits: int = 0
+    valid: int = 0
+    invalid: int = 0
+    fixed: int = 0
+    skipped: int = 0
+    dry_run: bool = False
+
+
+class TitleFixer:
+    """Menilai seberapa aman "Saran perbaikan" dipakai otomatis"""
+
+    def __init__(self, validator: Optional[CommitTitleValidator] = None):
+        self.validator = validator or get_shared_validator()
+
+    def suggest(self, title: str) -> Optional[TitleFix]:
+        """
+        Saran perbaikan beserta confidence (0.0 - 1.0)
+
+        Args:
+            title: Title commit
+
+        Returns:
+            TitleFix, atau None jika title sudah valid
+        """
+        result = self.validator.validate_title(title)
+        if result.is_valid:
+            return None
+
+        suggested = next((suggestion[len(SUGGESTION_PREFIX):] for suggestion in result.suggestions
+                          if suggestion.startswith(SUGGESTION_PREFIX)), None)
+        if suggested is None:
+            return TitleFix(title, None, 0.0, ["Tidak ada saran perbaikan untuk title ini"])
+
+        fix = TitleFix(title, suggested, 1.0)
+        check = self.validator.validate_title(suggested)
+        if not check.is_valid:
+            fix.confidence = 0.0
+            fix.reasons.append(f"Saran perbaikan masih tidak valid: {check.errors[0]}")
+            return fix
+
+        tipe, summary, project, ticket = self.validator._match_title(suggested)
+        if summary == PLACEHOLDER_SUMMARY:
+            fix.confidence = 0.0
+            fix.reasons.append("Ringkasan tidak ditemukan di title")
+            return fix
+
+        self._score_type(fix, title, tipe)
+        self._score_ticket(fix, title, project, ticket)
+        if any(char in summary for char in '()#'):
+            fix.confidence *= 0.5
+            fix.reasons.append("Ringkasan berisi sisa referensi")
+
+        fix.confidence = round(fix.confidence, 4)
+        return fix
+
+    def _score_type(self, fix: TitleFix, title: str, tipe: str) -> None:
+        match = self.validator._TYPE_PREFIX_RE.match(title.strip().lower())
+        if match is None:
+            fix.confidence *= 0.3
+            fix.reasons.append(f"Tipe tidak ditemukan di awal title, dipakai '{tipe}'")
+            return
+        word = match.group(1)
+        if word == tipe:
+            return
+        if word in self.validator.TYPO_MAP:
+            fix.confidence *= 0.9
+            fix.reasons.append(f"Tipe '{word}' diganti menjadi '{tipe}'")
+        elif self.validator._find_closest_type(word) == tipe:
+            fix.confidence *= 0.8 if len(word) >= 3 else 0.4
+            fix.reasons.append(f"Tipe '{word}' dianggap '{tipe}'")
+        else:
+            fix.confidence *= 0.3
+            fix.reasons.append(f"Tipe '{word}' tidak dikenali, dipakai '{tipe}'")
+
+    def _score_ticket(self, fix: TitleFix, title: str, project: str, ticket: str) -> None:
+        if f"#{project}-{ticket}" not in title:
+            fix.confidence *= 0.5
+            fix.reasons.append(f"Ticket {project}-{ticket} ditebak dari title tanpa format #<Project>-<Nomor>")
+        candidates = set(self.validator._LOOSE_TICKET_RE.findall(title))
+        if len(candidates) > 1:
+            fix.confidence *= 0.5
+            fix.reasons.append("Title berisi lebih dari satu kandidat ticket")
+
+
+def _copy(source: BinaryIO, target: Optional[BinaryIO], size: int) -> None:
+    """Salin tepat size byte per potongan"""
+    while size > 0:
+        chunk = source.read(min(size, _COPY_SIZE))
+        if not chunk:
+            raise RewriteError("Stream fast-export terpotong di tengah blok data")
+        if target is not None:
+            target.write(chunk)
+        size -= len(chunk)
+
+
+def _read_exact(source: BinaryIO, size: int) -> bytes:
+    data = source.read(size)
+    if len(data) != size:
+        raise RewriteError("Stream fast-export terpotong di tengah blok data")
+    return data
+
+
+class FastExportRewriter:
+    """Filter stream fast-export menjadi stream fast-import"""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, dry_run: bool = False,
+                 report: Optional[TextIO] = None, fixer: Optional[TitleFixer] = None):
+        self.threshold = threshold
+        self.dry_run = dry_run
+        self.report = report
+        self.fixer = fixer or TitleFixer()
+
+    def rewrite(self, source: BinaryIO, target: Optional[BinaryIO]) -> RewriteStats:
+        """
+        Proses seluruh stream dalam satu kali baca
+
+        Args:
+            source: Stream fast-export (biner)
+            target: Stream fast-import (biner), None untuk tidak menulis apa pun
+
+        Returns:
+            RewriteStats
+        """
+        stats = RewriteStats(dry_run=self.dry_run)
+        in_commit = False
+        commit_id = None
+
+        while True:
+            line = source.readline()
+            if not line:
+                break
+
+            if line.startswith(b'data '):
+                size = self._data_size(line)
+                if in_commit:
+                    in_commit = False
+                    if size <= MAX_MESSAGE_BYTES:
+                        block = self._rewrite_message(_read_exact(source, size), commit_id, stats)
+                        if target is not None:
+                            target.write(block)
+                        continue
+                    # Message raksasa disalin apa adanya
+                    stats.commits += 1
+                    stats.invalid += 1
+                    stats.skipped += 1
+                    self._write_report(commit_id, TitleFix('', None, 0.0, [
+                        f"Message lebih dari {MAX_MESSAGE_BYTES} byte, tidak diperiksa"]), applied=False)
+                if target is not None:
+                    target.write(line)
+                _copy(source, target, size)
+                continue
+
+            if line.startswith(b'commit '):
+                in_commit = True
+                commit_id = None
+            elif in_commit and line.startswith(b'mark '):
+                commit_id = commit_id or line[5:].strip().decode('utf-8', 'replace')
+            elif in_commit and line.startswith(b'original-oid '):
+                commit_id = line[13:].strip().decode('utf-8', 'replace')
+            if target is not None:
+                target.write(line)
+
+        return stats
+
+    @staticmethod
+    def _data_size(line: bytes) -> int:
+        value = line[5:].strip()
+        if value.startswith(b'<<'):
+            raise RewriteError("Format data delimited (data <<) tidak didukung")
+        try:
+            return int(value)
+        except ValueError:
+            raise RewriteError(f"Header data tidak valid: {line!r}") from None
+
+    def _rewrite_message(self, data: bytes, commit_id: Optional[str], stats: RewriteStats) -> bytes:
+        """Periksa message commit, return blok data (header + isi) untuk output"""
+        stats.commits += 1
+        size = len(data)
+        try:
+            message = data.decode('utf-8')
+        except UnicodeDecodeError:
+            stats.invalid += 1
+            stats.skipped += 1
+            self._write_report(commit_id, TitleFix('', None, 0.0, ["Message bukan UTF-8"]), applied=False)
+            return b'data %d\n' % size + data
+
+        title, newline, body = message.partition('\n')
+        fix = self.fixer.suggest(title)
+        if fix is None:
+            stats.valid += 1
+            return b'data %d\n' % size + data
+
+        stats.invalid += 1
+        applied = fix.suggested is not None and fix.confidence >= self.threshold
+        self._write_report(commit_id, fix, applied)
+        if not applied:
+            stats.skipped += 1
+            return b'data %d\n' % size + data
+
+        stats.fixed += 1
+        if self.dry_run:
+            return b'data %d\n' % size + data
+        data = (fix.suggested + newline + body).encode('utf-8')
+        return b'data %d\n' % len(data) + data
+
+    def _write_report(self, commit_id: Optional[str], fix: TitleFix, applied: bool) -> None:
+        if self.report is None:
+            return
+        entry = {'commit': commit_id, 'applied': applied, **asdict(fix)}
+        self.report.write(json.dumps(entry, ensure_ascii=False, sort_keys=True) + '\n')
+
+
+def _check(process: subprocess.Popen, log: BinaryIO, command: str) -> None:
+    """GitError berisi stderr proses jika exit code bukan 0"""
+    if process.wait() != 0:
+        log.seek(0)
+        stderr = log.read().decode('utf-8', 'replace')
+        raise GitError(f"git {command} gagal: {stderr.strip()}")
+
+
+def first_signed_commit(repo: str, refs: Sequence[str] = ('--all',)) -> Optional[str]:
+    """
+    Sha commit bertanda tangan pertama yang ikut di-export, None jika tidak ada
+
+    Header commit dibaca lewat `git log --pretty=raw` secara streaming (baris
+    message diindentasi, jadi hanya header yang diawali "gpgsig"). git berhenti
+    begitu commit bertanda tangan pertama ditemukan.
+    """
+    with tempfile.TemporaryFile() as log:
+        process = subprocess.Popen(['git', '-C', repo, 'log', '--pretty=raw', *refs],
+                                   stdout=subprocess.PIPE, stderr=log)
+        sha = None
+        signed = None
+        try:
+            for line in process.stdout:
+                if line.startswith(b'commit '):
+                    sha = line.split()[1].decode('ascii')
+                elif line.startswith((b'gpgsig ', b'gpgsig-sha256 ')):
+                    signed = sha
+                    break
+        finally:
+            process.stdout.close()
+            if signed is not None:
+                process.kill()
+            process.wait()
+        if signed is None:
+            _check(process, log, 'log')
+    return signed
+
+
+def rewrite_repository(repo: str, refs: Sequence[str] = ('--all',), threshold: float = DEFAULT_THRESHOLD,
+                       dry_run: bool = False, report: Optional[TextIO] = None,
+                       strip_signed_tags: bool = False, strip_signed_commits: bool = False) -> RewriteStats:
+    """
+    Tulis ulang title commit di repository lewat fast-export | rewriter | fast-import
+
+    Args:
+        repo: Path repository
+        refs: Argumen revisi untuk git fast-export (default: --all)
+        threshold: Confidence minimal agar saran perbaikan dipakai
+        dry_run: Hanya buat laporan, repository tidak diubah
+        report: File teks untuk laporan JSONL (satu baris per commit tidak valid)
+        strip_signed_tags: Buang signature tag bertanda tangan (default: batalkan
+            rewrite dengan GitError jika ada signed tag, repository tidak diubah)
+        strip_signed_commits: Buang signature commit bertanda tangan, sha commit
+            tersebut dan semua turunannya berubah (default: batalkan rewrite
+            dengan GitError jika ada signed commit, repository tidak diubah)
+
+    Returns:
+        RewriteStats
+    """
+    if not strip_signed_commits:
+        signed = first_signed_commit(repo, refs)
+        if signed is not None:
+            raise GitError(f"Commit {signed} bertanda tangan, signature tidak bisa dipertahankan "
+                           f"fast-export (pakai --strip-signed-commits untuk membuangnya)")
+
+    rewriter = FastExportRewriter(threshold, dry_run, report)
+    signed_tags = 'strip' if strip_signed_tags else 'abort'
+
+    # stderr ditulis ke file sementara: pipe stderr yang tidak dibaca bisa penuh
+    # dan membuat git macet selagi stdout/stdin masih dipakai
+    with tempfile.TemporaryFile() as export_log, tempfile.TemporaryFile() as import_log:
+        export = subprocess.Popen(
+            ['git', '-C', repo, 'fast-export', '--show-original-ids', '--reencode=yes',
+             f'--signed-tags={signed_tags}', *refs],
+            stdout=subprocess.PIPE, stderr=export_log,
+        )
+        importer = None
+        if not dry_run:
+            importer = subprocess.Popen(
+                ['git', '-C', repo, 'fast-import', '--force', '--quiet'],
+                stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=import_log,
+            )
+
+        try:
+            try:
+                stats = rewriter.rewrite(export.stdout, importer.stdin if importer else None)
+            except RewriteError:
+                # Stream terpotong karena fast-export gagal: laporkan error git-nya
+                with contextlib.suppress(subprocess.TimeoutExpired):
+                    if export.wait(timeout=1):
+                        _check(export, export_log, 'fast-export')
+                raise
+            finally:
+                export.stdout.close()
+            # fast-export harus selesai tanpa error sebelum stdin fast-import ditutup,
+            # karena fast-import memperbarui ref saat input berakhir
+            _check(export, export_log, 'fast-export')
+        except BaseException:
+            # fast-import yang sudah keluar sendiri (BrokenPipeError saat menulis) dilaporkan lewat stderr-nya
+            import_failed = importer is not None and importer.poll()
+            for process in (export, importer):
+                if process:
+                    process.kill()
+                    process.wait()
+            if importer:
+                # Proses sudah mati, sisa buffer stdin tidak bisa dan tidak perlu dikirim
+                with contextlib.suppress(BrokenPipeError):
+                    importer.stdin.close()
+            if import_failed:
+                _check(importer, import_log, 'fast-import')
+            raise
+
+        if importer:
+            importer.stdin.close()
+            _check(importer, import_log, 'fast-import')
+    return stats
+
+
+def print_stats(stats: RewriteStats, file: Optional[TextIO] = None) -> None:
+    """Tampilkan ringkasan rewrite"""
+    action = "akan diperbaiki" if stats.dry_run else "diperbaiki"
+    print(f"📊 {stats.commits} commit: {stats.valid} valid, {stats.invalid} tidak valid", file=file)
+    print(f"✅ {stats.fixed} title {action}", file=file)
+    print(f"⏭️ {stats.skipped} dilewati (confidence di bawah threshold atau tanpa saran)", file=file)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point CLI rewriter"""
+    parser = argparse.ArgumentParser(description='Perbaiki title commit lama lewat git fast-export/fast-import')
+    parser.add_argument('--repo', help='Repository yang ditulis ulang (tanpa --repo: filter stdin ke stdout)')
+    parser.add_argument('--ref', action='append', dest='refs',
+                        help='Ref yang ditulis ulang, bisa diulang (default: --all)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Confidence minimal saran perbaikan (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--dry-run', action='store_true', help='Hanya buat laporan, tanpa menulis ulang')
+    parser.add_argument('--report', help='File laporan JSONL, - untuk stderr')
+    parser.add_argument('--strip-signed-tags', action='store_true',
+                        help='Buang signature signed tag (default: rewrite dibatalkan jika ada signed tag)')
+    parser.add_argument('--strip-signed-commits', action='store_true',
+                        help='Buang signature signed commit (default: rewrite dibatalkan jika ada signed commit)')
+    args = parser.parse_args(argv)
+
+    report = None
+    if args.report == '-':
+        report = sys.stderr
+    elif args.report:
+        report = open(args.report, 'w', encoding='utf-8')
+
+    try:
+        if args.repo:
+            stats = rewrite_repository(args.repo, args.refs or ('--all',), args.threshold, args.dry_run, report,
+                                       args.strip_signed_tags, args.strip_signed_commits)
+            print_stats(stats)
+        else:
+            # stdout dipakai untuk stream fast-import, ringkasan ke stderr
+            target = None if args.dry_run else sys.stdout.buffer
+            stats = FastExportRewriter(args.threshold, args.dry_run, report).rewrite(sys.stdin.buffer, target)
+            if target is not None:
+                target.flush()
+            print_stats(stats, sys.stderr)
+    except (GitError, RewriteError) as error:
+        print(f"❌ {error}", file=sys.stderr)
+        return 1
+    finally:
+        if report is not None and report is not sys.stderr:
+            report.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,207 @@
+import io
+import json
+import os
+import subprocess
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from commit_validator_git import GitError
+from commit_validator_rewrite import (
+    FastExportRewriter,
+    RewriteError,
+    TitleFixer,
+    first_signed_commit,
+    main,
+    rewrite_repository,
+)
+from commit_validator_test_helpers import commit, git
+
+
+class TestTitleFixer(unittest.TestCase):
+    """Test saran perbaikan dan confidence"""
+
+    def setUp(self):
+        self.fixer = TitleFixer()
+
+    def test_valid_title(self):
+        """Test title valid tidak perlu diperbaiki"""
+        self.assertIsNone(self.fixer.suggest("feat: menambahkan fitur login (Taiga #DATB-1)"))
+
+    def test_confident_fixes(self):
+        """Test perbaikan huruf besar tipe dan typo tipe"""
+        fix = self.fixer.suggest("Feat: menambahkan fitur login (Taiga #DATB-1)")
+        self.assertEqual(fix.suggested, "feat: menambahkan fitur login (Taiga #DATB-1)")
+        self.assertEqual(fix.confidence, 1.0)
+
+        fix = self.fixer.suggest("feature: menambahkan register user #DATB-3")
+        self.assertEqual(fix.suggested, "feat: menambahkan register user (Taiga #DATB-3)")
+        self.assertEqual(fix.confidence, 0.9)
+
+    def test_leading_whitespace(self):
+        """Test title dengan whitespace di awal tidak membuat scoring crash"""
+        fix = self.fixer.suggest("  Feat: menambahkan fitur login (Taiga #DATB-1)")
+        self.assertEqual(fix.suggested, "feat: menambahkan fitur login (Taiga #DATB-1)")
+        self.assertEqual(fix.confidence, 1.0)
+
+        fix = self.fixer.suggest("\tfeature: menambahkan register user #DATB-3")
+        self.assertEqual(fix.suggested, "feat: menambahkan register user (Taiga #DATB-3)")
+        self.assertEqual(fix.confidence, 0.9)
+
+    def test_low_confidence(self):
+        """Test tebakan tipe, ticket, dan ringkasan menurunkan confidence"""
+        self.assertEqual(self.fixer.suggest("update readme (Taiga #DOC-4)").confidence, 0.3)
+        self.assertLess(self.fixer.suggest("Feat: upgrade OAUTH2 ke versi baru DATB 12").confidence, 0.8)
+        self.assertEqual(self.fixer.suggest("feat: #DATB-1").confidence, 0.0)
+
+        fix = self.fixer.suggest("wip")
+        self.assertIsNone(fix.suggested)
+        self.assertEqual(fix.confidence, 0.0)
+
+
+class TestFastExportRewriter(unittest.TestCase):
+    """Test filter stream fast-export"""
+
+    STREAM = (
+        b"blob\nmark :1\ndata 26\ncommit refs/heads/x\ndata 3\n\n"
+        b"reset refs/heads/main\n"
+        b"commit refs/heads/main\nmark :2\noriginal-oid abc123\n"
+        b"author A <a@e> 1 +0000\ncommitter A <a@e> 1 +0000\n"
+        b"data 53\nFeat: menambahkan fitur login (Taiga #DATB-1)\n\nBody.\n"
+        b"M 100644 :1 file.txt\n\n"
+        b"tag v1\nfrom :2\ntagger A <a@e> 1 +0000\ndata 10\nFeat: tag\n\n"
+    )
+
+    def test_rewrites_only_commit_messages(self):
+        """Test isi blob dan message tag disalin apa adanya"""
+        output = io.BytesIO()
+        report = io.StringIO()
+        stats = FastExportRewriter(report=report).rewrite(io.BytesIO(self.STREAM), output)
+
+        expected = self.STREAM.replace(b"data 53\nFeat:", b"data 53\nfeat:")
+        self.assertEqual(output.getvalue(), expected)
+        self.assertEqual((stats.commits, stats.invalid, stats.fixed), (1, 1, 1))
+        self.assertEqual(json.loads(report.getvalue())['commit'], 'abc123')
+
+    def test_dry_run_and_threshold(self):
+        """Test dry run tidak menulis output, threshold menentukan perbaikan"""
+        stats = FastExportRewriter(dry_run=True).rewrite(io.BytesIO(self.STREAM), None)
+        self.assertEqual(stats.fixed, 1)
+
+        output = io.BytesIO()
+        stats = FastExportRewriter(threshold=1.1).rewrite(io.BytesIO(self.STREAM), output)
+        self.assertEqual(output.getvalue(), self.STREAM)
+        self.assertEqual(stats.skipped, 1)
+
+    def test_truncated_stream(self):
+        """Test stream terpotong ditolak"""
+        with self.assertRaises(RewriteError):
+            FastExportRewriter().rewrite(io.BytesIO(self.STREAM[:40]), io.BytesIO())
+        with self.assertRaises(RewriteError):
+            FastExportRewriter().rewrite(io.BytesIO(b"commit refs/heads/main\ndata <<EOF\nx\nEOF\n"), None)
+
+
+class TestRewriteRepository(unittest.TestCase):
+    """Test rewrite repository sementara lewat fast-export/fast-import"""
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.repo = os.path.join(self.tempdir.name, 'repo')
+        os.makedirs(self.repo)
+        git(self.repo, 'init', '-q', '-b', 'main')
+        self.first = commit(self.repo, "feat: menambahkan fitur awal (Taiga #DATB-1)", 'a.txt')
+        commit(self.repo, "Feat: menambahkan fitur login (Taiga #DATB-2)\n\nTicket Link: [(Taiga #DATB-2)](https://x/2)",
+               'b.txt')
+        git(self.repo, 'checkout', '-q', '-b', 'fitur')
+        commit(self.repo, "feature: menambahkan register user #DATB-3", 'c.txt')
+        git(self.repo, 'checkout', '-q', 'main')
+        commit(self.repo, "update readme (Taiga #DOC-4)")
+        git(self.repo, 'merge', '-q', '--no-ff', '-m', "chore: merge branch fitur (Taiga #DATB-5)", 'fitur')
+        git(self.repo, 'tag', '-a', 'v1', '-m', 'rilis')
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def titles(self, ref='main'):
+        return git(self.repo, 'log', '--format=%s', ref).splitlines()
+
+    def test_dry_run_leaves_repository_unchanged(self):
+        """Test dry run hanya menghasilkan laporan"""
+        head = git(self.repo, 'rev-parse', 'main')
+        report = io.StringIO()
+        stats = rewrite_repository(self.repo, dry_run=True, report=report)
+
+        self.assertEqual(git(self.repo, 'rev-parse', 'main'), head)
+        self.assertEqual((stats.commits, stats.fixed, stats.skipped), (5, 2, 1))
+        self.assertEqual(sorted(entry['applied'] for entry in map(json.loads, report.getvalue().splitlines())),
+                         [False, True, True])
+
+    def test_rewrite_history(self):
+        """Test title diperbaiki, body, tree, tag, dan commit yang tidak berubah tetap"""
+        tree = git(self.repo, 'rev-parse', 'main^{tree}')
+        rewrite_repository(self.repo)
+
+        self.assertEqual(self.titles(), [
+            "chore: merge branch fitur (Taiga #DATB-5)",
+            "update readme (Taiga #DOC-4)",
+            "feat: menambahkan register user (Taiga #DATB-3)",
+            "feat: menambahkan fitur login (Taiga #DATB-2)",
+            "feat: menambahkan fitur awal (Taiga #DATB-1)",
+        ])
+        self.assertEqual(git(self.repo, 'rev-parse', 'main^{tree}'), tree)
+        self.assertEqual(git(self.repo, 'rev-list', '--max-parents=0', 'main'), self.first)
+        self.assertIn("Ticket Link: [(Taiga #DATB-2)]", git(self.repo, 'log', '--format=%b', 'main'))
+        self.assertEqual(git(self.repo, 'rev-parse', 'v1^{commit}'), git(self.repo, 'rev-parse', 'main'))
+        self.assertEqual(self.titles('fitur')[0], "feat: menambahkan register user (Taiga #DATB-3)")
+        self.assertEqual(git(self.repo, 'status', '--porcelain'), '')
+
+    def test_signed_tags_abort_unless_stripped(self):
+        """Test signed tag membatalkan rewrite kecuali strip_signed_tags"""
+        signature = "-----BEGIN PGP SIGNATURE-----\n\niQEzBAABCAAd\n-----END PGP SIGNATURE-----"
+        git(self.repo, 'tag', '-a', 'v2', '-m', f"rilis\n{signature}")
+        head = git(self.repo, 'rev-parse', 'main')
+
+        with self.assertRaisesRegex(GitError, 'signed tag'):
+            rewrite_repository(self.repo)
+        self.assertEqual(git(self.repo, 'rev-parse', 'main'), head)
+        self.assertEqual(git(self.repo, 'rev-parse', 'fitur'), git(self.repo, 'rev-parse', 'main^2'))
+
+        rewrite_repository(self.repo, strip_signed_tags=True)
+        self.assertEqual(self.titles()[2], "feat: menambahkan register user (Taiga #DATB-3)")
+        self.assertNotIn("PGP SIGNATURE", git(self.repo, 'cat-file', 'tag', 'v2'))
+
+    def test_signed_commits_abort_unless_stripped(self):
+        """Test commit bertanda tangan membatalkan rewrite kecuali strip_signed_commits"""
+        signature = "-----BEGIN PGP SIGNATURE-----\n \n iQEzBAABCAAd\n -----END PGP SIGNATURE-----"
+        raw = (f"tree {git(self.repo, 'rev-parse', 'main^{tree}')}\nparent {git(self.repo, 'rev-parse', 'main')}\n"
+               f"author A <a@e> 1 +0000\ncommitter A <a@e> 1 +0000\ngpgsig {signature}\n\n"
+               "fix: memperbaiki login (Taiga #DATB-6)\n")
+        signed = subprocess.run(['git', '-C', self.repo, 'hash-object', '-t', 'commit', '-w', '--stdin'],
+                                input=raw, check=True, capture_output=True, text=True).stdout.strip()
+        git(self.repo, 'update-ref', 'refs/heads/main', signed)
+
+        self.assertEqual(first_signed_commit(self.repo), signed)
+        with self.assertRaisesRegex(GitError, signed):
+            rewrite_repository(self.repo)
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(['--repo', self.repo, '--strip-signed-commits', '--dry-run']), 0)
+        self.assertEqual(git(self.repo, 'rev-parse', 'main'), signed)
+
+        rewrite_repository(self.repo, strip_signed_commits=True)
+        self.assertEqual(self.titles()[:2], ["fix: memperbaiki login (Taiga #DATB-6)",
+                                             "chore: merge branch fitur (Taiga #DATB-5)"])
+        self.assertIsNone(first_signed_commit(self.repo))
+
+    def test_cli(self):
+        """Test CLI dengan threshold dan laporan ke file"""
+        report = os.path.join(self.tempdir.name, 'fixes.jsonl')
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(['--repo', self.repo, '--threshold', '0.95', '--report', report]), 0)
+
+        self.assertIn("feature: menambahkan register user #DATB-3", self.titles())
+        self.assertIn("feat: menambahkan fitur login (Taiga #DATB-2)", self.titles())
+        with open(report, encoding='utf-8') as handle:
+            self.assertEqual(len(handle.readlines()), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,320 @@
+"""
+Rule spec bersama untuk validator Python dan JavaScript
+
+Membangkitkan commit_validator_rules.json dari rule set Python
+(CommitTitleValidator dan ReferenceExtractor): tipe yang diperbolehkan,
+index typo, dan semua pattern. Salinan spec juga ditanam di index.html
+sehingga web dashboard tetap jalan saat dibuka lewat file://.
+
+Regex Python dan JavaScript berbeda semantik untuk \\s, \\d, '.', '$', dan
+case-insensitive (misalnya Kelvin sign, 'ſ', 'ı'). Karena itu setiap atom
+pattern (literal, escape, character class) diterjemahkan menjadi character
+class eksplisit berisi code point yang persis sama dengan yang dicocokkan
+Python, lalu dipakai di JavaScript dengan flag 'u' tanpa flag 'i'.
+
+Himpunan code point tersebut bergantung pada database Unicode interpreter
+(misalnya Python 3.12 memakai Unicode 15.0 yang menambah digit Kawi dan Nag
+Mundari ke \d). Versi Unicode ikut dicatat di spec, dan --check dilewati
+dengan peringatan jika interpreter memakai versi lain.
+
+Contoh:
+    python commit_validator_rules.py           # tulis ulang artifact
+    python commit_validator_rules.py --check   # gagal jika artifact usang
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from commit_validator import CommitTitleValidator, ReferenceExtractor
+
+
+SPEC_VERSION = 1
+
+SPEC_FILENAME = 'commit_validator_rules.json'
+HTML_FILENAME = 'index.html'
+
+# Blok spec di index.html, diganti utuh setiap artifact ditulis ulang
+HTML_BEGIN = '<script type="application/json" id="commit-validator-rules">'
+HTML_END = '</script>'
+
+# Nama pattern di spec -> pattern yang sudah di-compile di rule set Python
+PATTERNS = {
+    'title': CommitTitleValidator._TITLE_RE,
+    'taiga_reference': CommitTitleValidator._TAIGA_REFERENCE_RE,
+    'ticket': CommitTitleValidator._TICKET_RE,
+    'type_prefix': CommitTitleValidator._TYPE_PREFIX_RE,
+    'loose_ticket': CommitTitleValidator._LOOSE_TICKET_RE,
+    'leading_type': CommitTitleValidator._LEADING_TYPE_RE,
+    'trailing_parens': CommitTitleValidator._TRAILING_PARENS_RE,
+    'ticket_link': ReferenceExtractor._TICKET_LINK_RE,
+    'documentation_link': ReferenceExtractor._DOCUMENTATION_LINK_RE,
+    'testing_link': ReferenceExtractor._TESTING_LINK_RE,
+}
+
+_SUPPORTED_FLAGS = re.IGNORECASE | re.UNICODE
+
+_MAX_CODE_POINT = 0x10FFFF
+
+
+@lru_cache(maxsize=1)
+def _all_characters() -> str:
+    return ''.join(map(chr, range(_MAX_CODE_POINT + 1)))
+
+
+@lru_cache(maxsize=None)
+def atom_characters(atom: str, flags: int = 0) -> Tuple[int, ...]:
+    """Semua code point yang dicocokkan satu atom regex Python"""
+    return tuple(map(ord, re.findall(atom, _all_characters(), flags)))
+
+
+def _ranges(code_points: Tuple[int, ...]) -> List[Tuple[int, int]]:
+    ranges: List[Tuple[int, int]] = []
+    for code_point in code_points:
+        if ranges and ranges[-1][1] == code_point - 1:
+            ranges[-1] = (ranges[-1][0], code_point)
+        else:
+            ranges.append((code_point, code_point))
+    return ranges
+
+
+# Karakter sintaks regex JavaScript, di-escape dengan backslash (valid di mode 'u')
+_JS_SYNTAX_CHARS = set('^$\\.*+?()[]{}|/')
+
+
+def _js_char(code_point: int) -> str:
+    char = chr(code_point)
+    if char in _JS_SYNTAX_CHARS:
+        return '\\' + char
+    if char.isascii() and char.isprintable() and char not in ' -':
+        return char
+    return f'\\u{{{code_point:X}}}'
+
+
+def js_char_class(code_points: Tuple[int, ...]) -> str:
+    """Character class JavaScript (flag 'u') untuk himpunan code point"""
+    ranges = _ranges(code_points)
+    negate = len(code_points) > (_MAX_CODE_POINT + 1) // 2
+    if negate:
+        # Tulis komplemennya saja, misalnya [^\n] untuk '.'
+        gaps = []
+        previous_end = -1
+        for start, end in ranges + [(_MAX_CODE_POINT + 1, _MAX_CODE_POINT + 1)]:
+            if start > previous_end + 1:
+                gaps.append((previous_end + 1, start - 1))
+            previous_end = end
+        ranges = gaps
+    elif len(ranges) == 1 and ranges[0][0] == ranges[0][1]:
+        return _js_char(ranges[0][0])
+
+    parts = []
+    for start, end in ranges:
+        if start == end:
+            parts.append(_js_char(start))
+        elif end == start + 1:
+            parts.append(_js_char(start) + _js_char(end))
+        else:
+            parts.append(f'{_js_char(start)}-{_js_char(end)}')
+    return f"[{'^' if negate else ''}{''.join(parts)}]"
+
+
+@lru_cache(maxsize=None)
+def _js_atom(atom: str, flags: int) -> str:
+    return js_char_class(atom_characters(atom, flags))
+
+
+def _tokenize(pattern: str) -> List[Tuple[str, str]]:
+    """Pecah pattern menjadi token ('atom', teks) atau ('syntax', teks)"""
+    tokens = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\':
+            tokens.append(('atom', pattern[index:index + 2]))
+            index += 2
+        elif char == '[':
+            end = index + 1
+            if end < len(pattern) and pattern[end] == '^':
+                end += 1
+            if end < len(pattern) and pattern[end] == ']':
+                end += 1
+            while pattern[end] != ']':
+                end += 2 if pattern[end] == '\\' else 1
+            tokens.append(('atom', pattern[index:end + 1]))
+            index = end + 1
+        elif pattern.startswith('(?:', index):
+            tokens.append(('syntax', '(?:'))
+            index += 3
+        elif char == '(' and pattern.startswith('(?', index):
+            raise ValueError(f"Grup '(?' tidak didukung: {pattern}")
+        elif char == '{':
+            end = pattern.index('}', index)
+            tokens.append(('syntax', pattern[index:end + 1]))
+            index = end + 1
+        elif char in '()|*+?^$':
+            tokens.append(('syntax', char))
+            index += 1
+        else:
+            tokens.append(('atom', char))
+            index += 1
+    return tokens
+
+
+def js_pattern(pattern: str, flags: int = 0) -> str:
+    """
+    Terjemahkan pattern Python menjadi pattern JavaScript (flag 'u') yang setara
+
+    Args:
+        pattern: Source regex Python
+        flags: Flag re (hanya IGNORECASE yang didukung)
+
+    Returns:
+        Source regex JavaScript
+    """
+    if flags & ~_SUPPORTED_FLAGS:
+        raise ValueError(f"Flag regex tidak didukung: {flags}")
+
+    output = []
+    for kind, text in _tokenize(pattern):
+        if kind == 'atom':
+            output.append(_js_atom(text, flags))
+        elif text == '$':
+            # '$' Python (tanpa MULTILINE) juga cocok sebelum newline terakhir
+            output.append('(?=\\n?$)')
+        else:
+            output.append(text)
+    return ''.join(output)
+
+
+def build_rule_spec() -> Dict:
+    """Bangun rule spec dari rule set Python"""
+    patterns = {}
+    for name, compiled in PATTERNS.items():
+        flags = compiled.flags & re.IGNORECASE
+        patterns[name] = {
+            'python': compiled.pattern,
+            'flags': 'i' if flags else '',
+            'js': js_pattern(compiled.pattern, flags),
+        }
+
+    spec = {
+        'version': SPEC_VERSION,
+        # Class \d, \s, dan case-insensitive diturunkan dari database Unicode ini
+        'unicode_version': unicodedata.unidata_version,
+        'allowed_types': list(CommitTitleValidator.ALLOWED_TYPES),
+        'typo_map': dict(CommitTitleValidator.TYPO_MAP),
+        # Karakter yang dibuang str.strip() (sama dengan \s Python)
+        'whitespace': _js_atom(r'\s', 0),
+        'patterns': patterns,
+    }
+    canonical = json.dumps(spec, sort_keys=True, separators=(',', ':'))
+    spec['hash'] = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    return spec
+
+
+def render_spec(spec: Dict) -> str:
+    """JSON spec yang aman ditanam di tag <script>"""
+    return json.dumps(spec, indent=2, sort_keys=True).replace('<', '\\u003c') + '\n'
+
+
+def embed_in_html(html: str, spec: Dict) -> str:
+    """Ganti blok spec di index.html"""
+    start = html.find(HTML_BEGIN)
+    if start < 0:
+        raise ValueError(f"Blok {HTML_BEGIN} tidak ditemukan di {HTML_FILENAME}")
+    start += len(HTML_BEGIN)
+    end = html.index(HTML_END, start)
+    return html[:start] + '\n' + render_spec(spec) + '    ' + html[end:]
+
+
+def _artifacts(root: str) -> Dict[str, str]:
+    """Isi artifact yang seharusnya, per path"""
+    spec = build_rule_spec()
+    html_path = os.path.join(root, HTML_FILENAME)
+    with open(html_path, encoding='utf-8') as handle:
+        html = handle.read()
+    return {
+        os.path.join(root, SPEC_FILENAME): render_spec(spec),
+        html_path: embed_in_html(html, spec),
+    }
+
+
+def _stale(artifacts: Dict[str, str]) -> List[str]:
+    stale = []
+    for path, content in artifacts.items():
+        try:
+            with open(path, encoding='utf-8') as handle:
+                if handle.read() == content:
+                    continue
+        except FileNotFoundError:
+            pass
+        stale.append(path)
+    return stale
+
+
+def spec_unicode_version(root: str = '.') -> Optional[str]:
+    """Versi Unicode yang tercatat di spec, None jika spec belum ada"""
+    try:
+        with open(os.path.join(root, SPEC_FILENAME), encoding='utf-8') as handle:
+            return json.load(handle).get('unicode_version')
+    except FileNotFoundError:
+        return None
+
+
+def unicode_mismatch(root: str = '.') -> Optional[str]:
+    """Pesan jika spec dibangkitkan dengan versi Unicode yang berbeda dari interpreter ini"""
+    version = spec_unicode_version(root)
+    if version is None or version == unicodedata.unidata_version:
+        return None
+    return (f"{SPEC_FILENAME} dibangkitkan dengan Unicode {version}, interpreter ini memakai "
+            f"Unicode {unicodedata.unidata_version} (class \\d, \\s, dan case-insensitive bisa berbeda)")
+
+
+def stale_artifacts(root: str = '.') -> List[str]:
+    """Path artifact yang isinya tidak sama dengan rule set Python saat ini"""
+    return _stale(_artifacts(root))
+
+
+def write_artifacts(root: str = '.') -> List[str]:
+    """Tulis ulang artifact yang usang, return path yang ditulis"""
+    artifacts = _artifacts(root)
+    stale = _stale(artifacts)
+    for path in stale:
+        with open(path, 'w', encoding='utf-8') as handle:
+            handle.write(artifacts[path])
+    return stale
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point CLI generator rule spec"""
+    parser = argparse.ArgumentParser(description='Bangkitkan rule spec bersama dari rule set Python')
+    parser.add_argument('--root', default=os.path.dirname(os.path.abspath(__file__)),
+                        help='Direktori project (default: direktori script ini)')
+    parser.add_argument('--check', action='store_true', help='Hanya cek, exit 1 jika artifact usang')
+    args = parser.parse_args(argv)
+
+    mismatch = unicode_mismatch(args.root)
+    if args.check:
+        if mismatch:
+            print(f"⚠️ {mismatch}, cek dilewati. Jalankan --check dengan Python yang memakai "
+                  f"Unicode {spec_unicode_version(args.root)}")
+            return 0
+        stale = stale_artifacts(args.root)
+        for path in stale:
+            print(f"❌ {path} usang, jalankan: python commit_validator_rules.py")
+        return 1 if stale else 0
+
+    if mismatch:
+        print(f"⚠️ {mismatch}, artifact dibangkitkan ulang dengan Unicode {unicodedata.unidata_version}")
+    for path in write_artifacts(args.root):
+        print(f"✅ {path} ditulis ulang")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
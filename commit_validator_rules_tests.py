@@ -0,0 +1,161 @@
+import io
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import unicodedata
+import unittest
+from contextlib import redirect_stdout
+from dataclasses import asdict
+from commit_validator import CommitTitleValidator, ReferenceExtractor
+from commit_validator_bench import generate_corpus
+from commit_validator_fuzz import InputGenerator
+from commit_validator_rules import (
+    HTML_BEGIN,
+    HTML_FILENAME,
+    SPEC_FILENAME,
+    build_rule_spec,
+    embed_in_html,
+    js_pattern,
+    main,
+    render_spec,
+    stale_artifacts,
+    unicode_mismatch,
+)
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Spec dibangkitkan dengan database Unicode lain: artifact dan parity tidak bisa dibandingkan
+UNICODE_MISMATCH = unicode_mismatch(ROOT)
+
+# Jalankan engine JavaScript di Node.js: input JSON dari stdin, hasil ke stdout
+NODE_SCRIPT = r"""
+const fs = require('fs');
+const engine = require('./commit_validator.js').load(require('./commit_validator_rules.json'));
+const data = JSON.parse(fs.readFileSync(0, 'utf8'));
+process.stdout.write(JSON.stringify({
+    titles: data.titles.map(engine.validateTitle),
+    references: data.descriptions.map(engine.extractReferences),
+}));
+"""
+
+# Kasus yang semantiknya berbeda antara regex Python dan JavaScript
+EDGE_TITLES = [
+    "",
+    "   ",
+    "feat: menambahkan fitur login (Taiga #DATB-10353)",
+    "feat: menambahkan login\x1c(Taiga #DATB-1)",
+    "feat: login user (Taiga #DATB-1)",
+    "feat: login user (Taiga #DATB-٣٤)",
+    "feat: 😀😀😀😀 (Taiga #DATB-1)",
+    "fitur: menambahkan login (Taiga #DATB-1)",
+    "Feat:menambahkan login (Taiga #datb-1)",
+    ": (Taiga #DATB-1)",
+    "feat: login user (Taiga #DATB-1) (Taiga #AB-2)",
+    "add login #DATB-1 #PROJ-2 (catatan)",
+]
+
+EDGE_DESCRIPTIONS = [
+    "",
+    "Ticket Link: [(Taiga #datb-1)](https://x)",
+    "Tıcket Link: [(Taiga #A-1)](https://x)\nTeſting Link: [Sheet]",
+    "Documentation  Link: [Spec](https://docs)",
+    "Testing Link: [Sheet ](x)",
+]
+
+
+class TestRuleSpec(unittest.TestCase):
+    """Test generator rule spec"""
+
+    @unittest.skipIf(UNICODE_MISMATCH, UNICODE_MISMATCH)
+    def test_artifacts_up_to_date(self):
+        """Test artifact sama dengan rule set Python (jalankan commit_validator_rules.py jika gagal)"""
+        self.assertEqual(stale_artifacts(ROOT), [])
+
+    def test_check_skipped_on_unicode_mismatch(self):
+        """Test --check dilewati dengan peringatan jika versi Unicode spec berbeda"""
+        with tempfile.TemporaryDirectory() as root:
+            shutil.copy(os.path.join(ROOT, HTML_FILENAME), root)
+            spec = dict(build_rule_spec(), unicode_version='1.0.0')
+            with open(os.path.join(root, SPEC_FILENAME), 'w', encoding='utf-8') as handle:
+                handle.write(render_spec(spec))
+
+            self.assertIn('Unicode 1.0.0', unicode_mismatch(root))
+            with redirect_stdout(io.StringIO()) as output:
+                self.assertEqual(main(['--root', root, '--check']), 0)
+            self.assertIn('cek dilewati', output.getvalue())
+            self.assertEqual(stale_artifacts(root), [os.path.join(root, SPEC_FILENAME)])
+
+    def test_spec_from_python_rules(self):
+        """Test isi spec diambil dari rule set Python"""
+        spec = build_rule_spec()
+
+        self.assertEqual(spec['allowed_types'], CommitTitleValidator.ALLOWED_TYPES)
+        self.assertEqual(spec['typo_map'], CommitTitleValidator.TYPO_MAP)
+        self.assertEqual(spec['unicode_version'], unicodedata.unidata_version)
+        self.assertEqual(spec['patterns']['title']['python'], CommitTitleValidator.TITLE_PATTERN)
+        self.assertEqual(spec['patterns']['ticket_link']['flags'], 'i')
+        self.assertEqual(spec['hash'], build_rule_spec()['hash'])
+
+    def test_js_pattern_expands_case_folding(self):
+        """Test atom case-insensitive diperluas sesuai semantik Python"""
+        self.assertEqual(js_pattern('k', re.IGNORECASE), '[Kk\\u{212A}]')
+        self.assertEqual(js_pattern('s', re.IGNORECASE), '[Ss\\u{17F}]')
+        self.assertEqual(js_pattern('[A-Z]'), '[A-Z]')
+
+    def test_js_pattern_syntax(self):
+        """Test '.', '$', dan escape diterjemahkan"""
+        self.assertEqual(js_pattern(r'\(.*?\)$'), '\\([^\\u{A}]*?\\)(?=\\n?$)')
+        self.assertEqual(js_pattern('a(?:b)?'), 'a(?:b)?')
+        with self.assertRaises(ValueError):
+            js_pattern('(?P<nama>a)')
+
+    def test_embed_in_html(self):
+        """Test blok spec di HTML diganti utuh"""
+        html = f"<body>\n    {HTML_BEGIN}lama</script>\n</body>"
+        embedded = embed_in_html(html, build_rule_spec())
+        block = embedded[embedded.index(HTML_BEGIN) + len(HTML_BEGIN):embedded.index('</script>')]
+
+        self.assertEqual(json.loads(block), build_rule_spec())
+        self.assertNotIn('lama', embedded)
+
+
+@unittest.skipIf(shutil.which('node') is None, 'Node.js tidak tersedia')
+@unittest.skipIf(UNICODE_MISMATCH, UNICODE_MISMATCH)
+class TestJavaScriptParity(unittest.TestCase):
+    """Test engine JavaScript identik dengan validator Python"""
+
+    def run_node(self, titles, descriptions):
+        process = subprocess.run(
+            ['node', '-e', NODE_SCRIPT], cwd=ROOT, check=True, capture_output=True, text=True,
+            input=json.dumps({'titles': titles, 'descriptions': descriptions}),
+        )
+        return json.loads(process.stdout)
+
+    def test_parity(self):
+        """Test corpus benchmark, input fuzzing, dan kasus tepi"""
+        corpus = generate_corpus(seed=8, size=1000, invalid_ratio=0.5, body_lines=8)
+        generator = InputGenerator(8)
+        titles = EDGE_TITLES + corpus.titles + [generator.title() for _ in range(3000)]
+        descriptions = EDGE_DESCRIPTIONS + corpus.descriptions + [generator.description() for _ in range(3000)]
+
+        output = self.run_node(titles, descriptions)
+        validator = CommitTitleValidator()
+        extractor = ReferenceExtractor()
+
+        for title, result in zip(titles, output['titles']):
+            self.assertEqual(result, asdict(validator.validate_title(title)), repr(title))
+        for description, references in zip(descriptions, output['references']):
+            self.assertEqual(references, asdict(extractor.extract_references(description)), repr(description))
+
+    def test_spec_file_is_valid_json(self):
+        """Test spec bisa dibaca client lain"""
+        with open(os.path.join(ROOT, SPEC_FILENAME), encoding='utf-8') as handle:
+            self.assertEqual(json.load(handle), build_rule_spec())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,335 @@
+"""
+Serialisasi hasil validasi untuk pipeline bulk
+
+Menyediakan writer/reader streaming untuk ValidationResult,
+FrozenValidationResult, dan ReferenceData dalam dua format:
+- JSONL: satu record JSON per baris, dikonversi langsung tanpa asdict,
+  field sama dengan output dataclasses.asdict (FrozenValidationResult
+  mendapat tambahan "frozen": true)
+- Binary: record ringkas ala msgpack dengan string table, pesan error dan
+  nama project yang berulang hanya ditulis sekali lalu dirujuk lewat index
+
+Kedua format lossless: hasil baca sama persis dengan object yang ditulis
+(termasuk tipe record frozen atau tidak, serta perbedaan None dan dict kosong).
+
+Format binary:
+    header  : b'CVR1'
+    record  : tag (1 byte) + isi
+    string  : varint v, v == 0 berarti string inline (varint panjang + UTF-8),
+              v > 0 berarti index v - 1 di string table
+    0x01    : definisi string baru (varint panjang + UTF-8), masuk string table
+    0x10    : ValidationResult, flags (bit0 is_valid, bit1 ada parsed_data,
+              bit2 FrozenValidationResult), errors, suggestions, lalu parsed_data
+    0x11    : ReferenceData, flags (bit per link yang ada), lalu dict per link
+    list    : varint jumlah + string
+    dict    : varint jumlah + pasangan string key/value
+"""
+import json
+from typing import BinaryIO, Dict, Iterable, Iterator, List, TextIO, Union
+
+from commit_validator import FrozenValidationResult, REFERENCE_FIELDS, ReferenceData, ValidationResult
+
+
+Record = Union[ValidationResult, FrozenValidationResult, ReferenceData]
+
+MAGIC = b'CVR1'
+
+TAG_STRING = 0x01
+TAG_VALIDATION = 0x10
+TAG_REFERENCES = 0x11
+
+# Batas jumlah string di string table, string berikutnya ditulis inline
+DEFAULT_MAX_TABLE_SIZE = 1 << 16
+
+_CHUNK_SIZE = 1 << 16
+
+
+class SerializationError(ValueError):
+    """Data serialisasi rusak atau tidak didukung"""
+
+
+# ---------------------------------------------------------------------------
+# JSONL
+# ---------------------------------------------------------------------------
+
+def record_to_dict(record: Record) -> Dict:
+    """Konversi record ke dict JSON (lebih cepat dari dataclasses.asdict)"""
+    if isinstance(record, ValidationResult):
+        return {
+            'is_valid': record.is_valid,
+            'errors': record.errors,
+            'suggestions': record.suggestions,
+            'parsed_data': record.parsed_data,
+        }
+    if isinstance(record, FrozenValidationResult):
+        return {
+            'is_valid': record.is_valid,
+            'errors': list(record.errors),
+            'suggestions': list(record.suggestions),
+            'parsed_data': record.parsed_data,
+            'frozen': True,
+        }
+    if isinstance(record, ReferenceData):
+        return {
+            'ticket_link': record.ticket_link,
+            'documentation_link': record.documentation_link,
+            'testing_link': record.testing_link,
+        }
+    raise TypeError(f"Tipe record tidak didukung: {type(record).__name__}")
+
+
+def record_from_dict(data: Dict) -> Record:
+    """Konversi dict JSON kembali ke record, jenis record dikenali dari field-nya"""
+    try:
+        if 'is_valid' in data:
+            result = ValidationResult(data['is_valid'], data['errors'], data['suggestions'], data['parsed_data'])
+            return FrozenValidationResult.from_result(result) if data.get('frozen') else result
+        return ReferenceData(data['ticket_link'], data['documentation_link'], data['testing_link'])
+    except KeyError as error:
+        raise SerializationError(f"Field record tidak lengkap: {error}") from None
+
+
+class JsonlWriter:
+    """Writer JSONL streaming"""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self._encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+    def write(self, record: Record) -> None:
+        """Tulis satu record"""
+        self.stream.write(self._encode(record_to_dict(record)))
+        self.stream.write('\n')
+
+    def write_all(self, records: Iterable[Record]) -> int:
+        """Tulis banyak record, return jumlah record"""
+        encode = self._encode
+        write = self.stream.write
+        count = 0
+        for record in records:
+            write(encode(record_to_dict(record)) + '\n')
+            count += 1
+        return count
+
+
+def read_jsonl(stream: TextIO) -> Iterator[Record]:
+    """Baca record dari stream JSONL satu per satu"""
+    decode = json.JSONDecoder().decode
+    for line in stream:
+        if line.strip():
+            yield record_from_dict(decode(line))
+
+
+def write_jsonl(records: Iterable[Record], stream: TextIO) -> int:
+    """Tulis record ke stream JSONL, return jumlah record"""
+    return JsonlWriter(stream).write_all(records)
+
+
+# ---------------------------------------------------------------------------
+# Binary dengan string table
+# ---------------------------------------------------------------------------
+
+def _encode_varint(value: int, out: bytearray) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class BinaryWriter:
+    """Writer binary streaming dengan string table"""
+
+    def __init__(self, stream: BinaryIO, max_table_size: int = DEFAULT_MAX_TABLE_SIZE):
+        self.stream = stream
+        self.max_table_size = max_table_size
+        self._table: Dict[str, int] = {}
+        self._buffer = bytearray(MAGIC)
+
+    def write(self, record: Record) -> None:
+        """Tulis satu record (di-buffer, panggil flush/close di akhir)"""
+        body = bytearray()
+        if isinstance(record, (ValidationResult, FrozenValidationResult)):
+            body.append(TAG_VALIDATION)
+            body.append((1 if record.is_valid else 0) | (2 if record.parsed_data is not None else 0)
+                        | (4 if isinstance(record, FrozenValidationResult) else 0))
+            self._list(record.errors, body)
+            self._list(record.suggestions, body)
+            if record.parsed_data is not None:
+                self._dict(record.parsed_data, body)
+        elif isinstance(record, ReferenceData):
+            links = [getattr(record, name) for name in REFERENCE_FIELDS]
+            body.append(TAG_REFERENCES)
+            body.append(sum(1 << index for index, link in enumerate(links) if link is not None))
+            for link in links:
+                if link is not None:
+                    self._dict(link, body)
+        else:
+            raise TypeError(f"Tipe record tidak didukung: {type(record).__name__}")
+
+        # Definisi string baru sudah masuk ke self._buffer sebelum record ini
+        self._buffer += body
+        if len(self._buffer) >= _CHUNK_SIZE:
+            self.flush()
+
+    def write_all(self, records: Iterable[Record]) -> int:
+        """Tulis banyak record lalu flush, return jumlah record"""
+        count = 0
+        for record in records:
+            self.write(record)
+            count += 1
+        self.flush()
+        return count
+
+    def flush(self) -> None:
+        """Tulis buffer ke stream"""
+        if self._buffer:
+            self.stream.write(bytes(self._buffer))
+            self._buffer.clear()
+
+    def close(self) -> None:
+        """Flush sisa buffer (stream tidak ditutup)"""
+        self.flush()
+
+    def __enter__(self) -> 'BinaryWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _string(self, value: str, out: bytearray) -> None:
+        if not isinstance(value, str):
+            raise TypeError(f"Nilai harus string, bukan {type(value).__name__}")
+        index = self._table.get(value)
+        if index is not None:
+            _encode_varint(index + 1, out)
+            return
+
+        encoded = value.encode('utf-8')
+        if len(self._table) < self.max_table_size:
+            self._table[value] = len(self._table)
+            self._buffer.append(TAG_STRING)
+            _encode_varint(len(encoded), self._buffer)
+            self._buffer += encoded
+            _encode_varint(len(self._table), out)
+        else:
+            out.append(0)
+            _encode_varint(len(encoded), out)
+            out += encoded
+
+    def _list(self, values: List[str], out: bytearray) -> None:
+        _encode_varint(len(values), out)
+        for value in values:
+            self._string(value, out)
+
+    def _dict(self, values: Dict[str, str], out: bytearray) -> None:
+        _encode_varint(len(values), out)
+        for key, value in values.items():
+            self._string(key, out)
+            self._string(value, out)
+
+
+class BinaryReader:
+    """Reader binary streaming, iterasi menghasilkan record"""
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self._table: List[str] = []
+        self._data = b''
+        self._pos = 0
+        if self._read(len(MAGIC)) != MAGIC:
+            raise SerializationError("Header binary tidak valid")
+
+    def __iter__(self) -> Iterator[Record]:
+        while True:
+            if self._pos >= len(self._data) and not self._fill():
+                return
+            tag = self._data[self._pos]
+            self._pos += 1
+
+            if tag == TAG_STRING:
+                self._table.append(self._read(self._varint()).decode('utf-8'))
+            elif tag == TAG_VALIDATION:
+                flags = self._byte()
+                errors = self._list()
+                suggestions = self._list()
+                parsed_data = self._dict() if flags & 2 else None
+                result = ValidationResult(bool(flags & 1), errors, suggestions, parsed_data)
+                yield FrozenValidationResult.from_result(result) if flags & 4 else result
+            elif tag == TAG_REFERENCES:
+                flags = self._byte()
+                links = [self._dict() if flags & (1 << index) else None
+                         for index in range(len(REFERENCE_FIELDS))]
+                yield ReferenceData(*links)
+            else:
+                raise SerializationError(f"Tag record tidak dikenal: 0x{tag:02x}")
+
+    def _fill(self) -> bool:
+        """Tambah data dari stream, False jika stream habis"""
+        chunk = self.stream.read(_CHUNK_SIZE)
+        if not chunk:
+            return False
+        self._data = self._data[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _read(self, size: int) -> bytes:
+        while len(self._data) - self._pos < size:
+            if not self._fill():
+                raise SerializationError("Data binary terpotong")
+        data = self._data[self._pos:self._pos + size]
+        self._pos += size
+        return data
+
+    def _byte(self) -> int:
+        if self._pos >= len(self._data) and not self._fill():
+            raise SerializationError("Data binary terpotong")
+        value = self._data[self._pos]
+        self._pos += 1
+        return value
+
+    def _varint(self) -> int:
+        # Jalur cepat: varint satu byte (index string table kecil, panjang list)
+        pos = self._pos
+        if pos < len(self._data):
+            byte = self._data[pos]
+            if byte < 0x80:
+                self._pos = pos + 1
+                return byte
+        result = 0
+        shift = 0
+        while True:
+            byte = self._byte()
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def _string(self) -> str:
+        index = self._varint()
+        if index == 0:
+            return self._read(self._varint()).decode('utf-8')
+        try:
+            return self._table[index - 1]
+        except IndexError:
+            raise SerializationError(f"Index string table tidak valid: {index - 1}") from None
+
+    def _list(self) -> List[str]:
+        return [self._string() for _ in range(self._varint())]
+
+    def _dict(self) -> Dict[str, str]:
+        result = {}
+        for _ in range(self._varint()):
+            key = self._string()
+            result[key] = self._string()
+        return result
+
+
+def write_binary(records: Iterable[Record], stream: BinaryIO,
+                 max_table_size: int = DEFAULT_MAX_TABLE_SIZE) -> int:
+    """Tulis record ke stream binary, return jumlah record"""
+    return BinaryWriter(stream, max_table_size).write_all(records)
+
+
+def read_binary(stream: BinaryIO) -> Iterator[Record]:
+    """Baca record dari stream binary satu per satu"""
+    return iter(BinaryReader(stream))
@@ -0,0 +1,163 @@
+import io
+import json
+import unittest
+from dataclasses import asdict
+from commit_validator import (
+    ReferenceData,
+    ValidationResult,
+    extract_reference_data,
+    validate_commit_title,
+    validate_commit_titles_deduplicated,
+)
+from commit_validator_bench import generate_corpus
+from commit_validator_serialization import (
+    BinaryWriter,
+    SerializationError,
+    read_binary,
+    read_jsonl,
+    write_binary,
+    write_jsonl,
+)
+
+
+def sample_records():
+    """Campuran record dari corpus benchmark plus kasus tepi"""
+    corpus = generate_corpus(seed=3, size=300, body_lines=5)
+    records = [validate_commit_title(title) for title in corpus.titles]
+    records += [extract_reference_data(description) for description in corpus.descriptions]
+    records += [
+        ValidationResult(True, [], [], {}),
+        ValidationResult(False, ["Tipe 'ü😀' tidak valid"], ["baris\nbaru", ""], None),
+        ReferenceData(ticket_link={}, documentation_link=None, testing_link={'name': 'x', 'url': 'x'}),
+        ReferenceData(),
+    ]
+    return records
+
+
+class TestJsonl(unittest.TestCase):
+    """Test writer/reader JSONL"""
+    
+    def test_round_trip(self):
+        """Test round-trip lossless"""
+        records = sample_records()
+        stream = io.StringIO()
+        
+        self.assertEqual(write_jsonl(records, stream), len(records))
+        stream.seek(0)
+        self.assertEqual(list(read_jsonl(stream)), records)
+    
+    def test_frozen_results(self):
+        """Test hasil batch deduplikasi (immutable) dibaca kembali sebagai FrozenValidationResult"""
+        titles = generate_corpus(seed=3, size=50, duplicate_ratio=0.5).titles
+        records = validate_commit_titles_deduplicated(titles).results + sample_records()
+        
+        stream = io.StringIO()
+        write_jsonl(records, stream)
+        stream.seek(0)
+        self.assertEqual(list(read_jsonl(stream)), records)
+        
+        binary = io.BytesIO()
+        write_binary(records, binary)
+        binary.seek(0)
+        result = list(read_binary(binary))
+        self.assertEqual(result, records)
+        self.assertEqual([type(record) for record in result], [type(record) for record in records])
+        with self.assertRaises(TypeError):
+            result[0].parsed_data['type'] = 'fix'
+    
+    def test_one_record_per_line(self):
+        """Test setiap record ada di satu baris"""
+        records = sample_records()
+        stream = io.StringIO()
+        write_jsonl(records, stream)
+        
+        self.assertEqual(len(stream.getvalue().splitlines()), len(records))
+    
+    def test_compatible_with_asdict(self):
+        """Test field JSONL sama dengan output dataclasses.asdict"""
+        records = sample_records()
+        stream = io.StringIO()
+        write_jsonl(records, stream)
+        
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(lines, [asdict(record) for record in records])
+    
+    def test_incomplete_record(self):
+        """Test record dengan field tidak lengkap"""
+        with self.assertRaises(SerializationError):
+            list(read_jsonl(io.StringIO('{"is_valid": true}\n')))
+
+
+class TestBinary(unittest.TestCase):
+    """Test writer/reader binary dengan string table"""
+    
+    def round_trip(self, records, **kwargs):
+        stream = io.BytesIO()
+        write_binary(records, stream, **kwargs)
+        stream.seek(0)
+        return list(read_binary(stream)), stream.getvalue()
+    
+    def test_round_trip(self):
+        """Test round-trip lossless termasuk None vs dict kosong"""
+        records = sample_records()
+        result, _ = self.round_trip(records)
+        
+        self.assertEqual(result, records)
+        self.assertIsNone(result[-2].documentation_link)
+        self.assertEqual(result[-2].ticket_link, {})
+    
+    def test_string_table_shrinks_output(self):
+        """Test pesan yang berulang hanya ditulis sekali"""
+        records = [validate_commit_title("feature: add login (Taiga #DATB-1)")] * 1000
+        _, data = self.round_trip(records)
+        jsonl = io.StringIO()
+        write_jsonl(records, jsonl)
+        
+        self.assertLess(len(data) * 10, len(jsonl.getvalue().encode('utf-8')))
+    
+    def test_inline_strings_when_table_full(self):
+        """Test string ditulis inline setelah string table penuh"""
+        records = sample_records()
+        result, _ = self.round_trip(records, max_table_size=5)
+        
+        self.assertEqual(result, records)
+    
+    def test_large_stream_across_chunks(self):
+        """Test stream lebih besar dari ukuran chunk reader"""
+        records = [ReferenceData(ticket_link={'url': f"https://example.com/{n}" * 5}) for n in range(5000)]
+        result, data = self.round_trip(records)
+        
+        self.assertGreater(len(data), 1 << 17)
+        self.assertEqual(result, records)
+    
+    def test_incremental_writer(self):
+        """Test writer per record dengan context manager"""
+        stream = io.BytesIO()
+        with BinaryWriter(stream) as writer:
+            writer.write(ValidationResult(False, ['a'], ['b']))
+            writer.write(ReferenceData())
+        stream.seek(0)
+        
+        self.assertEqual(list(read_binary(stream)), [ValidationResult(False, ['a'], ['b']), ReferenceData()])
+    
+    def test_invalid_header(self):
+        """Test header yang salah ditolak"""
+        with self.assertRaises(SerializationError):
+            list(read_binary(io.BytesIO(b'JSON{}')))
+    
+    def test_truncated_data(self):
+        """Test data terpotong terdeteksi"""
+        stream = io.BytesIO()
+        write_binary(sample_records()[:10], stream)
+        
+        with self.assertRaises(SerializationError):
+            list(read_binary(io.BytesIO(stream.getvalue()[:-3])))
+    
+    def test_unsupported_record(self):
+        """Test tipe record yang tidak didukung"""
+        with self.assertRaises(TypeError):
+            write_binary(["bukan record"], io.BytesIO())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,23 @@
+"""
+Helper bersama untuk test yang memakai repository git sementara
+"""
+import os
+import subprocess
+
+
+def git(repo, *args):
+    """Jalankan git dengan identitas tetap untuk test"""
+    return subprocess.run(
+        ['git', '-C', repo, '-c', 'user.name=Test', '-c', 'user.email=test@example.com', *args],
+        check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+def commit(repo, message, filename=None):
+    """Buat commit (kosong, atau dengan file baru jika filename diisi), kembalikan sha-nya"""
+    if filename:
+        with open(os.path.join(repo, filename), 'w', encoding='utf-8') as handle:
+            handle.write(f"isi {filename}\ndata 5\ncommit refs/heads/palsu\n")
+        git(repo, 'add', filename)
+    git(repo, 'commit', '--allow-empty', '-q', '-m', message)
+    return git(repo, 'rev-parse', 'HEAD')
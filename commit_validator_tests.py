@@ -1,9 +1,16 @@
+import dataclasses
+import threading
 import unittest
 from commit_validator import (
     CommitTitleValidator, 
     ReferenceExtractor,
     validate_commit_title,
     extract_reference_data,
+    validate_commit_titles_batch,
+    validate_commit_titles_deduplicated,
+    extract_reference_data_batch,
+    get_shared_validator,
+    get_shared_extractor,
     ValidationResult,
     ReferenceData
 )
@@ -319,6 +326,121 @@ class TestIntegration(unittest.TestCase):
         self.assertIsNotNone(ref_result.ticket_link)
 
 
+class TestBatchFunctions(unittest.TestCase):
+    """Test untuk wrapper batch"""
+    
+    def test_validate_titles_batch(self):
+        """Test validasi banyak title sekaligus, urutan hasil dipertahankan"""
+        titles = [
+            "feat: menambahkan fitur login user (Taiga #DATB-10353)",
+            "feature: add login (Taiga #DATB-10353)",
+            "",
+        ]
+        results = validate_commit_titles_batch(titles)
+        
+        self.assertEqual(len(results), 3)
+        self.assertTrue(results[0].is_valid)
+        self.assertFalse(results[1].is_valid)
+        self.assertFalse(results[2].is_valid)
+    
+    def test_validate_titles_batch_matches_single(self):
+        """Test hasil batch sama dengan validasi satu per satu"""
+        titles = ["feat:add login (Taiga #DATB-1)", "fix: memperbaiki bug (Taiga #PROJ-123)"]
+        
+        self.assertEqual(validate_commit_titles_batch(titles),
+                         [validate_commit_title(title) for title in titles])
+    
+    def test_deduplicated_batch(self):
+        """Test title duplikat divalidasi sekali dan hasilnya dipakai bersama"""
+        merge = "Merge branch 'main' into feature"
+        valid = "feat: menambahkan fitur login user (Taiga #DATB-10353)"
+        titles = [merge, valid, merge, "  " + merge + " ", valid, None, ""]
+        batch = validate_commit_titles_deduplicated(titles)
+        
+        self.assertEqual([result.to_result() for result in batch.results],
+                         [validate_commit_title(title) for title in titles])
+        self.assertIs(batch.results[0], batch.results[2])
+        self.assertIs(batch.results[0], batch.results[3])
+        self.assertIs(batch.results[5], batch.results[6])
+        self.assertEqual(batch.total, 7)
+        self.assertEqual(batch.unique, 3)
+        self.assertEqual(batch.duplicates, 4)
+        self.assertAlmostEqual(batch.duplication_ratio, 4 / 7)
+    
+    def test_deduplicated_results_are_immutable(self):
+        """Test hasil yang dipakai bersama tidak bisa diubah lewat salah satu title"""
+        valid = "feat: menambahkan fitur login user (Taiga #DATB-10353)"
+        batch = validate_commit_titles_deduplicated([valid, valid, "add login"])
+        shared = batch.results[0]
+        
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            shared.is_valid = False
+        with self.assertRaises(TypeError):
+            shared.parsed_data['project'] = 'LAIN'
+        with self.assertRaises(AttributeError):
+            batch.results[2].errors.append("error tambahan")
+        
+        copy = shared.to_result()
+        copy.parsed_data['project'] = 'LAIN'
+        self.assertEqual(batch.results[1].parsed_data['project'], 'DATB')
+        self.assertEqual(hash(shared), hash(batch.results[1]))
+        self.assertEqual(dataclasses.asdict(shared)['parsed_data'], validate_commit_title(valid).parsed_data)
+    
+    def test_deduplicated_batch_empty(self):
+        """Test batch kosong"""
+        batch = validate_commit_titles_deduplicated([])
+        
+        self.assertEqual(batch.results, [])
+        self.assertEqual(batch.duplication_ratio, 0.0)
+    
+    def test_extract_references_batch(self):
+        """Test ekstraksi referensi dari banyak deskripsi"""
+        descriptions = [
+            "Ticket Link: [(Taiga #TEST-999)] (https://test.com)",
+            None,
+        ]
+        results = extract_reference_data_batch(descriptions)
+        
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0].ticket_link['project'], 'TEST')
+        self.assertEqual(results[1], ReferenceData())
+
+
+class TestSharedInstances(unittest.TestCase):
+    """Test untuk instance bersama yang thread-safe"""
+    
+    def test_shared_instance_is_singleton(self):
+        """Test instance bersama selalu sama"""
+        self.assertIs(get_shared_validator(), get_shared_validator())
+        self.assertIs(get_shared_extractor(), get_shared_extractor())
+    
+    def test_concurrent_validation(self):
+        """Test validasi paralel dari banyak thread sama dengan hasil sekuensial"""
+        titles = [
+            "feat: menambahkan fitur login user (Taiga #DATB-10353)",
+            "feature: add login (Taiga #DATB-10353)",
+            "feat:add login (Taiga #DATB-10353)",
+            "feat: add (Taiga #DATB-10353)",
+            "add login feature DATB-10353",
+        ] * 200
+        expected = [CommitTitleValidator().validate_title(title) for title in titles]
+        outputs = []
+        
+        def worker():
+            validator = get_shared_validator()
+            outputs.append([validator.validate_title(title) for title in titles])
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len(outputs), 8)
+        for output in outputs:
+            self.assertEqual(output, expected)
+
+
 def run_tests():
     """Function untuk menjalankan semua test"""
     # Create test suite
@@ -329,6 +451,8 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestCommitTitleValidator))
     suite.addTests(loader.loadTestsFromTestCase(TestReferenceExtractor))
     suite.addTests(loader.loadTestsFromTestCase(TestIntegration))
+    suite.addTests(loader.loadTestsFromTestCase(TestBatchFunctions))
+    suite.addTests(loader.loadTestsFromTestCase(TestSharedInstances))
     
     # Run tests dengan verbose output
     runner = unittest.TextTestRunner(verbosity=2)
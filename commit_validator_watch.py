@@ -0,0 +1,275 @@
+"""
+Watch mode untuk repository git
+
+Memantau .git/refs, packed-refs, dan HEAD. Jika ada ref yang bergerak, hanya
+commit yang baru reachable (belum reachable dari tip yang sudah diproses)
+yang divalidasi dengan CommitTitleValidator dan ReferenceExtractor.
+Tip terakhir yang sudah diproses disimpan ke file state, sehingga restart
+melanjutkan dari posisi terakhir tanpa scan ulang history. Tip tersebut juga
+di-pin sebagai ref di bawah refs/commit-validator/seen/, sehingga tetap bisa
+dipakai sebagai batas walaupun branch di-force-push lalu `git gc --prune=now`
+menghapus commit lamanya.
+
+Perubahan dideteksi dengan polling signature stat() (mtime, size, inode)
+dari file ref, sehingga proses git hanya dijalankan ketika ada ref yang
+benar-benar berubah.
+
+Contoh:
+    python commit_validator_watch.py /path/ke/repo
+    python commit_validator_watch.py /path/ke/repo --once --initial-scan
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from commit_validator import (
+    CommitTitleValidator,
+    ReferenceData,
+    ReferenceExtractor,
+    ValidationResult,
+    get_shared_extractor,
+    get_shared_validator,
+)
+from commit_validator_git import LOG_FORMAT, RECORD_SEPARATOR, GitError, parse_log_record, run_git
+
+
+DEFAULT_REF_PATTERNS = ('refs/heads', 'refs/remotes', 'refs/tags')
+
+STATE_FILENAME = 'commit-validator-watch.json'
+
+# Namespace ref untuk tip yang sudah diproses (tidak ikut dipantau)
+SEEN_REF_PREFIX = 'refs/commit-validator/seen/'
+
+@dataclass
+class CommitCheck:
+    """Hasil validasi satu commit"""
+    sha: str
+    title: str
+    title_result: ValidationResult
+    references: ReferenceData
+
+
+class RepositoryWatcher:
+    """Memantau ref repository dan memvalidasi commit baru"""
+
+    def __init__(self, repo: str, state_path: Optional[str] = None,
+                 ref_patterns: Sequence[str] = DEFAULT_REF_PATTERNS,
+                 validator: Optional[CommitTitleValidator] = None,
+                 extractor: Optional[ReferenceExtractor] = None):
+        self.repo = repo
+        self.git_dir = self._git('rev-parse', '--absolute-git-dir').strip()
+        self.state_path = state_path or os.path.join(self.git_dir, STATE_FILENAME)
+        self.ref_patterns = list(ref_patterns)
+        self.validator = validator or get_shared_validator()
+        self.extractor = extractor or get_shared_extractor()
+        self._signature: Optional[Tuple] = None
+
+    def _git(self, *args: str, input_text: Optional[str] = None) -> str:
+        """Jalankan perintah git di repository"""
+        return run_git(self.repo, *args, input_text=input_text)
+
+    def snapshot(self) -> Tuple:
+        """Signature stat() dari HEAD, packed-refs, dan semua file di refs/"""
+        entries = []
+        for name in ('HEAD', 'packed-refs'):
+            entries.append((name, self._stat(os.path.join(self.git_dir, name))))
+
+        pins = os.path.join(self.git_dir, *SEEN_REF_PREFIX.strip('/').split('/')[:2])
+        stack = [os.path.join(self.git_dir, 'refs')]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as iterator:
+                    for entry in iterator:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.path != pins:
+                                stack.append(entry.path)
+                        elif not entry.name.endswith('.lock'):
+                            entries.append((entry.path, self._stat(entry.path)))
+            except FileNotFoundError:
+                continue
+        entries.sort()
+        return tuple(entries)
+
+    @staticmethod
+    def _stat(path: str) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def list_tips(self) -> Dict[str, str]:
+        """Tip commit saat ini untuk semua ref yang dipantau (tag di-peel ke commit)"""
+        output = self._git(
+            'for-each-ref',
+            '--format=%(objectname) %(objecttype) %(*objectname) %(*objecttype) %(refname)',
+            *self.ref_patterns,
+        )
+        tips = {}
+        for line in output.splitlines():
+            sha, kind, peeled, peeled_kind, refname = line.split(' ', 4)
+            if refname.startswith(SEEN_REF_PREFIX):
+                continue
+            if kind == 'commit':
+                tips[refname] = sha
+            elif peeled_kind == 'commit':
+                tips[refname] = peeled
+
+        try:
+            tips['HEAD'] = self._git('rev-parse', '--verify', '-q', 'HEAD^{commit}').strip()
+        except GitError:
+            # Repository kosong atau HEAD menunjuk branch yang belum punya commit
+            pass
+        return tips
+
+    def load_state(self) -> Optional[Dict[str, str]]:
+        """Baca tip yang sudah diproses, None jika belum pernah jalan"""
+        try:
+            with open(self.state_path, encoding='utf-8') as handle:
+                return json.load(handle)['tips']
+        except FileNotFoundError:
+            return None
+
+    def save_state(self, tips: Dict[str, str]) -> None:
+        """Simpan tip yang sudah diproses secara atomik"""
+        temp_path = self.state_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as handle:
+            json.dump({'tips': tips}, handle, indent=2, sort_keys=True)
+        os.replace(temp_path, self.state_path)
+
+    def pin_tips(self, tips: Dict[str, str]) -> None:
+        """Samakan ref di SEEN_REF_PREFIX dengan tip yang sudah diproses (satu transaksi)"""
+        output = self._git('for-each-ref', '--format=%(refname)', SEEN_REF_PREFIX.rstrip('/'))
+        existing = set(output.split())
+        wanted = {SEEN_REF_PREFIX + sha for sha in tips.values()}
+        commands = [f"update {ref} {ref[len(SEEN_REF_PREFIX):]}" for ref in sorted(wanted - existing)]
+        commands += [f"delete {ref}" for ref in sorted(existing - wanted)]
+        if commands:
+            self._git('update-ref', '--stdin', input_text='\n'.join(commands) + '\n')
+
+    def new_commits(self, tips: Dict[str, str], known: Dict[str, str]) -> Iterator[Tuple[str, str]]:
+        """Commit (sha, message) yang reachable dari tips tapi tidak dari known"""
+        new_tips = sorted(set(tips.values()) - set(known.values()))
+        if not new_tips:
+            return iter(())
+
+        excluded = ['^' + sha for sha in self._existing(sorted(set(known.values())))]
+        revisions = '\n'.join(new_tips + excluded) + '\n'
+        output = self._git('log', '--stdin', '--reverse', LOG_FORMAT, input_text=revisions)
+        return self._parse_log(output)
+
+    def _existing(self, shas: List[str]) -> List[str]:
+        """Saring sha yang objeknya masih ada (pin bisa dihapus manual lalu di-gc)"""
+        if not shas:
+            return []
+        output = self._git('cat-file', '--batch-check=%(objectname) %(objecttype)',
+                           input_text='\n'.join(shas) + '\n')
+        return [line.split(' ')[0] for line in output.splitlines() if line.endswith(' commit')]
+
+    @staticmethod
+    def _parse_log(output: str) -> Iterator[Tuple[str, str]]:
+        for record in output.split(RECORD_SEPARATOR)[1:]:
+            yield parse_log_record(record)
+
+    def check_commit(self, sha: str, message: str) -> CommitCheck:
+        """Validasi title dan ekstrak referensi dari satu commit message"""
+        title, _, description = message.partition('\n')
+        return CommitCheck(
+            sha=sha,
+            title=title,
+            title_result=self.validator.validate_title(title),
+            references=self.extractor.extract_references(description),
+        )
+
+    def process_update(self, initial_scan: bool = False) -> List[CommitCheck]:
+        """
+        Validasi commit yang baru reachable sejak update terakhir
+
+        Args:
+            initial_scan: Jika belum ada state, validasi seluruh history
+                (default: hanya catat tip saat ini sebagai titik awal)
+
+        Returns:
+            Daftar CommitCheck untuk commit baru
+        """
+        tips = self.list_tips()
+        known = self.load_state()
+
+        if known is None and not initial_scan:
+            checks = []
+        else:
+            checks = [self.check_commit(sha, message)
+                      for sha, message in self.new_commits(tips, known or {})]
+
+        # Pin dulu sebelum state disimpan, supaya tip di state tidak bisa di-gc
+        self.pin_tips(tips)
+        if tips != known:
+            self.save_state(tips)
+        return checks
+
+    def poll(self, initial_scan: bool = False) -> Optional[List[CommitCheck]]:
+        """Proses update jika signature ref berubah, None jika tidak ada perubahan"""
+        signature = self.snapshot()
+        if signature == self._signature:
+            return None
+        self._signature = signature
+        return self.process_update(initial_scan)
+
+    def watch(self, callback: Callable[[List[CommitCheck]], None], interval: float = 1.0,
+              initial_scan: bool = False, stop: Optional[Callable[[], bool]] = None) -> None:
+        """Loop polling sampai stop() bernilai True (atau selamanya)"""
+        checks = self.poll(initial_scan)
+        while True:
+            if checks:
+                callback(checks)
+            if stop is not None and stop():
+                return
+            time.sleep(interval)
+            checks = self.poll()
+
+
+def print_checks(checks: List[CommitCheck]) -> None:
+    """Tampilkan hasil validasi commit baru"""
+    for check in checks:
+        if check.title_result.is_valid:
+            print(f"✅ {check.sha[:10]} {check.title}")
+            continue
+        print(f"❌ {check.sha[:10]} {check.title}")
+        for error in check.title_result.errors:
+            print(f"   - {error}")
+    sys.stdout.flush()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point CLI watch mode"""
+    parser = argparse.ArgumentParser(description='Validasi commit baru setiap kali ref bergerak')
+    parser.add_argument('repo', nargs='?', default='.', help='Path repository (default: .)')
+    parser.add_argument('--state', help=f'File state (default: <git-dir>/{STATE_FILENAME})')
+    parser.add_argument('--interval', type=float, default=1.0, help='Interval polling dalam detik (default: 1.0)')
+    parser.add_argument('--ref', action='append', dest='refs', help='Prefix ref yang dipantau (bisa berulang)')
+    parser.add_argument('--initial-scan', action='store_true',
+                        help='Validasi seluruh history pada run pertama')
+    parser.add_argument('--once', action='store_true', help='Proses update sekali lalu keluar')
+    args = parser.parse_args(argv)
+
+    watcher = RepositoryWatcher(args.repo, args.state, args.refs or DEFAULT_REF_PATTERNS)
+
+    if args.once:
+        checks = watcher.process_update(args.initial_scan)
+        print_checks(checks)
+        return 1 if any(not check.title_result.is_valid for check in checks) else 0
+
+    try:
+        watcher.watch(print_checks, args.interval, args.initial_scan)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
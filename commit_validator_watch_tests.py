@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+from commit_validator_watch import RepositoryWatcher
+from commit_validator_test_helpers import commit, git
+
+
+class TestRepositoryWatcher(unittest.TestCase):
+    """Test watch mode terhadap repository sementara"""
+    
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.repo = self.tempdir.name
+        git(self.repo, 'init', '-q', '-b', 'main')
+        commit(self.repo, "feat: initial commit repository (Taiga #DATB-1)")
+        commit(self.repo, "fix: memperbaiki bug login (Taiga #DATB-2)")
+    
+    def tearDown(self):
+        self.tempdir.cleanup()
+    
+    def test_first_run_records_tips_without_scanning(self):
+        """Test run pertama hanya mencatat tip saat ini"""
+        watcher = RepositoryWatcher(self.repo)
+        
+        self.assertEqual(watcher.poll(), [])
+        self.assertTrue(os.path.exists(watcher.state_path))
+    
+    def test_initial_scan(self):
+        """Test run pertama dengan initial_scan memvalidasi seluruh history"""
+        checks = RepositoryWatcher(self.repo).poll(initial_scan=True)
+        
+        self.assertEqual([check.title_result.is_valid for check in checks], [True, True])
+    
+    def test_only_new_commits_are_checked(self):
+        """Test hanya commit baru yang divalidasi setelah ref bergerak"""
+        watcher = RepositoryWatcher(self.repo)
+        watcher.poll()
+        
+        first = commit(self.repo, "add login feature")
+        second = commit(self.repo, "feat: menambahkan fitur login (Taiga #DATB-3)\n\n"
+                                   "Ticket Link: [(Taiga #DATB-3)] (https://example.com/3)")
+        checks = watcher.poll()
+        
+        self.assertEqual([check.sha for check in checks], [first, second])
+        self.assertFalse(checks[0].title_result.is_valid)
+        self.assertTrue(checks[1].title_result.is_valid)
+        self.assertEqual(checks[1].references.ticket_link['project'], 'DATB')
+    
+    def test_no_change_no_work(self):
+        """Test poll tanpa perubahan ref tidak memproses apa pun"""
+        watcher = RepositoryWatcher(self.repo)
+        watcher.poll()
+        
+        self.assertIsNone(watcher.poll())
+    
+    def test_restart_resumes_from_state(self):
+        """Test restart melanjutkan dari tip terakhir tanpa scan ulang"""
+        RepositoryWatcher(self.repo).poll()
+        sha = commit(self.repo, "docs: update dokumentasi API (Taiga #DOC-4)")
+        
+        checks = RepositoryWatcher(self.repo).poll()
+        self.assertEqual([check.sha for check in checks], [sha])
+        self.assertEqual(RepositoryWatcher(self.repo).poll(), [])
+    
+    def test_new_branch_and_rewrite(self):
+        """Test branch baru dan history yang di-amend"""
+        watcher = RepositoryWatcher(self.repo)
+        watcher.poll()
+        
+        git(self.repo, 'checkout', '-q', '-b', 'feature')
+        branch_sha = commit(self.repo, "feat: fitur di branch baru (Taiga #DATB-5)")
+        self.assertEqual([check.sha for check in watcher.poll()], [branch_sha])
+        
+        git(self.repo, 'commit', '--amend', '-q', '--allow-empty', '-m', 'feature: amended title')
+        checks = watcher.poll()
+        self.assertEqual(len(checks), 1)
+        self.assertEqual(checks[0].title, 'feature: amended title')
+        self.assertFalse(checks[0].title_result.is_valid)
+    
+    def test_pruned_old_tip(self):
+        """Test tip lama yang sudah di-gc tidak membuat update gagal"""
+        watcher = RepositoryWatcher(self.repo)
+        watcher.poll()
+        
+        git(self.repo, 'commit', '--amend', '-q', '--allow-empty', '-m', 'fix: amended setelah gc (Taiga #DATB-9)')
+        amended = git(self.repo, 'rev-parse', 'HEAD')
+        git(self.repo, 'reflog', 'expire', '--expire=now', '--all')
+        git(self.repo, 'gc', '-q', '--prune=now')
+        checks = watcher.poll()
+        
+        # Hanya commit hasil amend, history lama tidak di-scan ulang
+        self.assertEqual([check.sha for check in checks], [amended])
+        self.assertEqual(git(self.repo, 'for-each-ref', '--format=%(refname)', 'refs/commit-validator'),
+                         f"refs/commit-validator/seen/{amended}")
+    
+    def test_pins_do_not_trigger_updates(self):
+        """Test ref pin tidak dianggap perubahan ref dan tidak ikut jadi tip"""
+        watcher = RepositoryWatcher(self.repo, ref_patterns=['refs'])
+        watcher.poll()
+        
+        self.assertIsNone(watcher.poll())
+        self.assertEqual(set(watcher.list_tips()), {'HEAD', 'refs/heads/main'})
+    
+    def test_packed_refs(self):
+        """Test perubahan lewat packed-refs juga terdeteksi"""
+        watcher = RepositoryWatcher(self.repo)
+        watcher.poll()
+        
+        git(self.repo, 'tag', '-a', 'v1', '-m', 'release')
+        git(self.repo, 'pack-refs', '--all')
+        self.assertEqual(watcher.poll(), [])
+        
+        sha = commit(self.repo, "chore: update dependencies (Taiga #CHR-7)")
+        git(self.repo, 'pack-refs', '--all')
+        self.assertEqual([check.sha for check in watcher.poll()], [sha])
+
+
+if __name__ == '__main__':
+    unittest.main()